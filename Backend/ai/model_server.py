@@ -0,0 +1,243 @@
+# backend/ai/model_server.py
+"""
+Model server: one copy of the summarizer weights shared by N inference processes.
+
+The server loads the configured summarizer once, freezes the heap and then forks
+its workers, so every worker maps the same read-only weight pages (copy-on-write)
+instead of holding its own ~1.6GB copy. Workers are pinned to separate cores and
+pull requests from one shared task queue; API processes connect over a local
+socket (`multiprocessing.connection`) and any of them can dispatch to any worker.
+
+Start it from the `Backend` folder, then point the API at it:
+    export MODEL_SERVER_AUTHKEY=$(python -c "import secrets; print(secrets.token_hex(32))")
+    python -m ai.model_server --address unix:/tmp/echodao-models.sock --workers 4
+    SUMMARIZER_SERVER=unix:/tmp/echodao-models.sock uvicorn app:app --workers 4
+
+`multiprocessing.connection` unpickles every message it receives, so anyone who
+can connect and knows the key can run code in the server: MODEL_SERVER_AUTHKEY
+has no default and must be a secret of at least 16 characters, and the unix
+socket is created readable and writable by its owner only.
+
+Settings: SUMMARIZER_SERVER, MODEL_SERVER_AUTHKEY, MODEL_SERVER_WORKERS (0 = one per
+core), MODEL_SERVER_THREADS (torch threads per worker), MODEL_SERVER_PIN,
+MODEL_SERVER_TIMEOUT (client seconds per request).
+"""
+import argparse
+import gc
+import itertools
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+from multiprocessing.connection import Client, Listener
+from utils.config_loader import MIN_AUTHKEY_LENGTH, get_settings
+
+
+def _check_authkey(authkey: bytes):
+    if not authkey or len(authkey) < MIN_AUTHKEY_LENGTH:
+        raise ValueError(f"MODEL_SERVER_AUTHKEY must be a secret of at least {MIN_AUTHKEY_LENGTH} characters")
+
+
+def parse_address(address: str):
+    """`unix:/path/to.sock` -> path (AF_UNIX); `host:port` -> (host, port) (AF_INET)."""
+    if address.startswith("unix:"):
+        return address[len("unix:"):]
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+# --- Server ---
+
+def _worker_loop(index: int, summarizer, tasks, results, cpu, threads: int):
+    if cpu is not None:
+        os.sched_setaffinity(0, {cpu})
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+    from ai.summarizer import summarize_with
+
+    while True:
+        item = tasks.get()
+        if item is None:
+            return
+        key, text = item
+        try:
+            results.put((key, True, summarize_with(summarizer, text)))
+        except Exception as e:
+            results.put((key, False, f"{type(e).__name__}: {e}"))
+
+
+def serve(address: str, workers: int = 0, threads: int = 1, pin: bool = True, authkey: bytes = None, load=None):
+    """
+    Load the model, fork `workers` inference processes and serve requests until interrupted.
+    `load()` returns the summarizer (default: the configured backend from ai.summarizer).
+    """
+    _check_authkey(authkey)
+    if load is None:
+        from ai.summarizer import get_summarizer as load
+    # No inference in this process before forking: an initialised OpenMP pool does not survive fork
+    summarizer = load()
+    gc.collect()
+    gc.freeze()  # keep GC passes from touching (and un-sharing) the pages of pre-fork objects
+
+    cpus = sorted(os.sched_getaffinity(0))
+    workers = workers or len(cpus)
+    ctx = multiprocessing.get_context("fork")
+    tasks, results = ctx.Queue(), ctx.Queue()
+    processes = []
+    for i in range(workers):
+        cpu = cpus[i % len(cpus)] if pin else None
+        p = ctx.Process(target=_worker_loop, args=(i, summarizer, tasks, results, cpu, threads), daemon=True)
+        p.start()
+        processes.append(p)
+
+    # Threads only after forking
+    from utils.logger import get_logger
+    log = get_logger(__name__)
+    log.info("Model server ready", extra={"address": address, "workers": workers, "pinned": pin})
+
+    pending = {}  # key -> (connection, client task id)
+    pending_lock = threading.Lock()
+    keys = itertools.count()
+
+    def route_results():
+        while True:
+            key, ok, value = results.get()
+            with pending_lock:
+                target = pending.pop(key, None)
+            if target is None:
+                continue
+            conn, task_id = target
+            try:
+                conn.send((task_id, ok, value))
+            except (OSError, EOFError):
+                pass  # client went away
+
+    def serve_connection(conn):
+        try:
+            while True:
+                task_id, text = conn.recv()
+                key = next(keys)
+                with pending_lock:
+                    pending[key] = (conn, task_id)
+                tasks.put((key, text))
+        except (EOFError, OSError):
+            pass
+        finally:
+            with pending_lock:
+                for key in [k for k, (c, _) in pending.items() if c is conn]:
+                    del pending[key]
+            conn.close()
+
+    def watch_workers():
+        for p in processes:
+            p.join()
+            log.error("Model worker exited", extra={"pid": p.pid, "exitcode": p.exitcode})
+        log.error("All model workers exited; shutting down")
+        os._exit(1)
+
+    threading.Thread(target=route_results, daemon=True).start()
+    threading.Thread(target=watch_workers, daemon=True).start()
+
+    umask = os.umask(0o177)  # unix socket: owner-only (0600)
+    try:
+        listener = Listener(parse_address(address), authkey=authkey)
+    finally:
+        os.umask(umask)
+    try:
+        while True:
+            try:
+                conn = listener.accept()
+            except (OSError, EOFError, multiprocessing.AuthenticationError) as e:  # failed handshake
+                log.warning("Rejected model server connection: %s", e)
+                continue
+            threading.Thread(target=serve_connection, args=(conn,), daemon=True).start()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        for _ in processes:
+            tasks.put(None)
+
+
+# --- Client ---
+
+class ModelClient:
+    """Per-thread connections to a model server; requests on one connection are sequential."""
+
+    def __init__(self, address: str, authkey: bytes, timeout: float = 300.0):
+        _check_authkey(authkey)
+        self.address = parse_address(address)
+        self.authkey = authkey
+        self.timeout = timeout
+        self._local = threading.local()
+        self._ids = itertools.count()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = Client(self.address, authkey=self.authkey)
+        return conn
+
+    def summarize(self, text: str) -> str:
+        conn = self._connection()
+        task_id = next(self._ids)
+        try:
+            conn.send((task_id, text))
+            if not conn.poll(self.timeout):
+                raise TimeoutError(f"Model server did not answer within {self.timeout}s")
+            reply_id, ok, value = conn.recv()
+        except BaseException:
+            # Drop the connection so a late reply can't be mistaken for the next request's
+            self._local.conn = None
+            conn.close()
+            raise
+        if reply_id != task_id:
+            raise RuntimeError("Model server reply out of order")
+        if not ok:
+            raise RuntimeError(f"Model server error: {value}")
+        return value
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> ModelClient:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                settings = get_settings()
+                _client = ModelClient(settings.summarizer_server, settings.model_server_authkey.encode(),
+                                      settings.model_server_timeout)
+    return _client
+
+
+def main(argv=None):
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Serve the summarizer from forked, pinned worker processes.")
+    parser.add_argument("--address", default=settings.summarizer_server or "unix:/tmp/echodao-models.sock")
+    parser.add_argument("--workers", type=int, default=settings.model_server_workers)
+    parser.add_argument("--threads", type=int, default=settings.model_server_threads)
+    parser.add_argument("--no-pin", action="store_true", help="do not pin workers to cores")
+    args = parser.parse_args(argv)
+    try:
+        _check_authkey(settings.model_server_authkey.encode())
+    except ValueError as e:
+        sys.exit(str(e))
+
+    # SIGTERM unwinds like Ctrl-C: workers are told to stop and daemon processes are reaped
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    address = parse_address(args.address)
+    if isinstance(address, str) and os.path.exists(address):
+        os.unlink(address)  # stale socket from a previous run
+    serve(args.address, args.workers, args.threads, pin=settings.model_server_pin and not args.no_pin,
+          authkey=settings.model_server_authkey.encode())
+
+
+if __name__ == "__main__":
+    main()
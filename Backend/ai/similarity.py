@@ -0,0 +1,121 @@
+# backend/ai/similarity.py
+"""
+Near-duplicate detection with MinHash signatures and an LSH index.
+
+A text is reduced to the set of its 3-word shingles and summarised by a fixed
+MinHash signature; the fraction of equal signature slots estimates the Jaccard
+similarity of two shingle sets. `MinHashIndex` buckets signatures by bands, so
+a query only compares against the few entries sharing a band with it instead
+of scanning every stored text. Long texts are summarised by the MAX_SHINGLES
+shingles with the smallest hashes, a uniform sample that two near-copies share,
+so a signature costs the same for a page and for a book.
+"""
+import hashlib
+import heapq
+import random
+import re
+import threading
+from array import array
+from collections import OrderedDict
+
+NUM_PERM = 64
+BANDS = 16  # 4 rows per band: pairs above ~0.5 Jaccard almost always share a bucket
+SHINGLE_WORDS = 3
+MAX_SHINGLES = 2048
+
+_MERSENNE_PRIME = (1 << 61) - 1
+# One universal hash (a * x + b) mod p per slot, the usual MinHash stand-in for a
+# random permutation. Fixed seed: signatures are persisted and must be comparable
+# across processes
+_rng = random.Random(0x5EED)
+_HASHES = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(_MERSENNE_PRIME)) for _ in range(NUM_PERM)]
+_WORD = re.compile(r"\w+")
+
+
+def _shingle_hashes(text: str) -> set:
+    words = _WORD.findall(text.lower())
+    if len(words) < SHINGLE_WORDS:
+        shingles = {" ".join(words)} if words else set()
+    else:
+        shingles = {" ".join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)}
+    hashes = {int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little") for s in shingles}
+    return hashes if len(hashes) <= MAX_SHINGLES else set(heapq.nsmallest(MAX_SHINGLES, hashes))
+
+
+def signature(text: str) -> array:
+    """MinHash signature of `text` (NUM_PERM unsigned 64-bit values), empty for texts without words."""
+    hashes = _shingle_hashes(text)
+    if not hashes:
+        return array("Q")
+    p = _MERSENNE_PRIME
+    return array("Q", (min([(a * x + b) % p for x in hashes]) for a, b in _HASHES))
+
+
+def similarity(a: array, b: array) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    if not a or not b:
+        return 0.0
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+class MinHashIndex:
+    """
+    Thread-safe LSH index of signatures keyed by caller ids. Holds at most
+    `capacity` entries; the oldest are evicted first.
+    """
+
+    def __init__(self, capacity: int = 100_000, bands: int = BANDS):
+        self.capacity = capacity
+        self.bands = bands
+        self.rows = NUM_PERM // bands
+        self._signatures = OrderedDict()
+        self._buckets = [{} for _ in range(bands)]
+        self._lock = threading.Lock()
+
+    def _band_keys(self, sig: array):
+        r = self.rows
+        return [sig[i * r:(i + 1) * r].tobytes() for i in range(self.bands)]
+
+    def add(self, key, sig: array):
+        if not sig:
+            return
+        with self._lock:
+            if key in self._signatures:
+                self._remove(key)
+            self._signatures[key] = sig
+            for band, band_key in zip(self._buckets, self._band_keys(sig)):
+                band.setdefault(band_key, set()).add(key)
+            while len(self._signatures) > self.capacity:
+                self._remove(next(iter(self._signatures)))
+
+    def _remove(self, key):
+        sig = self._signatures.pop(key)
+        for band, band_key in zip(self._buckets, self._band_keys(sig)):
+            bucket = band.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del band[band_key]
+
+    def remove(self, key):
+        with self._lock:
+            if key in self._signatures:
+                self._remove(key)
+
+    def query(self, sig: array, threshold: float = 0.8, limit: int = 5) -> list:
+        """[(key, similarity)] of stored entries at or above `threshold`, most similar first."""
+        if not sig:
+            return []
+        with self._lock:
+            candidates = set()
+            for band, band_key in zip(self._buckets, self._band_keys(sig)):
+                candidates.update(band.get(band_key, ()))
+            scored = [(key, similarity(sig, self._signatures[key])) for key in candidates]
+        matches = sorted((m for m in scored if m[1] >= threshold), key=lambda m: -m[1])
+        return matches[:limit]
+
+    def __contains__(self, key) -> bool:
+        return key in self._signatures
+
+    def __len__(self) -> int:
+        return len(self._signatures)
@@ -1,13 +1,102 @@
-from transformers import pipeline
+import threading
+from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
+from utils.config_loader import get_settings
+from utils.profiling import span
+
+# Inference backends, selected with SUMMARIZER_BACKEND:
+#   pipeline  - full-precision model through a default transformers pipeline (original behaviour)
+#   quantized - same model with dynamic int8 quantization of its Linear layers (torch, CPU)
+#   onnx      - ONNX Runtime graph exported with optimum (cached in SUMMARIZER_ONNX_DIR)
+#   distilled - smaller distilled BART checkpoint
+DEFAULT_MODELS = {
+    "pipeline": "facebook/bart-large-cnn",
+    "quantized": "facebook/bart-large-cnn",
+    "onnx": "facebook/bart-large-cnn",
+    "distilled": "sshleifer/distilbart-cnn-12-6",
+}
+
+PROMPT = "Summarize this text WITHOUT changing the sentence order: "
+MAX_INPUT_CHARS = 3000
+
+
+def _load_pipeline(model_name: str, **_):
+    return pipeline("summarization", model=model_name)
+
+
+def _load_quantized(model_name: str, **_):
+    import torch
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+    model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return pipeline("summarization", model=model, tokenizer=AutoTokenizer.from_pretrained(model_name))
+
+
+def _load_onnx(model_name: str, onnx_dir: str = None, **_):
+    import os
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    export_dir = os.path.join(onnx_dir, model_name.replace("/", "--")) if onnx_dir else None
+    if export_dir and os.path.isdir(export_dir):
+        model = ORTModelForSeq2SeqLM.from_pretrained(export_dir)
+        tokenizer = AutoTokenizer.from_pretrained(export_dir)
+    else:
+        # One-off export; later starts load the saved graph
+        model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True)
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        if export_dir:
+            model.save_pretrained(export_dir)
+            tokenizer.save_pretrained(export_dir)
+    return pipeline("summarization", model=model, tokenizer=tokenizer)
+
+
+LOADERS = {
+    "pipeline": _load_pipeline,
+    "quantized": _load_quantized,
+    "onnx": _load_onnx,
+    "distilled": _load_pipeline,
+}
+
+
+def load_summarizer(backend: str = "pipeline", model_name: str = None, threads: int = 0, onnx_dir: str = None):
+    """Build the summarization pipeline for `backend` (see LOADERS)."""
+    if backend not in LOADERS:
+        raise ValueError(f"Unknown summarizer backend '{backend}', expected one of {sorted(LOADERS)}")
+    if threads:
+        import torch
+        torch.set_num_threads(threads)
+    return LOADERS[backend](model_name or DEFAULT_MODELS[backend], onnx_dir=onnx_dir)
+
+
+_summarizer = None
+_load_lock = threading.Lock()
+
+
+def get_summarizer():
+    """The configured summarizer, loaded on first use."""
+    global _summarizer
+    if _summarizer is None:
+        with _load_lock:
+            if _summarizer is None:
+                settings = get_settings()
+                _summarizer = load_summarizer(settings.summarizer_backend, settings.summarizer_model or None,
+                                              settings.summarizer_threads, settings.summarizer_onnx_dir)
+    return _summarizer
+
+
+def summarize_with(summarizer, content) -> str:
+    text = content.decode("utf-8") if isinstance(content, bytes) else content
+    text_to_summarize = f"{PROMPT}{text}"
+    summary = summarizer(text_to_summarize[:MAX_INPUT_CHARS], max_length=120, min_length=40, do_sample=False)
+    return summary[0]['summary_text']
 
-# lightweight summarization model
-summarizer = pipeline("summarization", model="facebook/bart-large-cnn")
 
 def summarize_report(content: str) -> str:
     """
-    Summarizes long textual report content.
+    Summarizes long textual report content, on the model server when SUMMARIZER_SERVER is set.
     """
-    text = content.decode("utf-8") if isinstance(content, bytes) else content
-    text_to_summarize = f"Summarize this text WITHOUT changing the sentence order: {text}"
-    summary = summarizer(text_to_summarize[:3000], max_length=120, min_length=40, do_sample=False)
-    return summary[0]['summary_text']
\ No newline at end of file
+    if get_settings().summarizer_server:
+        from ai.model_server import get_client
+        text = content.decode("utf-8") if isinstance(content, bytes) else content
+        with span("model", "summarizer_server"):
+            return get_client().summarize(text[:MAX_INPUT_CHARS])
+    summarizer = get_summarizer()
+    with span("model", "summarizer"):
+        return summarize_with(summarizer, content)
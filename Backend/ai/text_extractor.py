@@ -0,0 +1,231 @@
+# backend/ai/text_extractor.py
+"""
+Text extraction for uploaded reports.
+
+Plain-text files are decoded in-process. PDFs (text layer via `pypdf`) and images
+(OCR via `pytesseract`, which needs a local tesseract install) are processed in a
+bounded process pool so CPU-heavy parsing never holds the GIL or the event loop.
+PDFs are split into page chunks extracted in parallel and consumed in order,
+so a large document stops being read once `max_chars` of text are collected.
+Scanned PDF pages (no text layer) are OCR'd when `pypdfium2` and `pytesseract`
+are installed.
+
+Settings: EXTRACT_WORKERS, EXTRACT_MAX_PENDING, EXTRACT_PAGES_PER_TASK,
+EXTRACT_MAX_CHARS, OCR_LANG.
+"""
+import asyncio
+import codecs
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import aclosing
+from utils.config_loader import get_settings
+from utils.metrics import EXTRACT_PAGES, EXTRACT_BYTES, EXTRACT_INFLIGHT, stage_timer
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # optional: PDF support
+    PdfReader = None
+
+try:
+    import pytesseract
+    from PIL import Image
+except ImportError:  # optional: OCR support
+    pytesseract = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # optional: OCR of scanned PDF pages
+    pdfium = None
+
+TEXT_EXTENSIONS = (".txt", ".csv", ".md", ".json")
+IMAGE_MAGIC = (b"\x89PNG", b"\xff\xd8\xff", b"GIF8", b"II*\x00", b"MM\x00*", b"BM")
+MIN_PAGE_TEXT = 16       # pages with less text than this are treated as scanned
+OCR_RENDER_SCALE = 200 / 72  # render scanned pages at 200 dpi
+
+
+class ExtractionError(Exception):
+    """The file type is unsupported or the optional extractor it needs is not installed."""
+
+
+def detect_kind(content: bytes, filename: str = "") -> str:
+    """Return "pdf", "image", "text" or "binary" from magic bytes, extension and encoding."""
+    head = content[:16]
+    if head.startswith(b"%PDF"):
+        return "pdf"
+    if head.startswith(IMAGE_MAGIC) or (head[:4] == b"RIFF" and head[8:12] == b"WEBP"):
+        return "image"
+    if (filename or "").lower().endswith(TEXT_EXTENSIONS):
+        return "text"
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(content[:65536], final=False)
+        return "text"
+    except UnicodeDecodeError:
+        return "binary"
+
+
+# --- Worker side (runs in the pool processes) ---
+
+def _pdf_page_count(path: str) -> int:
+    return len(PdfReader(path).pages)
+
+
+def _pdf_pages(path: str, start: int, stop: int, lang: str) -> list:
+    """[(text, method)] for pages [start, stop); method is "text" or "ocr"."""
+    reader = PdfReader(path)
+    doc = pdfium.PdfDocument(path) if pdfium is not None and pytesseract is not None else None
+    pages = []
+    for i in range(start, stop):
+        text = reader.pages[i].extract_text() or ""
+        if len(text.strip()) < MIN_PAGE_TEXT and doc is not None:
+            image = doc[i].render(scale=OCR_RENDER_SCALE).to_pil()
+            pages.append((pytesseract.image_to_string(image, lang=lang), "ocr"))
+        else:
+            pages.append((text, "text"))
+    return pages
+
+
+def _ocr_image(path: str, lang: str) -> str:
+    with Image.open(path) as image:
+        return pytesseract.image_to_string(image, lang=lang)
+
+
+# --- Parent side ---
+
+_pool = None
+_slots = None
+_pool_lock = threading.Lock()
+
+
+def _get_slots():
+    global _slots
+    with _pool_lock:
+        if _slots is None:
+            # Created once: tasks from before a pool restart still hold or wait on it
+            _slots = asyncio.Semaphore(get_settings().extract_max_pending)
+        return _slots
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            settings = get_settings()
+            # spawn: forking a process that runs watcher/logging threads is unsafe
+            _pool = ProcessPoolExecutor(max_workers=settings.extract_workers,
+                                        mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _discard(pool):
+    """Drop `pool` if it is still the current one; a newer pool started after it broke is kept."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run(fn, *args):
+    """Run `fn(*args)` in the pool; callers wait for a slot once `extract_max_pending` tasks are queued."""
+    async with _get_slots():
+        # Taken inside the slot: a task that waited through a pool restart gets the new pool
+        pool = _get_pool()
+        EXTRACT_INFLIGHT.inc()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM on a hostile document): start a fresh pool next time
+            _discard(pool)
+            raise
+        finally:
+            EXTRACT_INFLIGHT.dec()
+
+
+def shutdown():
+    """Stop the worker processes (called on application shutdown)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+async def iter_pdf_pages(path: str):
+    """
+    Yield the text of each page of the PDF at `path`, in order. Chunks of
+    EXTRACT_PAGES_PER_TASK pages are extracted in parallel, at most one chunk per
+    worker ahead of the consumer; closing the generator cancels what is left.
+    """
+    settings = get_settings()
+    count = await _run(_pdf_page_count, path)
+    step = settings.extract_pages_per_task
+    ranges = iter([(start, min(start + step, count)) for start in range(0, count, step)])
+    pending = deque()
+
+    def submit_next():
+        chunk = next(ranges, None)
+        if chunk is not None:
+            pending.append(asyncio.ensure_future(_run(_pdf_pages, path, chunk[0], chunk[1], settings.ocr_lang)))
+
+    for _ in range(settings.extract_workers):
+        submit_next()
+    try:
+        while pending:
+            pages = await pending.popleft()
+            submit_next()
+            for text, method in pages:
+                EXTRACT_PAGES.inc(method=method)
+                yield text
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def extract_text(content: bytes, filename: str = "", max_chars: int = None) -> str:
+    """
+    Extract up to `max_chars` (default EXTRACT_MAX_CHARS) of text from an uploaded file.
+    Raises ExtractionError for unsupported types or missing optional extractors.
+    """
+    settings = get_settings()
+    max_chars = max_chars or settings.extract_max_chars
+    kind = detect_kind(content, filename)
+    EXTRACT_BYTES.inc(len(content), kind=kind)
+
+    if kind == "text":
+        with stage_timer("extract_text"):
+            return content[:max_chars * 4].decode("utf-8", errors="replace")[:max_chars]
+    if kind == "binary":
+        raise ExtractionError(f"Unsupported file type: {filename or 'unknown'}")
+    if kind == "pdf" and PdfReader is None:
+        raise ExtractionError("PDF support requires the 'pypdf' package")
+    if kind == "image" and pytesseract is None:
+        raise ExtractionError("Image OCR requires the 'pytesseract' and 'Pillow' packages")
+
+    # Workers read the document from disk instead of receiving a pickled copy per task
+    fd, path = tempfile.mkstemp(suffix="." + kind)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+
+        if kind == "image":
+            with stage_timer("extract_ocr"):
+                text = await _run(_ocr_image, path, settings.ocr_lang)
+            EXTRACT_PAGES.inc(method="ocr")
+            return text[:max_chars]
+
+        parts, size = [], 0
+        with stage_timer("extract_pdf"):
+            async with aclosing(iter_pdf_pages(path)) as pages:
+                async for text in pages:
+                    parts.append(text)
+                    size += len(text) + 1
+                    if size >= max_chars:
+                        break
+        return "\n".join(parts)[:max_chars]
+    finally:
+        os.unlink(path)
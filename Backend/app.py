@@ -1,11 +1,52 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from routes import report_routes, proposal_routes, fund_routes
+from fastapi.responses import PlainTextResponse
+from utils.config_loader import get_settings
+
+# Fail fast on missing or malformed configuration, before any module connects to the node
+settings = get_settings()
+
+from routes import report_routes, proposal_routes, fund_routes, feed_routes, export_routes, stats_routes, admin_routes
+from ai import text_extractor
+from blockchain.chain_watcher import chain_watcher, WATCHER_ENABLED
+from blockchain.chain_state import chain_state
+from blockchain.stats import stats
+from blockchain.vote_indexer import vote_indexer
+from utils.metrics import REGISTRY, MetricsMiddleware
+from utils.profiling import ProfilingMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Local stores live under DATA_DIR; nothing touches the disk at import
+    os.makedirs(settings.data_dir, exist_ok=True)
+    report_routes.open_store()
+    proposal_routes.open_store()
+    vote_indexer.open()
+    stats.open()
+    # Background chain follower feeding the treasury snapshot and other listeners
+    feed_routes.feed.bind(asyncio.get_running_loop())
+    if WATCHER_ENABLED:
+        # Resume from the persisted chain state instead of re-reading history
+        start_block, block_hashes = chain_state.load()
+        chain_watcher.start(start_block, block_hashes)
+        vote_indexer.start()
+    yield
+    chain_watcher.stop()
+    if WATCHER_ENABLED:
+        chain_state.save()
+    text_extractor.shutdown()
+    report_routes.close_store()
+
 
 app = FastAPI(
     title="EchoDAO Backend",
     description="AI-powered and blockchain-integrated platform for transparent reporting.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -15,12 +56,24 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(ProfilingMiddleware)
 
 # Register routes
 app.include_router(report_routes.router, prefix="/reports", tags=["Reports"])
 app.include_router(proposal_routes.router, prefix="/proposals", tags=["Proposals"])
 app.include_router(fund_routes.router, prefix="/funds", tags=["Funds"])
+app.include_router(feed_routes.router, prefix="/feed", tags=["Feed"])
+app.include_router(export_routes.router, prefix="/export", tags=["Export"])
+app.include_router(stats_routes.router, prefix="/stats", tags=["Stats"])
+app.include_router(admin_routes.router, prefix="/admin", tags=["Admin"], include_in_schema=False)
 
 @app.get("/")
 def root():
     return {"message": "Welcome to EchoDAO Backend 🚀"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus text exposition of request, JSON-RPC and pipeline-stage metrics."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
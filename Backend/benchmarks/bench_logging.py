@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Throughput of a simulated request's log output: the old synchronous `print()`
+pattern (per-step lines, a dumped receipt and a traceback on failed reads)
+versus the queue-backed structured logger at INFO level.
+
+Output goes through an OS pipe drained by a reader thread; `--sink-delay` adds
+a pause per chunk read to emulate a slow console/log shipper.
+
+Run from the `Backend` folder:
+    python -m benchmarks.bench_logging --threads 8 --requests 2000 --sink-delay 0.0005
+"""
+import argparse
+import io
+import os
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+RECEIPT = {
+    "transactionHash": "0x" + "ab" * 32, "blockNumber": 123456, "gasUsed": 84211, "status": 1,
+    "logs": [{"address": "0x" + "da" * 20, "topics": ["0x" + "11" * 32], "data": "0x" + "00" * 96, "logIndex": i} for i in range(4)],
+}
+
+
+def _slow_pipe(delay: float):
+    """Return a writable text stream backed by a pipe whose reader sleeps `delay` per read."""
+    read_fd, write_fd = os.pipe()
+
+    def drain():
+        with os.fdopen(read_fd, "rb", buffering=0) as r:
+            while r.read(4096):
+                if delay:
+                    time.sleep(delay)
+
+    threading.Thread(target=drain, daemon=True).start()
+    return io.TextIOWrapper(os.fdopen(write_fd, "wb", buffering=0), write_through=True)
+
+
+def request_with_print(i: int, out):
+    print(f"Creating proposal → Proposal {i}", file=out)
+    print("Recipient: 0x" + "12" * 20, file=out)
+    print("Amount (ETH): 0.5", file=out)
+    print("✅ Gas estimate:", 210000, file=out)
+    print("🚀 Sent! TX hash:", RECEIPT["transactionHash"], file=out)
+    print("Raw logs:", RECEIPT["logs"], file=out)
+    print("⛏️ Mined. Status:", RECEIPT["status"], file=out)
+    print("📜 ProposalCreated event logs:", RECEIPT, file=out)
+    try:
+        raise TimeoutError("read timed out")
+    except Exception as e:
+        print(f"❌ Failed to get proposal status: {e}", file=out)
+        traceback.print_exc(file=out)
+
+
+def request_with_logger(i: int, log):
+    log.info("Creating proposal", extra={"recipient": "0x" + "12" * 20, "amount_eth": 0.5})
+    log.debug("Proposal description: %s", f"Proposal {i}")
+    log.debug("createProposal gas estimate: %d", 210000)
+    log.info("createProposal sent", extra={"tx_hash": RECEIPT["transactionHash"]})
+    log.debug("Raw logs: %s", RECEIPT["logs"])
+    log.info("createProposal mined", extra={"tx_hash": RECEIPT["transactionHash"], "status": RECEIPT["status"]})
+    try:
+        raise TimeoutError("read timed out")
+    except Exception as e:
+        log.warning("Failed to get proposal status: %s", e, exc_info=True, extra={"sample_key": "get_proposal_status"})
+
+
+def measure(fn, threads: int, requests: int) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(fn, range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--sink-delay", type=float, default=0.0005, help="seconds the reader sleeps per 4 KiB chunk")
+    args = parser.parse_args(argv)
+
+    out = _slow_pipe(args.sink_delay)
+    before = measure(lambda i: request_with_print(i, out), args.threads, args.requests)
+
+    # Route the structured logger's listener to its own slow pipe
+    import logging
+    from utils import logger as logger_mod
+    real_stderr = sys.stderr
+    sys.stderr = _slow_pipe(args.sink_delay)
+    try:
+        logger_mod.setup_logging(level="INFO", fmt="json")
+    finally:
+        sys.stderr = real_stderr
+    log = logger_mod.get_logger("bench")
+    after = measure(lambda i: request_with_logger(i, log), args.threads, args.requests)
+    logging.shutdown()
+
+    print(f"print():           {before:10.0f} req/s")
+    print(f"structured logger: {after:10.0f} req/s  ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
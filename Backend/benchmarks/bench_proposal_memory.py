@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Memory held by N proposals in each in-memory representation:
+
+- dict:   the previous `get_proposal()` dict (Decimal value, raw callData, fresh target string)
+- record: a list of ProposalRecord objects
+- table:  one ProposalTable (column arrays)
+
+Measured with tracemalloc as the net allocation while the collection is alive.
+
+Run from the `Backend` folder:
+    python -m benchmarks.bench_proposal_memory --proposals 100000
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from decimal import Decimal
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from blockchain.proposal_record import ProposalRecord, ProposalTable, WEI_PER_ETHER
+
+TREASURY = "0x7E7e7E7e7e7E7e7e7E7e7e7E7e7E7E7e7e7e7e7E"
+RELEASE_CALLDATA = bytes.fromhex("a9059cbb" + "00" * 12 + "12" * 20 + "00" * 24 + "0de0b6b3a7640000")
+
+
+def chain_rows(n: int):
+    """Tuples shaped like `proposals(id).call()`, with a new target string per row as web3 returns."""
+    for pid in range(n):
+        yield pid, (
+            "".join(TREASURY), pid * 10 ** 16, RELEASE_CALLDATA, f"Proposal {pid}: fund community programme",
+            10 + pid, 1010 + pid, pid % 7, pid % 3, pid % 5 == 0,
+        )
+
+
+def as_dicts(n):
+    return [{
+        "target": p[0], "value": Decimal(p[1]) / WEI_PER_ETHER, "callData": p[2], "description": p[3],
+        "blockStart": p[4], "blockEnd": p[5], "yesVotes": p[6], "noVotes": p[7], "executed": p[8],
+    } for _, p in chain_rows(n)]
+
+
+def as_records(n):
+    return [ProposalRecord.from_chain(pid, p) for pid, p in chain_rows(n)]
+
+
+def as_table(n):
+    table = ProposalTable()
+    for pid, p in chain_rows(n):
+        table.put(ProposalRecord.from_chain(pid, p))
+    return table
+
+
+def measure(build, n: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    data = build(n)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return current
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--proposals", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    baseline = None
+    print(f"{'layout':<8} {'MiB':>8} {'bytes/proposal':>15} {'vs dict':>8}")
+    for name, build in (("dict", as_dicts), ("record", as_records), ("table", as_table)):
+        size = measure(build, args.proposals)
+        baseline = baseline or size
+        print(f"{name:<8} {size / 2 ** 20:8.1f} {size / args.proposals:15.0f} {size / baseline:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Compare summarizer inference backends (see ai/summarizer.py) on CPU.
+
+Each backend runs in its own subprocess so load time and peak RSS are isolated.
+Reported per backend: load time, p50/p95 latency per document, sequential and
+batched throughput, peak RSS, ROUGE-L F1 against the reference summaries and,
+when `pipeline` is included, ROUGE-L agreement with the full-precision pipeline.
+
+Run from the `Backend` folder:
+    python -m benchmarks.bench_summarizer --backends pipeline,quantized,onnx,distilled --threads 4
+    python -m benchmarks.bench_summarizer --backends pipeline,quantized --max-quality-drop 0.05
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+DEFAULT_REFERENCES = os.path.join(os.path.dirname(__file__), "data", "summaries.json")
+
+
+def rouge_l(candidate: str, reference: str) -> float:
+    """ROUGE-L F1 on lower-cased whitespace tokens."""
+    a, b = candidate.lower().split(), reference.lower().split()
+    if not a or not b:
+        return 0.0
+    prev = [0] * (len(b) + 1)
+    for x in a:
+        cur = [0]
+        for j, y in enumerate(b):
+            cur.append(prev[j] + 1 if x == y else max(prev[j + 1], cur[j]))
+        prev = cur
+    lcs = prev[-1]
+    if lcs == 0:
+        return 0.0
+    precision, recall = lcs / len(a), lcs / len(b)
+    return 2 * precision * recall / (precision + recall)
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def worker(args):
+    """Runs in the subprocess: load one backend, measure it and print one JSON line."""
+    from ai.summarizer import load_summarizer, summarize_with, PROMPT, MAX_INPUT_CHARS
+
+    with open(args.references) as f:
+        cases = json.load(f)
+    docs = [c["document"] for c in cases]
+
+    start = time.perf_counter()
+    summarizer = load_summarizer(args.worker, args.model, args.threads, args.onnx_dir)
+    load_s = time.perf_counter() - start
+    summarize_with(summarizer, docs[0])  # warm-up
+
+    latencies, outputs = [], []
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        outputs = []
+        for doc in docs:
+            t = time.perf_counter()
+            outputs.append(summarize_with(summarizer, doc))
+            latencies.append(time.perf_counter() - t)
+    sequential_s = time.perf_counter() - started
+
+    inputs = [f"{PROMPT}{doc}"[:MAX_INPUT_CHARS] for doc in docs] * args.repeat
+    started = time.perf_counter()
+    summarizer(inputs, max_length=120, min_length=40, do_sample=False, batch_size=args.batch_size)
+    batched_s = time.perf_counter() - started
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({
+        "backend": args.worker,
+        "load_s": round(load_s, 2),
+        "p50_ms": round(_percentile(latencies, 0.5) * 1000, 1),
+        "p95_ms": round(_percentile(latencies, 0.95) * 1000, 1),
+        "docs_per_s": round(len(latencies) / sequential_s, 2),
+        "batched_docs_per_s": round(len(inputs) / batched_s, 2),
+        "peak_rss_mb": round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1),
+        "rouge_l": round(sum(rouge_l(o, c["reference"]) for o, c in zip(outputs, cases)) / len(cases), 4),
+        "outputs": outputs,
+    }))
+
+
+def run_backend(backend: str, args) -> dict:
+    cmd = [sys.executable, "-m", "benchmarks.bench_summarizer", "--worker", backend,
+           "--references", args.references, "--repeat", str(args.repeat), "--threads", str(args.threads),
+           "--batch-size", str(args.batch_size), "--onnx-dir", args.onnx_dir]
+    if args.model:
+        cmd += ["--model", args.model]
+    proc = subprocess.run(cmd, cwd=BACKEND_DIR, capture_output=True, text=True)
+    if proc.returncode != 0:
+        return {"backend": backend, "error": proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "failed"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", default="pipeline,quantized,onnx,distilled")
+    parser.add_argument("--model", help="override the model of every backend")
+    parser.add_argument("--references", default=DEFAULT_REFERENCES, help="JSON list of {document, reference}")
+    parser.add_argument("--repeat", type=int, default=3, help="passes over the reference documents")
+    parser.add_argument("--threads", type=int, default=0, help="torch intra-op threads (0 = default)")
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--onnx-dir", default=os.path.join(BACKEND_DIR, "models", "onnx"))
+    parser.add_argument("--max-quality-drop", type=float, default=None,
+                        help="fail if a backend's ROUGE-L is this much below the pipeline backend's")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        worker(args)
+        return 0
+
+    results = [run_backend(b.strip(), args) for b in args.backends.split(",") if b.strip()]
+    baseline = next((r for r in results if r["backend"] == "pipeline" and "error" not in r), None)
+    for r in results:
+        if baseline and "error" not in r:
+            pairs = zip(r["outputs"], baseline["outputs"])
+            r["agreement"] = round(sum(rouge_l(a, b) for a, b in pairs) / len(baseline["outputs"]), 4)
+
+    cols = ["backend", "load_s", "p50_ms", "p95_ms", "docs_per_s", "batched_docs_per_s", "peak_rss_mb", "rouge_l", "agreement"]
+    print("  ".join(f"{c:<18}" for c in cols))
+    for r in results:
+        if "error" in r:
+            print(f"{r['backend']:<18}  error: {r['error']}")
+        else:
+            print("  ".join(f"{str(r.get(c, '-')):<18}" for c in cols))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([{k: v for k, v in r.items() if k != "outputs"} for r in results], f, indent=2)
+
+    if args.max_quality_drop is not None and baseline:
+        worse = [r["backend"] for r in results
+                 if "error" not in r and baseline["rouge_l"] - r["rouge_l"] > args.max_quality_drop]
+        if worse:
+            print(f"Quality drop above {args.max_quality_drop}: {', '.join(worse)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Offline load benchmark for the hot API paths.
+
+Boots `app.py` in-process against a stub JSON-RPC node, a fake IPFS endpoint
+and a stub summarizer, drives concurrent load per scenario and reports
+p50/p95/p99 latency, throughput, JSON-RPC calls per request and peak RSS.
+
+Run from the `Backend` folder:
+    python -m benchmarks.run_bench --proposals 200 --latency 0.005 --concurrency 16 --requests 400
+    python -m benchmarks.run_bench --json bench.json
+    python -m benchmarks.run_bench --compare bench.json --max-regression 0.25
+"""
+import argparse
+import json
+import os
+import resource
+import socket
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from benchmarks.stubs import RPCStub, IPFSStub, install_stub_summarizer, DAO_ADDRESS, TREASURY_ADDRESS
+
+# Well-known throwaway key (never funded); the stub node does not check signatures
+BENCH_PRIVATE_KEY = "0x4c0883a69102937d6231471b5dbb6204fe5129617082792ae468d01a3f362318"
+
+SCENARIOS = {
+    "proposals_list": ("GET", "/proposals/list", {}),
+    "proposals_stream": ("GET", "/proposals/stream", {}),
+    "proposal_detail": ("GET", "/proposals/{pid}", {}),
+    "proposal_votes": ("GET", "/proposals/{pid}/votes", {}),
+    "proposal_status": ("GET", "/funds/proposal_status/{pid}", {}),
+    "treasury_balance": ("GET", "/funds/treasury_balance", {}),
+    "treasury_info": ("GET", "/funds/treasury_info", {}),
+    "verify_report_ai": ("POST", "/reports/verify_report_ai", {"json": {"content": "Community report. " * 200}}),
+    "submit_report": ("POST", "/reports/submit_report", {"files": {"file": ("report.txt", b"Field report line.\n" * 500, "text/plain")}}),
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _percentile(sorted_values, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[idx]
+
+
+def boot(args):
+    """Start the stubs, write a throwaway .env and serve the app with uvicorn in a thread."""
+    rpc = RPCStub(proposals=args.proposals, latency=args.latency, block_time=args.block_time,
+                  votes_per_proposal=args.votes_per_proposal).start()
+    ipfs = IPFSStub().start()
+
+    workdir = tempfile.mkdtemp(prefix="echodao-bench-")
+    with open(os.path.join(workdir, ".env"), "w") as f:
+        f.write("\n".join([
+            f"CELO_RPC={rpc.url}",
+            f"PRIVATE_KEY={BENCH_PRIVATE_KEY}",
+            f"DAO_CONTRACT={DAO_ADDRESS}",
+            f"TREASURY_CONTRACT_ADDRESS={TREASURY_ADDRESS}",
+            "PINATA_API_KEY=bench",
+            "PINATA_SECRET=bench",
+            f"PINATA_API_URL={ipfs.url}",
+            f"IPFS_GATEWAY_URL={ipfs.url}",
+            f"WATCHER_ENABLED={'true' if args.watcher else 'false'}",
+            f"WATCHER_POLL_INTERVAL={min(1.0, args.block_time)}",
+            f"BLOCK_TIME_SECONDS={args.block_time}",
+            "VOTES_START_BLOCK=1",
+            f"DATA_DIR={os.path.join(workdir, 'data')}",
+            f"FAST_JSON={'true' if getattr(args, 'fast_json', False) else 'false'}",
+        ]) + "\n")
+    # config_loader reads .env from the working directory
+    os.chdir(workdir)
+
+    install_stub_summarizer(delay=args.summarizer_delay)
+
+    import uvicorn
+    from app import app
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", access_log=False))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.time() + 30
+    while not server.started:
+        if time.time() > deadline:
+            raise RuntimeError("uvicorn did not start")
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}", rpc, ipfs, server
+
+
+def run_scenario(base_url: str, rpc: RPCStub, name: str, args) -> dict:
+    method, path, kwargs = SCENARIOS[name]
+    local = threading.local()
+
+    def one(i: int):
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        url = base_url + path.format(pid=1 + i % max(1, args.proposals))
+        start = time.perf_counter()
+        resp = session.request(method, url, timeout=300, **kwargs)
+        elapsed = time.perf_counter() - start
+        return elapsed, resp.status_code < 400
+
+    # Warm up connections and caches so the measurement reflects steady state
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(one, range(min(args.concurrency, args.requests))))
+
+    rpc.reset_counts()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(one, range(args.requests)))
+    wall = time.perf_counter() - started
+
+    latencies = sorted(r[0] * 1000 for r in results)
+    errors = sum(1 for r in results if not r[1])
+    return {
+        "scenario": name,
+        "requests": len(results),
+        "errors": errors,
+        "p50_ms": round(_percentile(latencies, 0.50), 2),
+        "p95_ms": round(_percentile(latencies, 0.95), 2),
+        "p99_ms": round(_percentile(latencies, 0.99), 2),
+        "rps": round(len(results) / wall, 1) if wall else 0.0,
+        "rpc_per_request": round(rpc.total_calls() / len(results), 2),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "rpc_methods": dict(rpc.calls.most_common()),
+    }
+
+
+def print_table(rows):
+    headers = ["scenario", "requests", "errors", "p50_ms", "p95_ms", "p99_ms", "rps", "rpc_per_request", "peak_rss_mb"]
+    widths = [max(len(h), *(len(str(r[h])) for r in rows)) for h in headers]
+    print("  ".join(h.ljust(w) for h, w in zip(headers, widths)))
+    for r in rows:
+        print("  ".join(str(r[h]).ljust(w) for h, w in zip(headers, widths)))
+
+
+def compare(rows, baseline_path: str, max_regression: float) -> list:
+    """Return a list of human-readable regressions (p95 latency or RPC calls per request)."""
+    with open(baseline_path) as f:
+        baseline = {r["scenario"]: r for r in json.load(f)["results"]}
+    regressions = []
+    for r in rows:
+        base = baseline.get(r["scenario"])
+        if not base:
+            continue
+        if base["p95_ms"] and r["p95_ms"] > base["p95_ms"] * (1 + max_regression):
+            regressions.append(f"{r['scenario']}: p95 {base['p95_ms']}ms -> {r['p95_ms']}ms")
+        if r["rpc_per_request"] > base["rpc_per_request"] * (1 + max_regression) + 0.01:
+            regressions.append(f"{r['scenario']}: rpc/request {base['rpc_per_request']} -> {r['rpc_per_request']}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--proposals", type=int, default=100, help="proposals served by the stub node")
+    parser.add_argument("--votes-per-proposal", type=int, default=0, help="synthetic Voted logs per proposal")
+    parser.add_argument("--latency", type=float, default=0.002, help="seconds added to every JSON-RPC call")
+    parser.add_argument("--block-time", type=float, default=5.0, help="stub block interval in seconds")
+    parser.add_argument("--summarizer-delay", type=float, default=0.0, help="seconds spent in the stub summarizer")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma-separated scenario names")
+    parser.add_argument("--watcher", action="store_true", help="run the chain watcher (enables snapshot/cache paths)")
+    parser.add_argument("--fast-json", action="store_true", help="serve cached read endpoints through the FAST_JSON path")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="baseline JSON from a previous --json run")
+    parser.add_argument("--max-regression", type=float, default=0.25, help="allowed relative regression vs baseline")
+    args = parser.parse_args(argv)
+
+    names = [n.strip() for n in args.scenarios.split(",") if n.strip()]
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+
+    # boot() changes the working directory; resolve output paths first
+    args.json = os.path.abspath(args.json) if args.json else None
+    args.compare = os.path.abspath(args.compare) if args.compare else None
+
+    base_url, rpc, ipfs, server = boot(args)
+    if args.watcher:
+        # Give the watcher a moment to take its first snapshot
+        time.sleep(min(3.0, args.block_time + 0.5))
+    try:
+        rows = [run_scenario(base_url, rpc, name, args) for name in names]
+    finally:
+        server.should_exit = True
+        rpc.stop()
+        ipfs.stop()
+
+    print_table(rows)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"args": vars(args), "results": rows}, f, indent=2)
+    if args.compare:
+        regressions = compare(rows, args.compare, args.max_regression)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
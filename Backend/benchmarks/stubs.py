@@ -0,0 +1,318 @@
+# backend/benchmarks/stubs.py
+"""
+In-process stand-ins used by the benchmark suite: a JSON-RPC node that serves
+the EchoDAO/Treasury read paths (and vote transactions), a Pinata-compatible IPFS endpoint and a tiny
+summarizer module that replaces the BART pipeline.
+"""
+import hashlib
+import json
+import os
+import rlp
+import sys
+import threading
+import time
+import types
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from eth_abi import decode, encode
+from eth_account import Account
+from eth_utils import keccak
+from eth_utils import event_abi_to_log_topic, function_abi_to_4byte_selector, to_hex
+
+ABI_DIR = os.path.join(os.path.dirname(__file__), "..", "blockchain", "abi")
+
+DAO_ADDRESS = "0x" + "da" * 20
+TREASURY_ADDRESS = "0x" + "7e" * 20
+OWNER_ADDRESS = DAO_ADDRESS
+
+
+def _selectors(abi_file: str) -> dict:
+    with open(os.path.join(ABI_DIR, abi_file)) as f:
+        abi = json.load(f)["abi"]
+    return {
+        to_hex(function_abi_to_4byte_selector(e)): e
+        for e in abi if e.get("type") == "function"
+    }
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class StubServer:
+    """Base class: runs a ThreadingHTTPServer on 127.0.0.1 in a daemon thread."""
+
+    def __init__(self, handler_cls):
+        self.httpd = _Server(("127.0.0.1", 0), handler_cls)
+        self.httpd.stub = self
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class _RPCHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        stub = self.server.stub
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if isinstance(payload, list):
+            body = [stub.handle(req) for req in payload]
+        else:
+            body = stub.handle(payload)
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class RPCStub(StubServer):
+    """
+    Minimal JSON-RPC node for the read paths of EchoDAO and Treasury.
+
+    - `proposals` proposals with ids 1..N (id 0 is the empty slot)
+    - signed `vote` transactions are accepted and mined in the next block
+    - every call sleeps `latency` seconds to emulate network/node time
+    - a new block is produced every `block_time` seconds
+    - `calls` counts requests per JSON-RPC method (and eth_call per function)
+    """
+
+    def __init__(self, proposals: int = 100, latency: float = 0.0, block_time: float = 5.0, votes_per_proposal: int = 0):
+        super().__init__(_RPCHandler)
+        self.proposals = proposals
+        self.latency = latency
+        self.block_time = block_time
+        self.votes_per_proposal = votes_per_proposal
+        self.genesis = time.time()
+        self.treasury_balance = 50 * 10 ** 18
+        self.calls = Counter()
+        self._lock = threading.Lock()
+        self._dao = _selectors("EchoDAO.json")
+        self._treasury = _selectors("Treasury.json")
+        with open(os.path.join(ABI_DIR, "EchoDAO.json")) as f:
+            voted = next(e for e in json.load(f)["abi"] if e.get("name") == "Voted")
+        self._voted_topic = to_hex(event_abi_to_log_topic(voted))
+        self._vote_selector = next(k for k, e in self._dao.items() if e["name"] == "vote")
+        self.sent = {}  # tx hash -> (block sent, sender, nonce, proposal id, support)
+        self.inputs = {}  # tx hash -> calldata
+        self.nonces = Counter()
+
+    @property
+    def block_number(self) -> int:
+        return 1000 + int((time.time() - self.genesis) / self.block_time)
+
+    def total_calls(self) -> int:
+        with self._lock:
+            return sum(v for k, v in self.calls.items() if ":" not in k)
+
+    def reset_counts(self):
+        with self._lock:
+            self.calls.clear()
+
+    def _count(self, key):
+        with self._lock:
+            self.calls[key] += 1
+
+    def handle(self, req: dict) -> dict:
+        method, params = req["method"], req.get("params") or []
+        self._count(method)
+        if self.latency:
+            time.sleep(self.latency)
+        try:
+            result = self.dispatch(method, params)
+            return {"jsonrpc": "2.0", "id": req.get("id"), "result": result}
+        except Exception as e:
+            return {"jsonrpc": "2.0", "id": req.get("id"), "error": {"code": -32000, "message": str(e)}}
+
+    def dispatch(self, method: str, params: list):
+        if method == "eth_chainId":
+            return hex(44787)
+        if method == "net_version":
+            return "44787"
+        if method == "eth_blockNumber":
+            return hex(self.block_number)
+        if method == "eth_getBalance":
+            return hex(self.treasury_balance if params[0].lower() == TREASURY_ADDRESS else 10 ** 20)
+        if method == "eth_gasPrice":
+            return hex(5 * 10 ** 9)
+        if method == "eth_getTransactionCount":
+            return hex(self.nonces[params[0].lower()])
+        if method == "eth_maxPriorityFeePerGas":
+            return hex(10 ** 9)
+        if method == "eth_feeHistory":
+            count, newest = int(params[0], 16) if isinstance(params[0], str) else params[0], self.block_number
+            return {"oldestBlock": hex(newest - count + 1), "baseFeePerGas": [hex(10 ** 9)] * (count + 1),
+                    "gasUsedRatio": [0.5] * count, "reward": [[hex(10 ** 8 * (p + 1)) for p in params[2]]] * count}
+        if method == "eth_estimateGas":
+            return hex(60000)
+        if method == "eth_sendRawTransaction":
+            return self.send_raw(params[0])
+        if method == "eth_getTransactionReceipt":
+            return self.receipt(params[0])
+        if method == "eth_getTransactionByHash":
+            return self.transaction(params[0])
+        if method == "eth_getLogs":
+            return self.get_logs(params[0])
+        if method == "eth_getBlockByNumber":
+            number = self.block_number if params[0] in ("latest", "pending") else int(params[0], 16)
+            return {"number": hex(number), "hash": "0x" + hashlib.sha256(str(number).encode()).hexdigest(),
+                    "baseFeePerGas": hex(10 ** 9), "timestamp": hex(int(self.genesis + number * self.block_time))}
+        if method == "eth_call":
+            return self.call(params[0])
+        raise ValueError(f"method {method} not supported by stub")
+
+    def call(self, tx: dict) -> str:
+        data = tx.get("data") or tx.get("input")
+        selector, args = data[:10], bytes.fromhex(data[10:])
+        target = tx["to"].lower()
+        fn = (self._dao if target == DAO_ADDRESS else self._treasury).get(selector)
+        if fn is None:
+            raise ValueError(f"unknown selector {selector} on {target}")
+        name = fn["name"]
+        self._count(f"eth_call:{name}")
+        if name == "nextProposalId":
+            return to_hex(encode(["uint256"], [self.proposals + 1]))
+        if name == "proposals":
+            return to_hex(self.proposal(int.from_bytes(args[:32], "big")))
+        if name == "hasVoted":
+            return to_hex(encode(["bool"], [False]))
+        if name == "owner":
+            return to_hex(encode(["address"], [OWNER_ADDRESS]))
+        if name == "getBalance":
+            return to_hex(encode(["uint256"], [self.treasury_balance]))
+        raise ValueError(f"function {name} not supported by stub")
+
+    def send_raw(self, raw: str) -> str:
+        sender = Account.recover_transaction(raw).lower()
+        payload = bytes.fromhex(raw[2:])
+        if payload[0] == 2:  # EIP-1559: chainId, nonce, maxPriorityFeePerGas, maxFeePerGas, gas, to, value, data, ...
+            nonce, _, _, _, to, _, data = rlp.decode(payload[1:])[1:8]
+        else:
+            nonce, _, _, to, _, data = rlp.decode(payload)[:6]
+        data = to_hex(data)
+        if to_hex(to) != DAO_ADDRESS or data[:10] != self._vote_selector:
+            raise ValueError("only EchoDAO.vote transactions are supported by stub")
+        with self._lock:
+            if int.from_bytes(nonce, "big") != self.nonces[sender]:
+                raise ValueError("nonce too low" if int.from_bytes(nonce, "big") < self.nonces[sender] else "nonce gap")
+            self.nonces[sender] += 1
+        pid, support = decode(["uint256", "bool"], bytes.fromhex(data[10:]))
+        tx_hash = to_hex(keccak(hexstr=raw))
+        self.sent[tx_hash] = (self.block_number, sender, int.from_bytes(nonce, "big"), pid, support)
+        self.inputs[tx_hash] = data
+        return tx_hash
+
+    def transaction(self, tx_hash: str):
+        sent = self.sent.get(tx_hash)
+        if sent is None:
+            return None
+        block, sender, nonce, _, _ = sent
+        mined = self.block_number > block
+        return {
+            "hash": tx_hash, "nonce": hex(nonce), "from": sender, "to": DAO_ADDRESS, "value": "0x0",
+            "gas": hex(60000), "gasPrice": hex(5 * 10 ** 9), "input": self.inputs[tx_hash], "type": "0x0",
+            "blockNumber": hex(block + 1) if mined else None, "transactionIndex": hex(nonce % 1000) if mined else None,
+            "blockHash": "0x" + hashlib.sha256(str(block + 1).encode()).hexdigest() if mined else None,
+            "v": "0x0", "r": "0x0", "s": "0x0",
+        }
+
+    def receipt(self, tx_hash: str):
+        sent = self.sent.get(tx_hash)
+        if sent is None or self.block_number <= sent[0]:
+            return None
+        block, sender, nonce, pid, support = sent
+        block_hash = "0x" + hashlib.sha256(str(block + 1).encode()).hexdigest()
+        return {
+            "transactionHash": tx_hash, "transactionIndex": hex(nonce % 1000), "blockNumber": hex(block + 1),
+            "blockHash": block_hash, "from": sender, "to": DAO_ADDRESS, "status": "0x1", "gasUsed": hex(50000),
+            "cumulativeGasUsed": hex(50000), "effectiveGasPrice": hex(5 * 10 ** 9), "contractAddress": None,
+            "logsBloom": "0x" + "00" * 256, "type": "0x0",
+            "logs": [{
+                "address": DAO_ADDRESS, "topics": [self._voted_topic],
+                "data": to_hex(encode(["uint256", "address", "bool"], [pid, sender, support])),
+                "blockNumber": hex(block + 1), "blockHash": block_hash, "transactionHash": tx_hash,
+                "transactionIndex": hex(nonce % 1000), "logIndex": "0x0", "removed": False,
+            }],
+        }
+
+    def proposal(self, pid: int) -> bytes:
+        types_ = ["address", "uint256", "bytes", "string", "uint256", "uint256", "uint256", "uint256", "bool"]
+        if pid == 0 or pid > self.proposals:
+            return encode(types_, ["0x" + "00" * 20, 0, b"", "", 0, 0, 0, 0, False])
+        start = 10 + pid
+        return encode(types_, [
+            TREASURY_ADDRESS, pid * 10 ** 16, b"", f"Proposal {pid}: fund community programme " + "x" * 200,
+            start, start + 1000, pid % 7, pid % 3, pid % 5 == 0,
+        ])
+
+    def get_logs(self, flt: dict) -> list:
+        """Synthetic Voted logs: `votes_per_proposal` votes in the block where each proposal starts."""
+        if not self.votes_per_proposal:
+            return []
+        frm, to = int(flt["fromBlock"], 16), int(flt["toBlock"], 16)
+        logs = []
+        for block in range(max(frm, 11), min(to, 10 + self.proposals) + 1):
+            pid = block - 10
+            for i in range(self.votes_per_proposal):
+                voter = "0x" + hashlib.sha256(f"{pid}:{i}".encode()).hexdigest()[:40]
+                logs.append({
+                    "address": DAO_ADDRESS, "topics": [self._voted_topic],
+                    "data": to_hex(encode(["uint256", "address", "bool"], [pid, voter, i % 2 == 0])),
+                    "blockNumber": hex(block), "blockHash": "0x" + hashlib.sha256(str(block).encode()).hexdigest(),
+                    "transactionHash": "0x" + hashlib.sha256(f"tx{pid}:{i}".encode()).hexdigest(),
+                    "transactionIndex": hex(i), "logIndex": hex(i), "removed": False,
+                })
+        return logs
+
+
+class _IPFSHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.stub.uploads += 1
+        data = json.dumps({"IpfsHash": "Qm" + hashlib.sha256(body).hexdigest()[:44]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class IPFSStub(StubServer):
+    """Accepts Pinata `pinFileToIPFS` uploads and returns a content-derived fake CID."""
+
+    def __init__(self):
+        super().__init__(_IPFSHandler)
+        self.uploads = 0
+
+
+def install_stub_summarizer(delay: float = 0.0):
+    """Register a tiny `ai.summarizer` module so importing the app never loads the BART model."""
+    module = types.ModuleType("ai.summarizer")
+
+    def summarize_report(content) -> str:
+        text = content.decode("utf-8", errors="ignore") if isinstance(content, bytes) else content
+        if delay:
+            time.sleep(delay)
+        return " ".join(text.split()[:40])
+
+    module.summarize_report = summarize_report
+    sys.modules["ai.summarizer"] = module
+    return module
@@ -1,29 +1,46 @@
 from web3 import Web3
-from web3.exceptions import ContractLogicError
-import json, os, traceback
-from utils.config_loader import load_env
+from web3.exceptions import ContractLogicError, TimeExhausted, TransactionNotFound
+import logging
+from eth_utils import event_abi_to_log_topic
+from hexbytes import HexBytes
+import contextvars
+import json, os
+from utils.config_loader import get_settings
+from blockchain.fees import FeeStrategy
+from blockchain.provider import InstrumentedHTTPProvider
+from blockchain.proposal_record import ProposalRecord
+from utils.logger import get_logger
+from utils.profiling import bind
+from utils.singleflight import SingleFlight
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
+import threading
 import time
 
 # -------------------------------
 # Environment & Web3 Setup
 # -------------------------------
 
-env = load_env()
-CELO_RPC = env["CELO_RPC"]
-PRIVATE_KEY = env["PRIVATE_KEY"]
-DAO_CONTRACT = env["DAO_CONTRACT"]
-TREASURY_CONTRACT_ADDRESS = env["TREASURY_CONTRACT_ADDRESS"]
+log = get_logger(__name__)
 
-# Initialize Web3 with increased timeout and connection pooling
-w3 = Web3(Web3.HTTPProvider(
+settings = get_settings()
+CELO_RPC = settings.celo_rpc
+PRIVATE_KEY = settings.private_key
+DAO_CONTRACT = settings.dao_contract
+TREASURY_CONTRACT_ADDRESS = settings.treasury_contract_address
+FEE_BUMP_AFTER = settings.fee_bump_after
+FEE_MAX_BUMPS = settings.fee_max_bumps
+
+# Initialize Web3 with increased timeout and connection pooling (calls are recorded in /metrics)
+w3 = Web3(InstrumentedHTTPProvider(
     CELO_RPC, 
     request_kwargs={
         'timeout': 120,  # Increased to 120 seconds
     }
 ))
 account = w3.eth.account.from_key(PRIVATE_KEY)
+# EIP-1559 fees from cached fee history, chain id read once (blockchain/fees.py)
+fees = FeeStrategy(w3)
 
 # Load DAO ABI
 abi_path = os.path.join(os.path.dirname(__file__), "abi", "EchoDAO.json")
@@ -33,6 +50,216 @@ dao_abi = dao_json["abi"]
 
 dao_contract = w3.eth.contract(address=Web3.to_checksum_address(DAO_CONTRACT), abi=dao_abi)
 
+# Load Treasury ABI (needed to decode Received / FundsReleased logs)
+treasury_abi_path = os.path.join(os.path.dirname(__file__), "abi", "Treasury.json")
+with open(treasury_abi_path, "r") as f:
+    treasury_json = json.load(f)
+treasury_abi = treasury_json["abi"]
+
+treasury_contract = w3.eth.contract(address=Web3.to_checksum_address(TREASURY_CONTRACT_ADDRESS), abi=treasury_abi)
+
+
+# -------------------------------
+# Event Log Decoding
+# -------------------------------
+
+def _build_event_index(*contracts):
+    """Map (contract address, topic0) -> event class for every non-anonymous event in the ABIs."""
+    index = {}
+    for contract in contracts:
+        for entry in contract.abi:
+            if entry.get("type") != "event" or entry.get("anonymous"):
+                continue
+            topic = bytes(event_abi_to_log_topic(entry))
+            index[(contract.address.lower(), topic)] = getattr(contract.events, entry["name"])
+    return index
+
+_event_index = _build_event_index(dao_contract, treasury_contract)
+
+
+def decode_logs(logs, event_names=None):
+    """
+    Decode raw logs (from a receipt or eth_getLogs) emitted by the DAO or Treasury contracts.
+    Logs from other contracts, unknown events and events not in `event_names` are skipped.
+    Returns a list of dicts: event, address, args, blockNumber, blockHash, transactionHash, logIndex.
+    """
+    decoded = []
+    for entry in logs:
+        topics = entry.get("topics") or []
+        if not topics:
+            continue
+        event = _event_index.get((str(entry["address"]).lower(), bytes(HexBytes(topics[0]))))
+        if event is None or (event_names and event.event_name not in event_names):
+            continue
+        try:
+            data = event().process_log(entry)
+        except Exception as e:
+            log.warning("Could not decode %s log: %s", event.event_name, e, extra={"sample_key": "decode_log"})
+            continue
+        decoded.append({
+            "event": data["event"],
+            "address": data["address"],
+            "args": dict(data["args"]),
+            "blockNumber": data["blockNumber"],
+            "blockHash": w3.to_hex(data["blockHash"]) if data.get("blockHash") is not None else None,
+            "transactionHash": w3.to_hex(data["transactionHash"]),
+            "logIndex": data["logIndex"],
+        })
+    return decoded
+
+
+def decode_receipt(receipt, *event_names):
+    """Decode the DAO/Treasury events carried in a transaction receipt, optionally filtered by name."""
+    return decode_logs(receipt["logs"], event_names or None)
+
+
+def event_topic(contract, event_name: str) -> str:
+    """Hex topic0 of an event in the contract ABI (for eth_getLogs filters)."""
+    entry = next(e for e in contract.abi if e.get("type") == "event" and e["name"] == event_name)
+    return w3.to_hex(event_abi_to_log_topic(entry))
+
+
+# How providers word an eth_getLogs rejection for a range spanning too many blocks or results
+_RANGE_ERRORS = ("block range", "range too", "range is too", "too many", "too large", "more than",
+                 "limit exceeded", "response size", "-32005")
+LOG_RETRIES = 3         # attempts for any other eth_getLogs failure before it is raised
+LOG_GROW_AFTER = 4      # successful calls in a row before a halved chunk is doubled again
+
+
+def _range_too_large(error: Exception) -> bool:
+    text = f"{error} {getattr(error, 'rpc_response', '') or ''}".lower()
+    return any(marker in text for marker in _RANGE_ERRORS)
+
+
+def iter_logs(from_block: int, to_block: int, address, topics=None, chunk_size: int = 5000):
+    """
+    Yield (chunk_from, chunk_to, logs) covering [from_block, to_block] with bounded eth_getLogs ranges.
+    The chunk is halved whenever the provider rejects a range as too large and grows back to
+    `chunk_size` after LOG_GROW_AFTER successful calls; other errors are retried LOG_RETRIES times.
+    """
+    size, streak, failures = chunk_size, 0, 0
+    start = from_block
+    while start <= to_block:
+        end = min(to_block, start + size - 1)
+        params = {"fromBlock": start, "toBlock": end, "address": address}
+        if topics:
+            params["topics"] = topics
+        try:
+            logs = w3.eth.get_logs(params)
+        except Exception as e:
+            streak = 0
+            if _range_too_large(e) and size > 1:
+                size = max(1, size // 2)
+                log.warning("eth_getLogs %d-%d rejected (%s); retrying with chunk size %d", start, end, e, size)
+                continue
+            failures += 1
+            if failures >= LOG_RETRIES:
+                raise
+            log.warning("eth_getLogs %d-%d failed (%s); retry %d/%d", start, end, e, failures, LOG_RETRIES - 1)
+            time.sleep(0.5 * 2 ** failures)
+            continue
+        failures = 0
+        streak += 1
+        if size < chunk_size and streak >= LOG_GROW_AFTER:
+            size, streak = min(chunk_size, size * 2), 0
+        yield start, end, logs
+        start = end + 1
+
+
+# -------------------------------
+# Transaction Sending
+# -------------------------------
+
+# Serialises nonce assignment for transactions sent from the backend account
+_send_lock = threading.Lock()
+
+# Called with the hash of every transaction the node accepts in the current context
+# (routes/proposal_routes.py records them against the request's Idempotency-Key)
+on_broadcast = contextvars.ContextVar("on_broadcast", default=None)
+
+
+def _sign_and_send(txn: dict) -> str:
+    signed = w3.eth.account.sign_transaction(txn, PRIVATE_KEY)
+    tx_hash = w3.to_hex(w3.eth.send_raw_transaction(signed.raw_transaction))
+    callback = on_broadcast.get()
+    if callback is not None:
+        callback(tx_hash)
+    return tx_hash
+
+
+def send_transaction(txn: dict, speed: str = None, timeout: float = 120, poll_interval: float = 0.5):
+    """
+    Sign and send `txn` (built with gas and `fees.tx_params()`) with the next pending
+    nonce and wait for it to be mined. A transaction still pending after FEE_BUMP_AFTER
+    seconds is replaced by the same nonce with bumped fees, at most FEE_MAX_BUMPS
+    times. Returns (tx_hash, receipt) of whichever version was mined.
+    """
+    with _send_lock:
+        txn = {**txn, 'nonce': w3.eth.get_transaction_count(account.address, "pending")}
+        hashes = [_sign_and_send(txn)]
+    deadline = time.monotonic() + timeout
+    bump_at = time.monotonic() + FEE_BUMP_AFTER
+    bumps = 0
+    while True:
+        for tx_hash in hashes:
+            try:
+                return tx_hash, w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                continue
+        now = time.monotonic()
+        if now >= deadline:
+            raise TimeExhausted(f"Transaction {hashes[-1]} not mined within {timeout:g}s")
+        if bumps < FEE_MAX_BUMPS and now >= bump_at:
+            bumps += 1
+            bump_at = now + FEE_BUMP_AFTER
+            txn = {**txn, **fees.bump(txn, speed)}
+            try:
+                hashes.append(_sign_and_send(txn))
+                log.warning("Transaction %s pending for %ds; replaced with higher fees", hashes[-2],
+                            FEE_BUMP_AFTER * bumps, extra={"tx_hash": hashes[-1], "nonce": txn['nonce']})
+            except Exception as e:
+                # Typically "nonce too low": an earlier version was mined in the meantime
+                log.info("Fee bump for nonce %d not sent: %s", txn['nonce'], e)
+        time.sleep(poll_interval)
+
+
+def sent_calls(tx_hashes, function_name: str, timeout: float = 30, poll_interval: float = 0.5):
+    """
+    Recover what an earlier request broadcast: the DAO `function_name` calls among
+    `tx_hashes`, one per nonce (fee-bumped versions share it), after waiting up to
+    `timeout` seconds for them to be mined. Returns (calls, unknown) where calls are
+    dicts of nonce, args, tx_hash and receipt (None while pending) in nonce order,
+    and unknown counts hashes the node does not know (dropped or replaced).
+    """
+    calls, unknown = {}, 0
+    for tx_hash in tx_hashes:
+        try:
+            tx = w3.eth.get_transaction(tx_hash)
+        except TransactionNotFound:
+            unknown += 1
+            continue
+        if not tx.get("to") or tx["to"].lower() != dao_contract.address.lower():
+            continue
+        fn, args = dao_contract.decode_function_input(tx["input"])
+        if fn.fn_name != function_name:
+            continue
+        call = calls.setdefault(tx["nonce"], {"nonce": tx["nonce"], "args": args, "hashes": [], "receipt": None})
+        call["hashes"].append(tx_hash)
+        call["tx_hash"] = tx_hash  # latest version until one is mined
+    deadline = time.monotonic() + timeout
+    while True:
+        for call in calls.values():
+            for tx_hash in call["hashes"] if call["receipt"] is None else ():
+                try:
+                    call["receipt"] = w3.eth.get_transaction_receipt(tx_hash)
+                except TransactionNotFound:
+                    continue
+                call["tx_hash"] = tx_hash
+                break
+        if all(c["receipt"] is not None for c in calls.values()) or time.monotonic() >= deadline:
+            return [calls[nonce] for nonce in sorted(calls)], unknown
+        time.sleep(poll_interval)
+
 
 # -------------------------------
 # Proposal Functions (Real)
@@ -40,7 +267,7 @@ dao_contract = w3.eth.contract(address=Web3.to_checksum_address(DAO_CONTRACT), a
 
 def fund_treasury(amount_eth: float):
     """
-    Send CELO from your account to the DAO contract (with EIP-155 chainId for Alfajores).
+    Send CELO from your account to the DAO contract.
     """
     try:
         # Use checksum address and let the node estimate gas for a contract transfer.
@@ -50,8 +277,7 @@ def fund_treasury(amount_eth: float):
             'to': to_addr,
             'value': Web3.to_wei(amount_eth, 'ether'),
             'from': account.address,
-            'nonce': w3.eth.get_transaction_count(account.address),
-            'chainId': 44787  # Alfajores testnet chainId
+            'chainId': fees.chain_id,
         }
 
         # Estimate gas for sending value to the contract (21000 is only valid for EOA transfers).
@@ -63,41 +289,40 @@ def fund_treasury(amount_eth: float):
             gas_limit = 150000
 
         base_txn['gas'] = gas_limit
-        base_txn['gasPrice'] = w3.eth.gas_price
-
-        signed = w3.eth.account.sign_transaction(base_txn, PRIVATE_KEY)
-        tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
-
-        print("💰 Funding Treasury. TX hash:", w3.to_hex(tx_hash))
+        base_txn.update(fees.fees())
 
-        tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-        print("⛏️ Funding mined. Gas used:", tx_receipt.gasUsed)
+        log.info("Funding treasury", extra={"amount_eth": amount_eth})
+        tx_hash, tx_receipt = send_transaction(base_txn, timeout=120)
+        log.info("Funding mined", extra={"gas_used": tx_receipt.gasUsed, "status": tx_receipt.status})
 
-        # Fetch the raw transaction to confirm target and value
-        try:
-            tx = w3.eth.get_transaction(tx_hash)
-            to_field = tx.get('to')
-            value_field = tx.get('value')
-            print(f"🔎 Transaction details: to={to_field}, value (wei)={value_field}, value (CELO)={w3.from_wei(value_field, 'ether')}")
-        except Exception as e:
-            print(f"⚠️ Could not fetch raw transaction details: {e}")
-
-        # Check the treasury balance immediately after mining
-        try:
-            current_balance = w3.eth.get_balance(to_addr)
-            print("🔎 On-chain balance for treasury after funding (CELO):", w3.from_wei(current_balance, 'ether'))
-        except Exception as e:
-            print(f"⚠️ Could not fetch treasury balance after funding: {e}")
+        # Confirm target and value from the Received event instead of re-reading the transaction
+        for ev in decode_receipt(tx_receipt, "Received"):
+            log.debug("Treasury received %s wei from %s", ev['args']['amount'], ev['args']['sender'])
 
         if tx_receipt.status == 0:
             raise Exception("Funding transaction reverted on-chain!")
-        print("✅ Treasury funding confirmed.")
-        return w3.to_hex(tx_hash)
+        log.info("Treasury funding confirmed", extra={"tx_hash": tx_hash})
+        return tx_hash
     except Exception as e:
-        print(f"❌ Treasury funding failed: {e}")
-        traceback.print_exc()
+        log.exception("Treasury funding failed: %s", e)
         raise
 
+def proposal_created(tx_hash: str, receipt):
+    """Proposal ID and voting window from the ProposalCreated event of a createProposal receipt (no extra reads)."""
+    events = decode_receipt(receipt, "ProposalCreated")
+    if not events:
+        log.warning("No ProposalCreated event found in receipt %s", tx_hash)
+        return None
+    args = events[0]["args"]
+    created = {
+        "proposal_id": int(args["id"]),
+        "block_start": int(args["blockStart"]),
+        "block_end": int(args["blockEnd"]),
+    }
+    log.info("ProposalCreated", extra=created)
+    return created
+
+
 def create_proposal(description: str, amount_eth: float, recipient: str):
     """
     Safely create a proposal on-chain.
@@ -105,51 +330,39 @@ def create_proposal(description: str, amount_eth: float, recipient: str):
     1. Ensure DAO treasury has enough CELO (skip for 0 CELO proposals).
     2. Estimate gas to catch potential revert issues.
     3. Send the transaction and wait for receipt.
+    Returns (tx_hash, created) where `created` holds proposal_id, block_start and block_end
+    decoded from the ProposalCreated event, or (None, None) on failure.
     """
-    import traceback
+    from blockchain.treasury_watcher import treasury_watcher
     try:
         # --- Check treasury balance (skip for 0 CELO proposals) ---
         balance = w3.eth.get_balance(account.address)
-        print("Sender balance (in CELO):", float(w3.from_wei(balance, 'ether')))
+        log.debug("Sender balance: %s wei", balance)
 
-        # Use checksum address when reading on-chain balances and normalize to float
-        treasury_balance = w3.eth.get_balance(Web3.to_checksum_address(TREASURY_CONTRACT_ADDRESS))
+        # Served from the watcher snapshot when it is running, otherwise read from the node
+        treasury_balance = treasury_watcher.balance_wei()
         treasury_eth = float(w3.from_wei(treasury_balance, 'ether'))
-        print("Treasury Contract Balance:", treasury_eth, "CELO")
+        log.debug("Treasury balance: %s CELO", treasury_eth)
 
         # Only check and fund treasury if amount > 0
         if amount_eth > 0 and treasury_eth < amount_eth:
             needed = amount_eth - treasury_eth
-            print(f"⚠️ Treasury insufficient ({treasury_eth} CELO). Funding {needed} CELO...")
+            log.warning("Treasury insufficient (%s CELO); funding %s CELO", treasury_eth, needed)
             tx_hash_fund = fund_treasury(needed)
             if not tx_hash_fund:
                 raise Exception("Treasury funding failed or not confirmed yet.")
 
-            # Refresh balance with a short polling loop (small block/time propagation delays can occur)
-            import time
-            attempts = 6
-            treasury_addr = Web3.to_checksum_address(TREASURY_CONTRACT_ADDRESS)
-            new_balance = None
-            for i in range(attempts):
-                treasury_balance = w3.eth.get_balance(treasury_addr)
-                treasury_eth = float(w3.from_wei(treasury_balance, 'ether'))
-                print(f"DAO Treasury attempt {i+1}/{attempts}: {treasury_eth} CELO")
-                if treasury_eth >= amount_eth:
-                    new_balance = treasury_eth
-                    break
-                # sleep briefly before retrying
-                time.sleep(2)
-
-            if new_balance is None:
-                # Final diagnostics: show latest on-chain value and abort with helpful info
+            # Wait for the treasury watcher to observe the new balance instead of sleep-polling the node
+            treasury_balance = treasury_watcher.wait_for_balance(Web3.to_wei(amount_eth, 'ether'), timeout=15)
+            treasury_eth = float(w3.from_wei(treasury_balance, 'ether')) if treasury_balance is not None else None
+            log.info("Treasury balance after funding: %s CELO", treasury_eth)
+            if treasury_eth is None or treasury_eth < amount_eth:
                 raise Exception(f"Treasury funding not reflected yet on-chain. Last seen: {treasury_eth} CELO; expected >= {amount_eth} CELO. Check tx on explorer or node sync.")
         elif amount_eth == 0:
-            print("ℹ️ Creating a 0 CELO proposal (no treasury funding needed)")
+            log.debug("Creating a 0 CELO proposal (no treasury funding needed)")
 
-        print(f"Creating proposal → {description}")
-        print(f"Recipient: {recipient}")
-        print(f"Amount (ETH): {amount_eth}")
-        print(f"From: {account.address}")
+        log.info("Creating proposal", extra={"recipient": recipient, "amount_eth": amount_eth, "sender": account.address})
+        log.debug("Proposal description: %s", description)
 
         # --- Estimate gas as a safe simulation ---
         try:
@@ -159,7 +372,7 @@ def create_proposal(description: str, amount_eth: float, recipient: str):
                 b"",
                 description
             ).estimate_gas({'from': account.address})
-            print("✅ Gas estimate:", gas_estimate)
+            log.debug("createProposal gas estimate: %d", gas_estimate)
         except Exception as e:
             raise Exception(f"Transaction likely to fail: {e}")
 
@@ -171,37 +384,20 @@ def create_proposal(description: str, amount_eth: float, recipient: str):
             description
         ).build_transaction({
             'from': account.address,
-            'nonce': w3.eth.get_transaction_count(account.address),
             'gas': gas_estimate + 10000,  # add buffer
-            'gasPrice': w3.eth.gas_price
+            **fees.tx_params(),
         })
 
-        # --- Sign & send ---
-        signed = w3.eth.account.sign_transaction(txn, PRIVATE_KEY)
-        tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
-        print("🚀 Sent! TX hash:", w3.to_hex(tx_hash))
-
-        # --- Wait for receipt ---
-        tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
-        print("Raw logs:", tx_receipt["logs"])
-        print("⛏️ Mined. Status:", tx_receipt.status)
+        # --- Sign, send & wait for receipt ---
+        tx_hash, tx_receipt = send_transaction(txn)
+        log.info("createProposal mined", extra={"tx_hash": tx_hash, "status": tx_receipt.status})
         if tx_receipt.status == 0:
             raise Exception("Transaction reverted on-chain!")
 
-        # --- Parse proposal ID from event logs ---
-        try:
-            events = dao_contract.events.ProposalCreated().process_receipt(tx_receipt)
-            proposal_id = dao_contract.functions.nextProposalId().call() - 1 if events else None
-            print("📜 ProposalCreated event logs:", events)
-        except Exception as e:
-            print("⚠️ Could not parse ProposalCreated event:", e)
-            proposal_id = None
-
-        return w3.to_hex(tx_hash), proposal_id
+        return tx_hash, proposal_created(tx_hash, tx_receipt)
 
     except Exception as e:
-        print("❌ Blockchain error:", e)
-        traceback.print_exc()
+        log.exception("createProposal failed: %s", e)
         return None, None
 
 def vote_proposal(proposal_id: int, support: bool):
@@ -217,19 +413,19 @@ def vote_proposal(proposal_id: int, support: bool):
             block_start = int(proposal[4])
             block_end = int(proposal[5])
             executed = bool(proposal[8])
-            print(f"🔎 Proposal {proposal_id} metadata: block_start={block_start}, block_end={block_end}, executed={executed}")
+            log.debug("Proposal %d metadata: block_start=%d block_end=%d executed=%s", proposal_id, block_start, block_end, executed)
         except Exception as e:
-            print(f"⚠️ Could not fetch proposal metadata: {e}")
+            log.warning("Could not fetch proposal %d metadata: %s", proposal_id, e)
 
         # Check if caller already voted
         try:
             already_voted = dao_contract.functions.hasVoted(proposal_id, account.address).call()
-            print(f"🔎 Caller already voted: {already_voted}")
+            log.debug("Caller already voted on %d: %s", proposal_id, already_voted)
             if already_voted:
                 raise Exception("Address has already voted on this proposal")
         except Exception as e:
             # If the mapping call fails, continue to simulation which will catch on-chain reverts
-            print(f"⚠️ Could not read hasVoted mapping: {e}")
+            log.warning("Could not read hasVoted mapping: %s", e)
 
         # Quick on-chain simulation to get revert reasons early
         try:
@@ -238,42 +434,182 @@ def vote_proposal(proposal_id: int, support: bool):
             # estimate gas for realistic gas limit
             gas_estimate = dao_contract.functions.vote(proposal_id, support).estimate_gas({'from': account.address})
             gas_to_use = gas_estimate + 50000
-            print(f"✅ Vote simulation passed. Gas estimate: {gas_estimate}, using gas: {gas_to_use}")
+            log.debug("Vote simulation passed; gas estimate %d, using %d", gas_estimate, gas_to_use)
         except ContractLogicError as cle:
             # Surface the revert reason to the caller
-            print(f"❌ Vote simulation failed (ContractLogicError): {cle}")
+            log.warning("Vote simulation reverted: %s", cle)
             raise
         except Exception as e:
             # Generic simulation/estimate failure
-            print(f"⚠️ Vote simulation/estimate failed: {e}")
+            log.warning("Vote simulation/estimate failed: %s", e)
             raise
 
         # --- Build, sign and send transaction ---
         txn = dao_contract.functions.vote(proposal_id, support).build_transaction({
             'from': account.address,
-            'nonce': w3.eth.get_transaction_count(account.address),
             'gas': gas_to_use,
-            'gasPrice': w3.eth.gas_price
+            **fees.tx_params(),
         })
-        signed = w3.eth.account.sign_transaction(txn, PRIVATE_KEY)
-        tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
-
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
-        print("⛏️ Vote mined. Status:", receipt.status)
+        tx_hash, receipt = send_transaction(txn)
+        log.info("Vote mined", extra={"tx_hash": tx_hash, "status": receipt.status})
 
         if receipt.status == 0:
             raise Exception("Vote transaction reverted on-chain!")
 
-        return w3.to_hex(tx_hash)
+        voted = decode_receipt(receipt, "Voted")
+        if not voted:
+            raise Exception("Vote transaction mined without a Voted event")
+        log.info("Voted", extra=voted[0]["args"])
+
+        return tx_hash
 
     except Exception as e:
-        print(f"❌ Vote transaction failed: {e}")
-        traceback.print_exc()
+        log.exception("Vote transaction failed: %s", e)
         raise
 
+def _check_vote(proposal, already_voted: bool, current_block: int):
+    """Reason the contract would reject a vote, mirroring EchoDAO.vote's require()s, or None."""
+    block_start, block_end, executed = int(proposal[4]), int(proposal[5]), bool(proposal[8])
+    if block_start == 0:
+        return "Proposal does not exist"
+    if executed:
+        return "Proposal already executed"
+    if current_block < block_start:
+        return "Voting not started"
+    if current_block > block_end:
+        return "Voting has ended"
+    if already_voted:
+        return "Address has already voted on this proposal"
+    return None
+
+
+def vote_batch(votes, receipt_timeout: float = 120, poll_interval: float = 0.5):
+    """
+    Cast several votes from the backend account in roughly one block.
+    `votes` is a list of (proposal_id, support). Proposal metadata and hasVoted for every
+    vote are read in one JSON-RPC batch, the valid votes are signed with consecutive
+    nonces and broadcast back-to-back, then all receipts are awaited together.
+    Returns one dict per vote, in order: proposal_id, support, tx_hash, status
+    ("mined", "reverted", "rejected", "not_sent" or "pending") and error.
+    """
+    results = [{"proposal_id": pid, "support": support, "tx_hash": None, "status": "rejected", "error": None}
+               for pid, support in votes]
+    seen = set()
+    for r in results:
+        if r["proposal_id"] in seen:
+            r["error"] = "Duplicate proposal in batch"
+        seen.add(r["proposal_id"])
+
+    # --- Validate every vote with one batched read ---
+    candidates = [r for r in results if r["error"] is None]
+    if candidates:
+        with w3.batch_requests() as batch:
+            batch.add(w3.eth.get_block_number())
+            for r in candidates:
+                batch.add(dao_contract.functions.proposals(r["proposal_id"]))
+                batch.add(dao_contract.functions.hasVoted(r["proposal_id"], account.address))
+            responses = batch.execute()
+        current_block = int(responses[0])
+        for i, r in enumerate(candidates):
+            r["error"] = _check_vote(responses[1 + 2 * i], bool(responses[2 + 2 * i]), current_block)
+    valid = [r for r in results if r["error"] is None]
+    if not valid:
+        return results
+
+    # Votes differ only in storage slots touched, so one estimate (plus the usual buffer) covers the batch
+    first = valid[0]
+    gas_estimate = dao_contract.functions.vote(first["proposal_id"], first["support"]).estimate_gas({'from': account.address})
+    gas_to_use = gas_estimate + 50000
+    fee_params = fees.tx_params()
+
+    # --- Sign with consecutive nonces and broadcast back-to-back ---
+    sent, txns = [], {}
+    with _send_lock:
+        nonce = w3.eth.get_transaction_count(account.address, "pending")
+        for r in valid:
+            try:
+                txn = dao_contract.functions.vote(r["proposal_id"], r["support"]).build_transaction({
+                    'from': account.address,
+                    'nonce': nonce,
+                    'gas': gas_to_use,
+                    **fee_params,
+                })
+                r["tx_hash"] = _sign_and_send(txn)
+                txns[r["tx_hash"]] = txn
+            except Exception as e:
+                # Later nonces would be stuck behind the gap: stop sending
+                log.warning("Vote batch send failed at proposal %d: %s", r["proposal_id"], e)
+                r["error"] = str(e)
+                break
+            r["status"] = "pending"
+            sent.append(r)
+            nonce += 1
+    for r in valid[len(sent):]:
+        r["status"] = "not_sent"
+        r["error"] = r["error"] or "Not sent after an earlier send failure"
+    log.info("Vote batch sent", extra={"votes": len(votes), "sent": len(sent), "first_nonce": nonce - len(sent)})
+
+    # --- Await all receipts together, replacing votes that stay pending with bumped fees ---
+    outstanding = {r["tx_hash"]: r for r in sent}  # every sent version of a vote -> its result
+    deadline = time.monotonic() + receipt_timeout
+    bump_at, bumps = time.monotonic() + FEE_BUMP_AFTER, 0
+    while outstanding and time.monotonic() < deadline:
+        for tx_hash, r in list(outstanding.items()):
+            if tx_hash not in outstanding:
+                continue  # another version of this vote was mined in this pass
+            try:
+                receipt = w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                continue
+            for other in [h for h, o in outstanding.items() if o is r]:
+                del outstanding[other]
+            r["tx_hash"] = tx_hash
+            if receipt.status == 0:
+                r["status"], r["error"] = "reverted", "Vote transaction reverted on-chain!"
+            elif not decode_receipt(receipt, "Voted"):
+                r["status"], r["error"] = "reverted", "Vote transaction mined without a Voted event"
+            else:
+                r["status"] = "mined"
+        if outstanding and bumps < FEE_MAX_BUMPS and time.monotonic() >= bump_at:
+            bumps += 1
+            bump_at = time.monotonic() + FEE_BUMP_AFTER
+            replaced = 0
+            for r in {id(r): r for r in outstanding.values()}.values():
+                txn = txns[r["tx_hash"]]
+                txn = {**txn, **fees.bump(txn)}
+                try:
+                    r["tx_hash"] = _sign_and_send(txn)
+                except Exception as e:
+                    log.info("Fee bump for nonce %d not sent: %s", txn['nonce'], e)
+                    continue
+                txns[r["tx_hash"]] = txn
+                outstanding[r["tx_hash"]] = r
+                replaced += 1
+            if replaced:
+                log.warning("%d votes pending for %ds; replaced with higher fees", replaced, FEE_BUMP_AFTER * bumps)
+        if outstanding:
+            time.sleep(poll_interval)
+    pending = {id(r): r for r in outstanding.values()}.values()
+    for r in pending:
+        r["error"] = f"No receipt within {receipt_timeout:g}s"
+    log.info("Vote batch mined", extra={"mined": sum(r["status"] == "mined" for r in results),
+                                        "pending": len(pending)})
+    return results
+
+
+def execution_events(receipt) -> dict:
+    """Decoded ProposalExecuted / FundsReleased args of an executeProposal receipt, grouped by event name."""
+    events = {}
+    for ev in decode_receipt(receipt, "ProposalExecuted", "FundsReleased"):
+        events.setdefault(ev["event"], []).append(ev["args"])
+    log.info("Execution events", extra={"events": events})
+    return events
+
+
 def execute_proposal(proposal_id: int):
     """
-    Execute a proposal on-chain. Returns the real transaction hash.
+    Execute a proposal on-chain.
+    Returns (tx_hash, events) where events maps event name -> list of decoded args.
     """
     try:
         # --- Read proposal metadata and validate execution pre-conditions ---
@@ -284,9 +620,10 @@ def execute_proposal(proposal_id: int):
             yes_votes = int(p[6])
             no_votes = int(p[7])
             executed = bool(p[8])
-            print(f"🔎 Proposal {proposal_id}: block_start={block_start}, block_end={block_end}, yes={yes_votes}, no={no_votes}, executed={executed}")
+            log.debug("Proposal %d: block_start=%d block_end=%d yes=%d no=%d executed=%s",
+                      proposal_id, block_start, block_end, yes_votes, no_votes, executed)
         except Exception as e:
-            print(f"⚠️ Could not fetch proposal metadata: {e}")
+            log.warning("Could not fetch proposal %d metadata: %s", proposal_id, e)
             raise Exception("Failed to fetch proposal metadata")
 
         # Basic checks mirroring contract require()s
@@ -294,7 +631,7 @@ def execute_proposal(proposal_id: int):
             raise Exception("Proposal already executed")
 
         current_block = w3.eth.block_number
-        print(f"🔎 Current block: {current_block}")
+        log.debug("Current block: %d", current_block)
         if current_block <= block_end:
             raise Exception("Voting not ended; cannot execute yet")
 
@@ -303,18 +640,13 @@ def execute_proposal(proposal_id: int):
 
         # --- Ensure the DAO is the owner of the Treasury contract (otherwise releaseFunds will revert) ---
         try:
-            treasury_addr = Web3.to_checksum_address(TREASURY_CONTRACT_ADDRESS)
-            treasury_abi_min = [
-                {"inputs": [], "name": "owner", "outputs": [{"internalType": "address", "name": "", "type": "address"}], "stateMutability": "view", "type": "function"},
-                {"inputs": [], "name": "getBalance", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}
-            ]
-            treasury_contract = w3.eth.contract(address=treasury_addr, abi=treasury_abi_min)
+            treasury_addr = treasury_contract.address
             treasury_owner = treasury_contract.functions.owner().call()
-            print(f"🔎 Treasury owner: {treasury_owner}")
+            log.debug("Treasury owner: %s", treasury_owner)
             if treasury_owner.lower() != Web3.to_checksum_address(DAO_CONTRACT).lower():
                 raise Exception(f"DAO ({DAO_CONTRACT}) is not owner of Treasury ({treasury_owner}); execution will likely revert")
         except Exception as e:
-            print(f"⚠️ Could not verify treasury ownership: {e}")
+            log.warning("Could not verify treasury ownership: %s", e)
             raise Exception("Failed to verify treasury ownership")
 
         # --- If the proposal targets the Treasury, decode callData to determine requested amount and
@@ -333,100 +665,82 @@ def execute_proposal(proposal_id: int):
                 try:
                     recipient_addr, amount_wei = w3.codec.decode_abi(['address', 'uint256'], params_bytes)
                     amount_wei = int(amount_wei)
-                    print(f"🔎 Proposal calls Treasury.releaseFunds -> recipient={recipient_addr}, amount_wei={amount_wei}, amount_eth={w3.from_wei(amount_wei,'ether')}")
+                    log.debug("Proposal calls Treasury.releaseFunds: recipient=%s amount_wei=%d", recipient_addr, amount_wei)
                     treasury_balance_wei = int(w3.eth.get_balance(treasury_addr))
-                    print(f"🔎 Treasury balance (wei): {treasury_balance_wei}, (CELO): {w3.from_wei(treasury_balance_wei,'ether')}")
+                    log.debug("Treasury balance: %d wei", treasury_balance_wei)
                     if treasury_balance_wei < amount_wei:
                         raise Exception(f"Treasury has insufficient funds: {w3.from_wei(treasury_balance_wei,'ether')} CELO < required {w3.from_wei(amount_wei,'ether')} CELO")
                 except Exception as e:
-                    print(f"⚠️ Could not decode Treasury callData or validate balance: {e}")
+                    log.warning("Could not decode Treasury callData or validate balance: %s", e)
         except Exception as e:
-            print(f"⚠️ Error while inspecting proposal target/callData: {e}")
+            log.warning("Error while inspecting proposal target/callData: %s", e)
 
         # --- Simulation to surface revert reasons and estimate gas ---
         try:
             dao_contract.functions.executeProposal(proposal_id).call({'from': account.address})
             gas_estimate = dao_contract.functions.executeProposal(proposal_id).estimate_gas({'from': account.address})
             gas_to_use = gas_estimate + 100000
-            print(f"✅ Execute simulation passed. Gas estimate: {gas_estimate}, using gas: {gas_to_use}")
+            log.debug("Execute simulation passed; gas estimate %d, using %d", gas_estimate, gas_to_use)
         except ContractLogicError as cle:
-            print(f"❌ Execute simulation failed (ContractLogicError): {cle}")
             # Decode revert reason if possible
-            if hasattr(cle, 'args') and len(cle.args) > 1:
-                revert_reason = cle.args[1]
-                print(f"🔎 Revert reason: {revert_reason}")
+            revert_reason = cle.args[1] if hasattr(cle, 'args') and len(cle.args) > 1 else None
+            log.warning("Execute simulation reverted: %s", cle, extra={"revert_reason": revert_reason})
             raise Exception("Simulation failed due to contract logic error")
         except Exception as e:
-            print(f"⚠️ Execute simulation/estimate failed: {e}")
+            log.warning("Execute simulation/estimate failed: %s", e)
             raise Exception("Simulation or gas estimation failed")
 
         # --- Build, sign & send ---
         try:
             txn = dao_contract.functions.executeProposal(proposal_id).build_transaction({
                 'from': account.address,
-                'nonce': w3.eth.get_transaction_count(account.address),
                 'gas': gas_to_use,
-                'gasPrice': w3.eth.gas_price
+                **fees.tx_params(),
             })
-            signed = w3.eth.account.sign_transaction(txn, PRIVATE_KEY)
-            tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
-
-            receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
-            print("⛏️ Execution mined. Status:", receipt.status)
+            tx_hash, receipt = send_transaction(txn)
+            log.info("Execution mined", extra={"tx_hash": tx_hash, "status": receipt.status})
 
             if receipt.status == 0:
-                try:
-                    print("Raw logs:", receipt.get('logs'))
-                except Exception:
-                    pass
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("Reverted execution logs: %s", receipt.get('logs'))
                 raise Exception("Execute transaction reverted on-chain!")
 
-            events = None
-            try:
-                events = dao_contract.events.ProposalExecuted().process_receipt(receipt)
-                print("📣 ProposalExecuted events:", events)
-            except Exception as e:
-                print(f"⚠️ Could not parse ProposalExecuted event: {e}")
-
-            return w3.to_hex(tx_hash), events
+            return tx_hash, execution_events(receipt)
 
         except Exception as e:
-            print(f"❌ Transaction signing or sending failed: {e}")
+            log.error("Execute transaction signing or sending failed: %s", e)
             raise Exception("Failed to sign or send transaction")
 
     except Exception as e:
-        print(f"❌ Execute transaction failed: {e}")
-        traceback.print_exc()
+        log.exception("Execute transaction failed: %s", e)
         raise
 
 
+# Concurrent reads of the same proposal share one eth_call
+proposal_reads = SingleFlight("proposal_read")
+
+
+def read_proposal(proposal_id: int):
+    """Raw `proposals(id)` tuple, coalesced with identical in-flight reads."""
+    return proposal_reads.do(proposal_id, dao_contract.functions.proposals(proposal_id).call)
+
+
 def get_proposal(proposal_id: int):
     """
-    Return a human-friendly proposal dict for a given proposal_id.
-    Optimized with better error handling and timeout management.
+    Return the ProposalRecord for a given proposal_id, or None if it cannot be read.
+    Use `record.to_api()` for the JSON shape.
     """
     try:
-        p = dao_contract.functions.proposals(proposal_id).call()
-        return {
-            "target": p[0],
-            "value": w3.from_wei(p[1], 'ether'),
-            "callData": p[2],
-            "description": p[3],
-            "blockStart": p[4],
-            "blockEnd": p[5],
-            "yesVotes": p[6],
-            "noVotes": p[7],
-            "executed": p[8]
-        }
+        return ProposalRecord.from_chain(proposal_id, read_proposal(proposal_id))
     except Exception as e:
-        print(f"❌ Failed to get proposal {proposal_id}: {e}")
+        log.warning("Failed to get proposal %d: %s", proposal_id, e, extra={"sample_key": "get_proposal"})
         return None
 
 
 def get_proposals_batch(proposal_ids: list) -> dict:
     """
     Fetch multiple proposals in parallel using ThreadPoolExecutor.
-    Returns dict mapping proposal_id -> proposal_data
+    Returns dict mapping proposal_id -> ProposalRecord
     """
     results = {}
     
@@ -435,7 +749,7 @@ def get_proposals_batch(proposal_ids: list) -> dict:
     
     # Use ThreadPoolExecutor for parallel fetching (max 10 concurrent)
     with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = {executor.submit(fetch_single, pid): pid for pid in proposal_ids}
+        futures = {executor.submit(bind(fetch_single), pid): pid for pid in proposal_ids}
         
         for future in as_completed(futures, timeout=100):
             try:
@@ -443,7 +757,7 @@ def get_proposals_batch(proposal_ids: list) -> dict:
                 if data:
                     results[pid] = data
             except Exception as e:
-                print(f"Error fetching proposal in batch: {e}")
+                log.warning("Error fetching proposal in batch: %s", e, extra={"sample_key": "get_proposals_batch"})
                 continue
     
     return results
@@ -451,19 +765,17 @@ def get_proposals_batch(proposal_ids: list) -> dict:
 
 def get_proposal_status(proposal_id: int):
     try:
-        p = dao_contract.functions.proposals(proposal_id).call()
-        # p: target, value, callData, description, blockStart, blockEnd, yesVotes, noVotes, executed
+        p = ProposalRecord.from_chain(proposal_id, read_proposal(proposal_id))
         return {
             "proposal_id": proposal_id,
-            "yes_votes": int(p[6]),
-            "no_votes": int(p[7]),
-            "executed": bool(p[8]),
-            "block_start": int(p[4]),
-            "block_end": int(p[5])
+            "yes_votes": p.yes_votes,
+            "no_votes": p.no_votes,
+            "executed": p.executed,
+            "block_start": p.block_start,
+            "block_end": p.block_end
         }
     except Exception as e:
-        print(f"❌ Failed to get proposal status: {e}")
-        traceback.print_exc()
+        log.warning("Failed to get proposal %d status: %s", proposal_id, e, exc_info=True, extra={"sample_key": "get_proposal_status"})
         return None
 
 
@@ -474,29 +786,21 @@ def get_treasury_balance():
         balance_wei = w3.eth.get_balance(treasury_addr)
         return int(balance_wei)
     except Exception as e:
-        print(f"❌ Failed to get treasury balance: {e}")
-        traceback.print_exc()
+        log.warning("Failed to get treasury balance: %s", e, exc_info=True, extra={"sample_key": "get_treasury_balance"})
         return None
 
 
 def get_treasury_info():
     """Return treasury address, owner and balances (wei and eth)."""
     try:
-        treasury_addr = Web3.to_checksum_address(TREASURY_CONTRACT_ADDRESS)
-        treasury_abi_min = [
-            {"inputs": [], "name": "owner", "outputs": [{"internalType": "address", "name": "", "type": "address"}], "stateMutability": "view", "type": "function"},
-            {"inputs": [], "name": "getBalance", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}
-        ]
-        tc = w3.eth.contract(address=treasury_addr, abi=treasury_abi_min)
-        owner = tc.functions.owner().call()
-        bal = int(tc.functions.getBalance().call())
+        owner = treasury_contract.functions.owner().call()
+        bal = int(treasury_contract.functions.getBalance().call())
         return {
-            "treasury": treasury_addr,
+            "treasury": treasury_contract.address,
             "owner": owner,
             "balance_wei": bal,
             "balance_eth": float(w3.from_wei(bal, 'ether'))
         }
     except Exception as e:
-        print(f"❌ Failed to get treasury info: {e}")
-        traceback.print_exc()
+        log.warning("Failed to get treasury info: %s", e, exc_info=True, extra={"sample_key": "get_treasury_info"})
         return None
\ No newline at end of file
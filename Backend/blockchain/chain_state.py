@@ -0,0 +1,195 @@
+# backend/blockchain/chain_state.py
+"""
+Proposals, vote tallies and the treasury snapshot derived from the chain,
+kept current from the chain watcher and persisted for fast restarts.
+
+On first start the proposals are read once at a pinned block; afterwards
+ProposalCreated / Voted / ProposalExecuted events update the table in place.
+The state is written to a binary snapshot (storage/chain_snapshot.py) every
+CHAIN_SNAPSHOT_INTERVAL seconds and on shutdown, and a restart loads it and
+resumes the watcher from the snapshot checkpoint instead of re-reading history.
+Pre-images of the rows changed in the last CHAIN_REORG_DEPTH blocks are kept
+so a reorg rolls the table back to the fork point before it is replayed.
+"""
+import os
+import threading
+import time
+from collections import deque
+from typing import Optional
+from web3 import Web3
+from blockchain.celo_interact import w3, dao_contract
+from blockchain.chain_watcher import chain_watcher, DEEP_REORG, REORG_DEPTH
+from blockchain.proposal_record import ProposalRecord, ProposalTable
+from blockchain.treasury_watcher import treasury_watcher
+from storage.chain_snapshot import SnapshotError, read_snapshot, write_snapshot
+from utils.config_loader import get_settings
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+settings = get_settings()
+SNAPSHOT_PATH = settings.data_path(settings.chain_snapshot_path)
+SNAPSHOT_INTERVAL = settings.chain_snapshot_interval
+
+BOOTSTRAP_BATCH = 100
+
+
+class ChainState:
+
+    def __init__(self, watcher, treasury, path: str = SNAPSHOT_PATH, snapshot_interval: float = SNAPSHOT_INTERVAL,
+                 reorg_depth: int = REORG_DEPTH):
+        self.watcher = watcher
+        self.treasury = treasury
+        self.path = path
+        self.snapshot_interval = snapshot_interval
+        self.reorg_depth = reorg_depth
+        self.proposals = ProposalTable()
+        self.next_proposal_id = 0
+        self.checkpoint = None  # every event up to this block is applied
+        self._undo = deque()  # (block, proposal_id, pre-image or None), oldest first
+        self._lock = threading.Lock()
+        self._saved_at = time.monotonic()
+        watcher.add_listener(self.on_blocks)
+        watcher.add_reorg_listener(self.on_reorg)
+
+    @property
+    def ready(self) -> bool:
+        """True while the table is current: the watcher runs, is caught up and its latest range is applied."""
+        return (self.watcher.running and self.watcher.behind == 0
+                and self.checkpoint is not None and self.checkpoint == self.watcher.head)
+
+    # --- Snapshot ---
+
+    def load(self):
+        """
+        Load the snapshot if there is one. Returns (start_block, block_hashes) for
+        `chain_watcher.start`, or (None, None) to start from the head and bootstrap.
+        """
+        if not os.path.exists(self.path):
+            return None, None
+        start = time.perf_counter()
+        try:
+            snap = read_snapshot(self.path, Web3.to_checksum_address)
+        except (OSError, SnapshotError) as e:
+            log.warning("Ignoring chain snapshot %s: %s", self.path, e)
+            return None, None
+        with self._lock:
+            for record in snap["records"]:
+                self.proposals.put(record)
+            self.next_proposal_id = snap["next_proposal_id"]
+            self.checkpoint = snap["checkpoint"]
+            self._undo = deque(snap["undo"])
+        if snap["treasury"]:
+            self.treasury.restore(snap["treasury"])
+        log.info("Chain snapshot loaded", extra={"checkpoint": self.checkpoint, "proposals": len(self.proposals),
+                                                 "ms": round((time.perf_counter() - start) * 1000, 1)})
+        return self.checkpoint + 1, snap["block_hashes"]
+
+    def save(self):
+        if self.checkpoint is None:
+            return
+        with self._lock:
+            args = (self.checkpoint, self.next_proposal_id, self.watcher.block_hashes(),
+                    self.proposals.records(), list(self._undo))
+        write_snapshot(self.path, *args, treasury=self.treasury.snapshot())
+        self._saved_at = time.monotonic()
+        log.debug("Chain snapshot saved at block %d", args[0])
+
+    # --- Bootstrap ---
+
+    def bootstrap(self, block: int):
+        """Read every proposal as of `block` (batched) and make it the checkpoint."""
+        next_id = dao_contract.functions.nextProposalId().call(block_identifier=block)
+        log.info("Bootstrapping chain state: %d proposals at block %d", next_id, block)
+        table = ProposalTable()
+        for start in range(0, next_id, BOOTSTRAP_BATCH):
+            ids = range(start, min(start + BOOTSTRAP_BATCH, next_id))
+            with w3.batch_requests() as batch:
+                for pid in ids:
+                    batch.add(dao_contract.functions.proposals(pid).call(block_identifier=block))
+                results = batch.execute()
+            for pid, p in zip(ids, results):
+                table.put(ProposalRecord.from_chain(pid, p))
+        with self._lock:
+            self.proposals = table
+            self.next_proposal_id = next_id
+            self.checkpoint = block
+            self._undo.clear()
+
+    # --- Watcher listeners ---
+
+    def on_blocks(self, from_block: int, to_block: int, events: list):
+        if self.checkpoint is None:
+            self.bootstrap(from_block - 1)
+        if to_block <= self.checkpoint:
+            return  # already applied (e.g. replay right after loading a snapshot)
+
+        created = [int(e["args"]["id"]) for e in events
+                   if e["event"] == "ProposalCreated" and e["blockNumber"] > self.checkpoint]
+        # Immutable fields of new proposals; tallies start at zero and follow the events
+        fetched = {}
+        if created:
+            with w3.batch_requests() as batch:
+                for pid in created:
+                    batch.add(dao_contract.functions.proposals(pid))
+                fetched = dict(zip(created, batch.execute()))
+
+        with self._lock:
+            for ev in events:
+                block = ev["blockNumber"]
+                if block <= self.checkpoint or ev["address"] != dao_contract.address:
+                    continue
+                name, args = ev["event"], ev["args"]
+                if name not in ("ProposalCreated", "Voted", "ProposalExecuted"):
+                    continue
+                pid = int(args["id"])
+                self._undo.append((block, pid, self.proposals.get(pid)))
+                record = self.proposals.get(pid)
+                if name == "ProposalCreated":
+                    p = fetched[pid]
+                    record = ProposalRecord.from_chain(pid, (p[0], p[1], p[2], p[3], args["blockStart"],
+                                                             args["blockEnd"], 0, 0, False))
+                    self.next_proposal_id = max(self.next_proposal_id, pid + 1)
+                elif record is None:
+                    continue
+                elif name == "Voted":
+                    if args["support"]:
+                        record.yes_votes += 1
+                    else:
+                        record.no_votes += 1
+                else:
+                    record.executed = True
+                self.proposals.put(record)
+            self.checkpoint = to_block
+            while self._undo and self._undo[0][0] <= to_block - self.reorg_depth:
+                self._undo.popleft()
+
+        if time.monotonic() - self._saved_at >= self.snapshot_interval:
+            self.save()
+
+    def on_reorg(self, fork_block: Optional[int]):
+        with self._lock:
+            if self.checkpoint is None:
+                return
+            deep = fork_block is DEEP_REORG or fork_block <= self.checkpoint - self.reorg_depth
+            if not deep and fork_block > self.checkpoint:
+                return
+            if deep:
+                # Deeper than the undo window: rebuild from the node on the next range
+                log.error("Reorg deeper than the undo window; rebuilding chain state")
+                self.proposals = ProposalTable()
+                self.checkpoint = None
+                self._undo.clear()
+                return
+            while self._undo and self._undo[-1][0] >= fork_block:
+                _, pid, record = self._undo.pop()
+                if record is None:
+                    self.proposals.discard(pid)
+                else:
+                    self.proposals.put(record)
+            self.next_proposal_id = max((r.proposal_id + 1 for r in self.proposals.records()), default=0)
+            self.checkpoint = fork_block - 1
+        log.info("Chain state rolled back to block %d", fork_block - 1)
+
+
+chain_state = ChainState(chain_watcher, treasury_watcher)
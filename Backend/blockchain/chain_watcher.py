@@ -0,0 +1,211 @@
+# backend/blockchain/chain_watcher.py
+"""
+Follows new blocks on the configured node and dispatches decoded DAO/Treasury
+logs to registered listeners, so every consumer shares a single polling loop.
+The hashes of recently processed blocks are kept to detect reorgs; listeners
+registered with `add_reorg_listener` are told where the chain forked.
+"""
+import threading
+import time
+from collections import OrderedDict
+from blockchain.celo_interact import w3, dao_contract, treasury_contract, decode_logs
+from utils.config_loader import get_settings
+from utils.logger import get_logger
+from utils.metrics import REGISTRY
+
+log = get_logger(__name__)
+
+settings = get_settings()
+POLL_INTERVAL = settings.watcher_poll_interval
+MAX_BLOCK_RANGE = settings.watcher_max_block_range
+WATCHER_ENABLED = settings.watcher_enabled
+BLOCK_TIME = settings.block_time_seconds
+REORG_DEPTH = settings.chain_reorg_depth
+
+CHAIN_REORGS = REGISTRY.counter("echodao_chain_reorgs_total", "Chain reorganisations detected by the watcher")
+
+# Passed to reorg listeners instead of a fork block when no recorded block is still
+# canonical: the fork is older than the reorg window, so state derived from any
+# block may be stale and has to be rebuilt from the node
+DEEP_REORG = None
+
+
+class ChainWatcher:
+    """
+    Polls `eth_blockNumber`, fetches the DAO and Treasury logs for every new block
+    range with one `eth_getLogs` call and hands the decoded events to listeners.
+
+    Listeners are called as `listener(from_block, to_block, events)` from the
+    watcher thread and must not block for long.
+
+    Each poll checks that the block it processed last still has the same hash.
+    If not, the newest recorded block still on the canonical chain is found,
+    reorg listeners are called as `listener(fork_block)` (every block from
+    `fork_block` on was replaced) and the replaced range is processed again.
+    If none of them is, listeners get `listener(DEEP_REORG)` and must rebuild.
+    """
+
+    def __init__(self, poll_interval: float = POLL_INTERVAL, max_block_range: int = MAX_BLOCK_RANGE,
+                 reorg_depth: int = REORG_DEPTH):
+        self.poll_interval = poll_interval
+        self.max_block_range = max_block_range
+        self.reorg_depth = reorg_depth
+        self.addresses = [dao_contract.address, treasury_contract.address]
+        self.head = None  # last fully processed block
+        self.head_seen_at = None
+        self.behind = None  # blocks between head and the node's latest after the last poll
+        self._hashes = OrderedDict()  # block -> hash of processed range ends within the reorg window
+        self._listeners = []
+        self._reorg_listeners = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def indexed_block(self):
+        """(head, time it was processed) while running, else (None, None). Used as a cache key."""
+        if not self.running or self.head is None:
+            return None, None
+        return self.head, self.head_seen_at
+
+    def add_listener(self, listener):
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def add_reorg_listener(self, listener):
+        with self._lock:
+            self._reorg_listeners.append(listener)
+
+    def block_hashes(self) -> list:
+        """[(block, hash)] of the recent blocks that will be checked for reorgs, oldest first."""
+        with self._lock:
+            return list(self._hashes.items())
+
+    def start(self, start_block: int = None, block_hashes=None):
+        """
+        Start following the chain from `start_block` (defaults to the current head).
+        `block_hashes` ([(block, hash)] from a snapshot) are re-checked on the first poll.
+        """
+        if self.running:
+            return
+        if start_block is not None:
+            self.head = start_block - 1
+        if block_hashes:
+            with self._lock:
+                self._hashes = OrderedDict((b, bytes(h)) for b, h in block_hashes if b <= self.head)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="chain-watcher", daemon=True)
+        self._thread.start()
+        log.info("Chain watcher started (poll every %ss)", self.poll_interval)
+
+    def stop(self, timeout: float = 5):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def poll_once(self) -> int:
+        """Process at most `max_block_range` new blocks. Returns how many blocks are still behind."""
+        known_hash = self._hashes.get(self.head) if self.head is not None else None
+        if known_hash is None:
+            latest = w3.eth.block_number
+        else:
+            # Check the last processed block in the same round trip as the head
+            with w3.batch_requests() as batch:
+                batch.add(w3.eth.get_block_number())
+                batch.add(w3.eth.get_block(self.head))
+                latest, head_block = batch.execute()
+            if bytes(head_block["hash"]) != known_hash:
+                self._rewind()
+                return 1
+        if self.head is None:
+            self.head = latest - 1
+        if latest <= self.head:
+            self.behind = 0
+            return 0
+
+        from_block = self.head + 1
+        to_block = min(latest, from_block + self.max_block_range - 1)
+        with w3.batch_requests() as batch:
+            batch.add(w3.eth.get_logs({"fromBlock": from_block, "toBlock": to_block, "address": self.addresses}))
+            batch.add(w3.eth.get_block(to_block))
+            logs, block = batch.execute()
+        events = decode_logs(logs)
+        self._remember(to_block, bytes(block["hash"]))
+
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(from_block, to_block, events)
+            except Exception as e:
+                log.exception("Chain watcher listener %s failed: %s", getattr(listener, '__name__', listener), e)
+
+        self.head = to_block
+        self.head_seen_at = time.time()
+        self.behind = latest - to_block
+        return self.behind
+
+    def _remember(self, block: int, block_hash: bytes):
+        with self._lock:
+            self._hashes[block] = block_hash
+            while len(self._hashes) > 1 and next(iter(self._hashes)) <= block - self.reorg_depth:
+                self._hashes.popitem(last=False)
+
+    def _rewind(self):
+        """The last processed block was replaced: find the fork point, notify listeners and step back."""
+        with self._lock:
+            recorded = list(self._hashes.items())
+        with w3.batch_requests() as batch:
+            for block, _ in recorded:
+                batch.add(w3.eth.get_block(block))
+            canonical = batch.execute()
+
+        fork = None
+        for (block, block_hash), current in reversed(list(zip(recorded, canonical))):
+            if bytes(current["hash"]) == block_hash:
+                fork = block + 1
+                break
+        CHAIN_REORGS.inc()
+        if fork is None:
+            # The real fork point is unknown: replay the window and have listeners rebuild
+            log.error("Chain reorg at block %d is deeper than the %d-block window; rebuilding derived state",
+                      self.head, self.reorg_depth)
+            fork, notify = recorded[0][0], DEEP_REORG
+        else:
+            log.warning("Chain reorg detected at block %d; reprocessing from block %d", self.head, fork,
+                        extra={"depth": self.head - fork + 1})
+            notify = fork
+
+        with self._lock:
+            for block in [b for b in self._hashes if b >= fork]:
+                del self._hashes[block]
+            listeners = list(self._reorg_listeners)
+        for listener in listeners:
+            try:
+                listener(notify)
+            except Exception as e:
+                log.exception("Chain watcher reorg listener %s failed: %s", getattr(listener, '__name__', listener), e)
+        self.head = fork - 1
+        self.head_seen_at = time.time()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                # Catch up without sleeping while we are behind the node
+                if self.poll_once() > 0:
+                    continue
+            except Exception as e:
+                log.warning("Chain watcher poll failed: %s", e, extra={"sample_key": "chain_watcher_poll"})
+            self._stop.wait(self.poll_interval)
+
+
+chain_watcher = ChainWatcher()
@@ -0,0 +1,120 @@
+# backend/blockchain/export.py
+"""
+Chunked iterators over the full proposal, vote and treasury-event history,
+shared by the /export endpoints and `tools/export.py`.
+
+Every iterator yields lists of flat row dicts and holds at most one chunk in
+memory. Event rows are in chain order and carry (block, log_index), which is
+the `after` cursor to resume an interrupted export exactly where it stopped.
+Votes come from the local vote index when it covers the requested range and
+from chunked eth_getLogs otherwise; treasury events always come from logs.
+"""
+from blockchain.celo_interact import (
+    w3, dao_contract, treasury_contract, decode_logs, event_topic, get_proposals_batch, iter_logs,
+)
+from blockchain.chain_state import chain_state
+from blockchain.vote_indexer import vote_indexer, VOTES_START_BLOCK, VOTES_LOG_CHUNK
+
+PROPOSAL_FIELDS = ("proposal_id", "target", "value_wei", "value", "callData", "description",
+                   "blockStart", "blockEnd", "yesVotes", "noVotes", "executed")
+VOTE_FIELDS = ("proposal_id", "voter", "support", "block", "log_index", "tx_hash")
+TREASURY_FIELDS = ("event", "address", "amount_wei", "block", "log_index", "tx_hash")
+
+
+def _proposal_row(record) -> dict:
+    row = record.to_api()
+    row["value_wei"] = str(record.value_wei)  # may exceed 64 bits
+    return row
+
+
+def iter_proposals(chunk_size: int = 500, after: int = None, table=None, next_proposal_id: int = None):
+    """
+    Proposals in id order, starting after proposal id `after`. Served from `table`
+    (default: the chain state while it is current), otherwise read from the node.
+    """
+    if table is None and chain_state.ready:
+        table, next_proposal_id = chain_state.proposals, chain_state.next_proposal_id
+    if table is None:
+        next_proposal_id = dao_contract.functions.nextProposalId().call()
+    start = 0 if after is None else after + 1
+    for chunk_start in range(start, next_proposal_id, chunk_size):
+        ids = range(chunk_start, min(chunk_start + chunk_size, next_proposal_id))
+        if table is not None:
+            records = [table.get(pid) for pid in ids]
+        else:
+            batch = get_proposals_batch(list(ids))
+            records = [batch.get(pid) for pid in ids]
+        yield [_proposal_row(r) for r in records if r is not None]
+
+
+def vote_source(from_block: int = None, to_block: int = None) -> str:
+    """'local' when the vote index covers [from_block, to_block], else 'logs'."""
+    if vote_indexer.store is None:
+        return "logs"
+    # The index starts at VOTES_START_BLOCK: anything earlier is only on the node
+    if from_block is not None and from_block < (VOTES_START_BLOCK or 0):
+        return "logs"
+    checkpoint = vote_indexer.store.checkpoint
+    if checkpoint is not None and (to_block is None or to_block <= checkpoint):
+        return "local"
+    return "logs"
+
+
+def resolve_range(from_block: int = None, to_block: int = None, source: str = "logs"):
+    """Default range: VOTES_START_BLOCK up to the local checkpoint (local) or the node head (logs)."""
+    if from_block is None:
+        from_block = VOTES_START_BLOCK or 0
+    if to_block is None:
+        to_block = vote_indexer.store.checkpoint if source == "local" else w3.eth.block_number
+    return from_block, to_block
+
+
+def _after(rows, after):
+    if after is None:
+        return rows
+    return [r for r in rows if (r["block"], r["log_index"]) > tuple(after)]
+
+
+def iter_votes(from_block: int, to_block: int, chunk_size: int = 1000, after=None, source: str = "local"):
+    if source == "local":
+        store = vote_indexer.store
+        cursor = tuple(after) if after else None
+        while True:
+            rows = store.votes_in_blocks(from_block, to_block, chunk_size, cursor)
+            if not rows:
+                return
+            yield rows
+            cursor = (rows[-1]["block"], rows[-1]["log_index"])
+
+    topics = [event_topic(dao_contract, "Voted")]
+    start = max(from_block, after[0]) if after else from_block
+    for _, _, logs in iter_logs(start, to_block, dao_contract.address, topics, VOTES_LOG_CHUNK):
+        rows = [{
+            "proposal_id": int(ev["args"]["id"]),
+            "voter": ev["args"]["voter"].lower(),
+            "support": bool(ev["args"]["support"]),
+            "block": ev["blockNumber"],
+            "log_index": ev["logIndex"],
+            "tx_hash": ev["transactionHash"],
+        } for ev in decode_logs(logs, ("Voted",))]
+        rows = _after(rows, after)
+        for i in range(0, len(rows), chunk_size):
+            yield rows[i:i + chunk_size]
+
+
+def iter_treasury_events(from_block: int, to_block: int, after=None):
+    """Received / FundsReleased events of the treasury in chain order, one eth_getLogs range per chunk."""
+    topics = [[event_topic(treasury_contract, "Received"), event_topic(treasury_contract, "FundsReleased")]]
+    start = max(from_block, after[0]) if after else from_block
+    for _, _, logs in iter_logs(start, to_block, treasury_contract.address, topics, VOTES_LOG_CHUNK):
+        rows = [{
+            "event": ev["event"],
+            "address": ev["args"].get("sender") or ev["args"].get("to"),
+            "amount_wei": str(ev["args"]["amount"]),
+            "block": ev["blockNumber"],
+            "log_index": ev["logIndex"],
+            "tx_hash": ev["transactionHash"],
+        } for ev in decode_logs(logs, ("Received", "FundsReleased"))]
+        rows = _after(rows, after)
+        if rows:
+            yield rows
@@ -0,0 +1,124 @@
+# backend/blockchain/fees.py
+"""
+Transaction fee strategy for the backend account.
+
+Fees are EIP-1559 (`maxFeePerGas` / `maxPriorityFeePerGas`) derived from one
+`eth_feeHistory` call, cached for a block time and shared by every write in
+that window, instead of an `eth_gasPrice` read per transaction:
+
+- the priority fee is the median, over the last FEE_HISTORY_BLOCKS blocks, of
+  the tip paid at the speed's reward percentile;
+- the max fee is the next block's base fee times the speed's headroom plus the
+  priority fee, so the transaction stays includable while the base fee rises.
+
+The chain id is read once. `bump()` returns the fees for a replacement of a
+stuck transaction (same nonce), raised enough for nodes to accept it. Nodes
+without `eth_feeHistory` fall back to legacy `gasPrice`, cached the same way;
+a failed `eth_feeHistory` call only does so until the cache next expires.
+"""
+import statistics
+import threading
+import time
+from utils.config_loader import get_settings
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+settings = get_settings()
+FEE_SPEED = settings.fee_speed
+FEE_HISTORY_BLOCKS = settings.fee_history_blocks
+
+# speed -> (tip percentile of recent blocks, base fee headroom)
+SPEEDS = {
+    "slow": (10, 1.25),  # includable while the base fee rises ~2 blocks in a row
+    "standard": (50, 2.0),  # ~6 full blocks
+    "fast": (90, 2.0),
+}
+PERCENTILES = sorted({p for p, _ in SPEEDS.values()})
+# Nodes only replace a pending transaction when both fees rise by at least 10%
+BUMP_FACTOR = 1.125
+METHOD_NOT_FOUND = -32601
+
+
+def _method_not_found(exc: Exception) -> bool:
+    """Whether the node answered that the method does not exist (JSON-RPC -32601)."""
+    error = (getattr(exc, "rpc_response", None) or {}).get("error")
+    return isinstance(error, dict) and error.get("code") == METHOD_NOT_FOUND
+
+
+class FeeStrategy:
+
+    def __init__(self, w3, cache_ttl: float = settings.block_time_seconds, history_blocks: int = FEE_HISTORY_BLOCKS,
+                 default_speed: str = FEE_SPEED):
+        self.w3 = w3
+        self.cache_ttl = cache_ttl
+        self.history_blocks = history_blocks
+        self.default_speed = default_speed
+        self.eip1559 = True
+        self._chain_id = None
+        self._history = None  # (fetched at, newest block, next base fee, {percentile: median tip}) or legacy gas price
+        self._lock = threading.Lock()
+
+    @property
+    def chain_id(self) -> int:
+        if self._chain_id is None:
+            self._chain_id = self.w3.eth.chain_id
+        return self._chain_id
+
+    def _fetch(self):
+        if self.eip1559:
+            try:
+                history = self.w3.eth.fee_history(self.history_blocks, "latest", PERCENTILES)
+            except Exception as e:
+                if _method_not_found(e):
+                    log.warning("eth_feeHistory not supported by the node; using legacy gasPrice")
+                    self.eip1559 = False
+                else:
+                    # Timeouts and server errors: legacy fees for this window only, retried on the next miss
+                    log.warning("eth_feeHistory failed (%s); using legacy gasPrice for now", e)
+            else:
+                rewards = history.get("reward") or []
+                tips = {}
+                for i, percentile in enumerate(PERCENTILES):
+                    values = [int(block[i]) for block in rewards if len(block) > i]
+                    tips[percentile] = int(statistics.median(values)) if values else 0
+                newest = int(history["oldestBlock"]) + len(history["baseFeePerGas"]) - 2
+                return newest, int(history["baseFeePerGas"][-1]), tips
+        return None, int(self.w3.eth.gas_price), None
+
+    def _current(self):
+        """Fee history for the latest block, fetched at most once per `cache_ttl` seconds."""
+        with self._lock:
+            if self._history is None or time.monotonic() - self._history[0] >= self.cache_ttl:
+                self._history = (time.monotonic(), *self._fetch())
+            return self._history[1:]
+
+    def fees(self, speed: str = None) -> dict:
+        """Fee fields for a new transaction at `speed` ("slow", "standard" or "fast")."""
+        percentile, headroom = SPEEDS[speed or self.default_speed]
+        _, base_fee, tips = self._current()
+        if tips is None:
+            return {"gasPrice": base_fee}
+        priority = tips[percentile]
+        if not priority:
+            # Empty blocks report no tips; fall back to the node's suggestion
+            priority = int(self.w3.eth.max_priority_fee)
+        return {"maxFeePerGas": int(base_fee * headroom) + priority, "maxPriorityFeePerGas": priority}
+
+    def tx_params(self, speed: str = None) -> dict:
+        """Chain id and fees for `build_transaction`, so it makes no extra RPC calls for them."""
+        return {"chainId": self.chain_id, **self.fees(speed)}
+
+    def bump(self, txn: dict, speed: str = None) -> dict:
+        """
+        Fee fields for replacing the pending `txn` (same nonce): at least BUMP_FACTOR
+        times its fees, and no less than the current fees for `speed`.
+        """
+        current = self.fees(speed)
+        if "gasPrice" in txn:
+            price = max(int(txn["gasPrice"] * BUMP_FACTOR) + 1, current.get("gasPrice", current.get("maxFeePerGas", 0)))
+            return {"gasPrice": price}
+        priority = max(int(txn["maxPriorityFeePerGas"] * BUMP_FACTOR) + 1,
+                       current.get("maxPriorityFeePerGas", current.get("gasPrice", 0)))
+        max_fee = max(int(txn["maxFeePerGas"] * BUMP_FACTOR) + 1, current.get("maxFeePerGas", current.get("gasPrice", 0)))
+        return {"maxFeePerGas": max(max_fee, priority), "maxPriorityFeePerGas": priority}
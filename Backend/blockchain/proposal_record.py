@@ -0,0 +1,150 @@
+# backend/blockchain/proposal_record.py
+"""
+Compact in-memory representation of DAO proposals.
+
+`ProposalRecord` is a `__slots__` object holding exactly what the contract returns:
+wei as int, callData as raw bytes and the target address interned, so thousands
+of proposals for the same treasury share one string. `ProposalTable` stores many
+proposals column-wise (typed arrays for the numeric fields, a bytearray for the
+flags), indexed directly by proposal id. Conversion to the JSON shape the API
+returns happens only in `to_api()`.
+"""
+import sys
+import threading
+from array import array
+
+WEI_PER_ETHER = 10 ** 18
+
+
+def intern_address(address: str) -> str:
+    return sys.intern(address)
+
+
+class ProposalRecord:
+    __slots__ = ("proposal_id", "target", "value_wei", "call_data", "description",
+                 "block_start", "block_end", "yes_votes", "no_votes", "executed")
+
+    def __init__(self, proposal_id, target, value_wei, call_data, description,
+                 block_start, block_end, yes_votes, no_votes, executed):
+        self.proposal_id = proposal_id
+        self.target = target
+        self.value_wei = value_wei
+        self.call_data = call_data
+        self.description = description
+        self.block_start = block_start
+        self.block_end = block_end
+        self.yes_votes = yes_votes
+        self.no_votes = no_votes
+        self.executed = executed
+
+    @classmethod
+    def from_chain(cls, proposal_id: int, p) -> "ProposalRecord":
+        """
+        Build from the `proposals(id)` call result:
+        (target, value, callData, description, blockStart, blockEnd, yesVotes, noVotes, executed)
+        """
+        return cls(proposal_id, intern_address(p[0]), int(p[1]), bytes(p[2]), p[3],
+                   int(p[4]), int(p[5]), int(p[6]), int(p[7]), bool(p[8]))
+
+    @property
+    def value_eth(self) -> float:
+        # int / int true division is correctly rounded, same as float(from_wei(...))
+        return self.value_wei / WEI_PER_ETHER
+
+    def to_api(self) -> dict:
+        """JSON shape of ProposalDetailResponse."""
+        return {
+            "proposal_id": self.proposal_id,
+            "target": self.target,
+            "value": self.value_eth,
+            "callData": "0x" + self.call_data.hex(),
+            "description": self.description,
+            "blockStart": self.block_start,
+            "blockEnd": self.block_end,
+            "yesVotes": self.yes_votes,
+            "noVotes": self.no_votes,
+            "executed": self.executed,
+        }
+
+    def __eq__(self, other):
+        if not isinstance(other, ProposalRecord):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    def __repr__(self):
+        return f"ProposalRecord(id={self.proposal_id}, value_wei={self.value_wei}, executed={self.executed})"
+
+
+class ProposalTable:
+    """
+    Column store of proposals indexed by proposal id (ids are dense, 0..N).
+    `get()` materializes a ProposalRecord on demand; rows never stored return None.
+    """
+
+    def __init__(self):
+        self._present = bytearray()
+        self._executed = bytearray()
+        self._block_start = array("Q")
+        self._block_end = array("Q")
+        self._yes_votes = array("Q")
+        self._no_votes = array("Q")
+        self._value_wei = []  # may exceed 64 bits
+        self._target = []
+        self._call_data = []
+        self._description = []
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def _grow(self, size: int):
+        missing = size - len(self._present)
+        if missing <= 0:
+            return
+        self._present.extend(bytes(missing))
+        self._executed.extend(bytes(missing))
+        for column in (self._block_start, self._block_end, self._yes_votes, self._no_votes):
+            column.frombytes(bytes(missing * column.itemsize))
+        for column in (self._value_wei, self._target, self._call_data, self._description):
+            column.extend([None] * missing)
+
+    def put(self, record: ProposalRecord):
+        i = record.proposal_id
+        with self._lock:
+            self._grow(i + 1)
+            if not self._present[i]:
+                self._count += 1
+            self._present[i] = 1
+            self._executed[i] = record.executed
+            self._block_start[i] = record.block_start
+            self._block_end[i] = record.block_end
+            self._yes_votes[i] = record.yes_votes
+            self._no_votes[i] = record.no_votes
+            self._value_wei[i] = record.value_wei
+            self._target[i] = record.target
+            self._call_data[i] = record.call_data
+            self._description[i] = record.description
+
+    def discard(self, proposal_id: int):
+        i = proposal_id
+        with self._lock:
+            if 0 <= i < len(self._present) and self._present[i]:
+                self._present[i] = 0
+                self._count -= 1
+                self._value_wei[i] = self._target[i] = self._call_data[i] = self._description[i] = None
+
+    def records(self):
+        """All stored rows in id order, as ProposalRecords."""
+        return [self.get(i) for i in range(len(self._present)) if self._present[i]]
+
+    def get(self, proposal_id: int):
+        i = proposal_id
+        if i < 0 or i >= len(self._present) or not self._present[i]:
+            return None
+        return ProposalRecord(i, self._target[i], self._value_wei[i], self._call_data[i], self._description[i],
+                              self._block_start[i], self._block_end[i], self._yes_votes[i], self._no_votes[i],
+                              bool(self._executed[i]))
+
+    def __contains__(self, proposal_id: int) -> bool:
+        return 0 <= proposal_id < len(self._present) and bool(self._present[proposal_id])
+
+    def __len__(self) -> int:
+        return self._count
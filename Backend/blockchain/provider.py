@@ -0,0 +1,42 @@
+# backend/blockchain/provider.py
+"""
+HTTP provider that records per-JSON-RPC-method call counts, latency and errors,
+and an "rpc" span per call when the request is being profiled.
+"""
+import time
+from web3 import HTTPProvider
+from utils.metrics import RPC_CALLS, RPC_ERRORS, RPC_DURATION
+from utils.profiling import span
+
+
+class InstrumentedHTTPProvider(HTTPProvider):
+
+    def make_request(self, method, params):
+        start = time.perf_counter()
+        try:
+            with span("rpc", method):
+                response = super().make_request(method, params)
+        except Exception:
+            RPC_ERRORS.inc(method=method)
+            raise
+        finally:
+            RPC_CALLS.inc(method=method)
+            RPC_DURATION.observe(time.perf_counter() - start, method=method)
+        if isinstance(response, dict) and response.get("error"):
+            RPC_ERRORS.inc(method=method)
+        return response
+
+    def make_batch_request(self, batch_requests):
+        start = time.perf_counter()
+        try:
+            with span("rpc", f"batch[{len(batch_requests)}]"):
+                return super().make_batch_request(batch_requests)
+        except Exception:
+            RPC_ERRORS.inc(method="batch")
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            RPC_CALLS.inc(method="batch")
+            RPC_DURATION.observe(elapsed, method="batch")
+            for method, _ in batch_requests:
+                RPC_CALLS.inc(method=method)
@@ -0,0 +1,310 @@
+# backend/blockchain/stats.py
+"""
+Governance and treasury aggregates maintained incrementally from the chain watcher.
+
+Governance counters (proposals, votes, pass rate, executions) follow the chain
+state table; treasury totals (inflow, outflow, released per recipient, flows
+per block bucket) follow Received / FundsReleased events, which are kept in a
+local ledger (storage/treasury_ledger.py) so the totals survive restarts and
+can be rolled back on a reorg. Reads are a copy of the counters and never
+touch the node or scan history.
+"""
+import heapq
+import threading
+from collections import OrderedDict
+from typing import Optional
+from blockchain.celo_interact import w3, dao_contract, treasury_contract, decode_logs, event_topic, iter_logs
+from blockchain.chain_state import chain_state
+from blockchain.chain_watcher import chain_watcher, DEEP_REORG
+from blockchain.vote_indexer import VOTES_START_BLOCK, VOTES_LOG_CHUNK
+from storage.treasury_ledger import TreasuryLedger, TRANSFER_EVENTS
+from utils.config_loader import get_settings
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+settings = get_settings()
+STATS_STORE_PATH = settings.data_path(settings.stats_store_path)
+STATS_BUCKET_BLOCKS = settings.stats_bucket_blocks
+
+
+class GovernanceStats:
+    """
+    A proposal is closed once its voting period is over (blockEnd <= head) and
+    passed if it closed with more yes than no votes, as `executeProposal` requires.
+    """
+
+    def __init__(self):
+        self.proposals = 0
+        self.executed = 0
+        self.yes_votes = 0
+        self.no_votes = 0
+        self.closed = 0
+        self.passed = 0
+        self.block = None  # chain state checkpoint these counters reflect
+        self._open = []  # heap of (block_end, proposal_id) still being voted on
+
+    @classmethod
+    def from_table(cls, table, block: int) -> "GovernanceStats":
+        """Counters for the whole proposal table as of `block` (one pass over the table)."""
+        stats = cls()
+        for record in table.records():
+            stats.proposals += 1
+            stats.executed += record.executed
+            stats.yes_votes += record.yes_votes
+            stats.no_votes += record.no_votes
+            stats._open.append((record.block_end, record.proposal_id))
+        heapq.heapify(stats._open)
+        stats.close_until(table, block)
+        stats.block = block
+        return stats
+
+    def apply(self, events: list, table):
+        for ev in events:
+            if ev["address"] != dao_contract.address:
+                continue
+            name, args = ev["event"], ev["args"]
+            if name == "ProposalCreated":
+                self.proposals += 1
+                heapq.heappush(self._open, (int(args["blockEnd"]), int(args["id"])))
+            elif name not in ("Voted", "ProposalExecuted") or int(args["id"]) not in table:
+                continue
+            elif name == "Voted":
+                if args["support"]:
+                    self.yes_votes += 1
+                else:
+                    self.no_votes += 1
+            else:
+                self.executed += 1
+
+    def close_until(self, table, block: int):
+        while self._open and self._open[0][0] <= block:
+            _, pid = heapq.heappop(self._open)
+            record = table.get(pid)
+            if record is None:
+                continue
+            self.closed += 1
+            self.passed += record.yes_votes > record.no_votes
+
+    def to_api(self) -> dict:
+        votes = self.yes_votes + self.no_votes
+        return {
+            "proposals": self.proposals,
+            "open": len(self._open),
+            "closed": self.closed,
+            "passed": self.passed,
+            "executed": self.executed,
+            "pass_rate": self.passed / self.closed if self.closed else None,
+            "votes": votes,
+            "yes_votes": self.yes_votes,
+            "no_votes": self.no_votes,
+            "average_turnout": votes / self.proposals if self.proposals else None,
+        }
+
+
+class TreasuryStats:
+    def __init__(self, bucket_blocks: int = STATS_BUCKET_BLOCKS):
+        self.bucket_blocks = bucket_blocks
+        self.inflow_wei = 0
+        self.outflow_wei = 0
+        self.inflows = 0
+        self.outflows = 0
+        self.recipients = {}  # address -> [released wei, releases]
+        self.buckets = OrderedDict()  # first block of bucket -> [inflow wei, outflow wei], in block order
+
+    def add(self, row: dict, sign: int = 1):
+        amount = sign * row["amount_wei"]
+        bucket_start = row["block"] - row["block"] % self.bucket_blocks
+        if bucket_start not in self.buckets:
+            self.buckets[bucket_start] = [0, 0]
+        bucket = self.buckets[bucket_start]
+        if row["inflow"]:
+            self.inflow_wei += amount
+            self.inflows += sign
+            bucket[0] += amount
+        else:
+            self.outflow_wei += amount
+            self.outflows += sign
+            bucket[1] += amount
+            recipient = self.recipients.setdefault(row["address"], [0, 0])
+            recipient[0] += amount
+            recipient[1] += sign
+            if not recipient[1]:
+                del self.recipients[row["address"]]
+        if bucket == [0, 0] and sign < 0:
+            del self.buckets[bucket_start]
+
+    def to_api(self, recipients: int, buckets: int) -> dict:
+        top = heapq.nlargest(recipients, self.recipients.items(), key=lambda item: item[1][0])
+        recent = []
+        for start in reversed(self.buckets):
+            if len(recent) >= buckets:
+                break
+            inflow, outflow = self.buckets[start]
+            recent.append({"from_block": start, "to_block": start + self.bucket_blocks - 1,
+                           "inflow_wei": str(inflow), "outflow_wei": str(outflow)})
+        return {
+            "inflow_wei": str(self.inflow_wei),
+            "outflow_wei": str(self.outflow_wei),
+            "inflows": self.inflows,
+            "outflows": self.outflows,
+            "recipients": len(self.recipients),
+            "top_recipients": [{"address": address, "released_wei": str(wei), "releases": count}
+                               for address, (wei, count) in top],
+            "bucket_blocks": self.bucket_blocks,
+            "flows": recent[::-1],
+        }
+
+
+class StatsAggregator:
+    """
+    Listener on the shared chain watcher, registered after the chain state so
+    every range it sees is already applied to the proposal table. The ledger is
+    opened with `open()` at app startup, before the watcher starts. Transfers
+    missing from the ledger (first start, downtime) are read by a background
+    backfill the same way the vote index fills its gaps, so the watcher thread
+    never waits on historical eth_getLogs.
+    """
+
+    def __init__(self, watcher, state, start_block: int = VOTES_START_BLOCK, chunk_size: int = VOTES_LOG_CHUNK):
+        self.ledger = None
+        self.state = state
+        self.start_block = start_block
+        self.chunk_size = chunk_size
+        self.governance = GovernanceStats()
+        self.treasury = TreasuryStats()
+        self.treasury_block = None  # every transfer up to this block is counted
+        self.live_from = None
+        self.live_head = None
+        self.backfilling = False
+        self._resets = 0  # bumped when a deep reorg clears the ledger under a running backfill
+        self._lock = threading.Lock()
+        self._thread = None
+        watcher.add_listener(self.on_blocks)
+        watcher.add_reorg_listener(self.on_reorg)
+
+    def open(self, path: str = STATS_STORE_PATH):
+        """Open the treasury ledger and load its totals."""
+        if self.ledger is not None:
+            return
+        ledger = TreasuryLedger(path)
+        treasury = TreasuryStats()
+        for row in ledger.transfers():
+            treasury.add(row)
+        with self._lock:
+            self.ledger, self.treasury, self.treasury_block = ledger, treasury, ledger.checkpoint
+
+    @property
+    def ready(self) -> bool:
+        return self.state.ready and self.governance.block == self.state.checkpoint
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._backfill_safe, name="treasury-backfill", daemon=True)
+        self._thread.start()
+
+    def on_blocks(self, from_block: int, to_block: int, events: list):
+        transfers = [e for e in events if e["address"] == treasury_contract.address]
+        table, state_block = self.state.proposals, self.state.checkpoint
+        with self._lock:
+            if self.live_from is None:
+                self.live_from = from_block
+            self.live_head = to_block
+            checkpoint = self.ledger.checkpoint
+            indexed_to = self.start_block - 1 if checkpoint is None else checkpoint
+            contiguous = not self.backfilling and indexed_to >= from_block - 1
+            backfilling = self.backfilling
+            # Ranges past the checkpoint are stored (and counted) right away; the
+            # checkpoint jumps over them once the backfill meets them
+            for row in self.ledger.add_transfers(transfers, checkpoint=to_block if contiguous else None):
+                self.treasury.add(row)
+            if contiguous:
+                self.treasury_block = to_block
+            if state_block is not None:
+                if self.governance.block == from_block - 1 and state_block == to_block:
+                    self.governance.apply(events, table)
+                    self.governance.close_until(table, to_block)
+                    self.governance.block = to_block
+                elif self.governance.block != state_block:
+                    self.governance = GovernanceStats.from_table(table, state_block)
+        if not contiguous and not backfilling:
+            # First start or downtime: read the missing transfers in the background
+            self.start()
+
+    def on_reorg(self, fork_block: Optional[int]):
+        with self._lock:
+            if fork_block is DEEP_REORG:
+                # No known fork point: read every transfer again from the start block
+                self.ledger.clear()
+                removed = []
+                self.treasury = TreasuryStats(self.treasury.bucket_blocks)
+                self.treasury_block = self.live_from = self.live_head = None
+                self._resets += 1
+                log.warning("Treasury ledger cleared after a deep reorg; re-reading from block %d", self.start_block)
+            else:
+                removed = self.ledger.rollback(fork_block)
+                for row in removed:
+                    self.treasury.add(row, sign=-1)
+                if self.treasury_block is not None:
+                    self.treasury_block = min(self.treasury_block, fork_block - 1)
+                if self.live_head is not None and self.live_head >= fork_block:
+                    self.live_head = fork_block - 1
+            # The chain state has already rolled back (or dropped its table for a rebuild)
+            if self.state.checkpoint is None:
+                self.governance = GovernanceStats()
+            else:
+                self.governance = GovernanceStats.from_table(self.state.proposals, self.state.checkpoint)
+        if removed:
+            log.info("Removed %d treasury transfers from replaced blocks >= %d", len(removed), fork_block)
+
+    def backfill(self):
+        """Read the treasury transfers the ledger is missing, up to where live ranges took over (or the head)."""
+        topics = [[event_topic(treasury_contract, name) for name in TRANSFER_EVENTS]]
+        with self._lock:
+            self.backfilling = True
+        try:
+            while True:
+                resets = self._resets
+                checkpoint = self.ledger.checkpoint
+                start = self.start_block if checkpoint is None else checkpoint + 1
+                target = self.live_from - 1 if self.live_from is not None else w3.eth.block_number
+                if start > target:
+                    break
+                log.info("Backfilling treasury transfers %d-%d", start, target)
+                for _, chunk_end, logs in iter_logs(start, target, treasury_contract.address, topics, self.chunk_size):
+                    events = decode_logs(logs, TRANSFER_EVENTS)
+                    with self._lock:
+                        if self._resets != resets:
+                            break  # cleared by a deep reorg: start over
+                        for row in self.ledger.add_transfers(events, checkpoint=chunk_end):
+                            self.treasury.add(row)
+                        self.treasury_block = chunk_end
+                if self.live_from is None and self._resets == resets:
+                    break
+        finally:
+            with self._lock:
+                self.backfilling = False
+                checkpoint = self.ledger.checkpoint
+                if self.live_head is not None and checkpoint is not None and checkpoint >= self.live_from - 1:
+                    self.ledger.add_transfers([], checkpoint=self.live_head)
+                    self.treasury_block = self.live_head
+
+    def _backfill_safe(self):
+        try:
+            self.backfill()
+            log.info("Treasury ledger caught up to block %s", self.ledger.checkpoint)
+        except Exception as e:
+            log.exception("Treasury backfill failed: %s", e)
+
+    def snapshot(self, recipients: int = 10, buckets: int = 30) -> dict:
+        with self._lock:
+            return {
+                "block": self.governance.block,
+                "treasury_block": self.treasury_block,
+                "governance": self.governance.to_api(),
+                "treasury": self.treasury.to_api(recipients, buckets),
+            }
+
+
+stats = StatsAggregator(chain_watcher, chain_state)
@@ -0,0 +1,142 @@
+# backend/blockchain/treasury_watcher.py
+"""
+Keeps the latest Treasury snapshot (owner, balance, last Received/FundsReleased)
+in memory, refreshed by the chain watcher once per new block range.
+"""
+import threading
+import time
+from typing import Optional
+from blockchain.celo_interact import w3, treasury_contract
+from blockchain.chain_watcher import chain_watcher, DEEP_REORG
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+class TreasuryWatcher:
+    """
+    Listener on the shared chain watcher. The balance is read at the end of every
+    processed block range and the owner is only re-read after an
+    OwnershipTransferred event, so API reads never touch the node while it runs.
+    """
+
+    def __init__(self, watcher):
+        self.watcher = watcher
+        self._snapshot = None
+        self._cond = threading.Condition()
+        self._subscribers = []
+        watcher.add_listener(self.on_blocks)
+        watcher.add_reorg_listener(self.on_reorg)
+
+    @property
+    def running(self) -> bool:
+        return self.watcher.running and self._snapshot is not None
+
+    def subscribe(self, callback):
+        """Register `callback(snapshot)`, called from the watcher thread whenever the treasury changes."""
+        with self._cond:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._cond:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def snapshot(self):
+        """Return a copy of the latest snapshot, or None if the watcher has not produced one yet."""
+        with self._cond:
+            return dict(self._snapshot) if self._snapshot else None
+
+    def balance_wei(self) -> int:
+        """Treasury balance from the snapshot when available, otherwise a direct node read."""
+        snap = self.snapshot() if self.watcher.running else None
+        if snap is not None:
+            return snap["balance_wei"]
+        return int(w3.eth.get_balance(treasury_contract.address))
+
+    def wait_for_balance(self, min_wei: int, timeout: float = 15):
+        """
+        Block until the observed balance is at least `min_wei` or `timeout` expires.
+        Returns the last known balance in wei. Without a running watcher this is a
+        single node read.
+        """
+        if not self.watcher.running:
+            return int(w3.eth.get_balance(treasury_contract.address))
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._snapshot is not None and self._snapshot["balance_wei"] >= min_wei,
+                timeout=max(0, deadline - time.monotonic()),
+            )
+            return self._snapshot["balance_wei"] if self._snapshot else None
+
+    def restore(self, snapshot: dict):
+        """Serve a persisted snapshot until the watcher publishes a fresh one."""
+        with self._cond:
+            if self._snapshot is None:
+                self._snapshot = dict(snapshot)
+
+    def refresh(self, block_identifier="latest"):
+        """Read owner and balance from the node and publish a full snapshot."""
+        owner = treasury_contract.functions.owner().call(block_identifier=block_identifier)
+        balance = int(w3.eth.get_balance(treasury_contract.address, block_identifier))
+        self._publish({"owner": owner, "balance_wei": balance}, block_identifier)
+
+    def on_blocks(self, from_block: int, to_block: int, events: list):
+        treasury_events = [e for e in events if e["address"] == treasury_contract.address]
+        if self._snapshot is None:
+            self.refresh(to_block)
+            return
+
+        update = {"balance_wei": int(w3.eth.get_balance(treasury_contract.address, to_block))}
+        for ev in treasury_events:
+            if ev["event"] == "OwnershipTransferred":
+                update["owner"] = ev["args"]["newOwner"]
+            elif ev["event"] in ("Received", "FundsReleased"):
+                update["last_event"] = {
+                    "event": ev["event"],
+                    "address": ev["args"].get("sender") or ev["args"].get("to"),
+                    "amount_wei": int(ev["args"]["amount"]),
+                    "block": ev["blockNumber"],
+                    "tx_hash": ev["transactionHash"],
+                }
+        self._publish(update, to_block)
+
+    def on_reorg(self, fork_block: Optional[int]):
+        # Owner and last event may come from replaced blocks: re-read instead of rolling back
+        if self._snapshot is None:
+            return
+        if fork_block is DEEP_REORG:
+            self.refresh()
+        elif (self._snapshot.get("block") or 0) >= fork_block:
+            self.refresh(fork_block - 1)
+
+    def _publish(self, update: dict, block):
+        with self._cond:
+            previous = self._snapshot or {}
+            snapshot = {
+                "treasury": treasury_contract.address,
+                "owner": update.get("owner", previous.get("owner")),
+                "balance_wei": update["balance_wei"],
+                "balance_eth": float(w3.from_wei(update["balance_wei"], 'ether')),
+                "block": block if isinstance(block, int) else previous.get("block"),
+                "last_event": update.get("last_event", previous.get("last_event")),
+                "updated_at": time.time(),
+            }
+            changed = (
+                snapshot["balance_wei"] != previous.get("balance_wei")
+                or snapshot["owner"] != previous.get("owner")
+                or snapshot["last_event"] != previous.get("last_event")
+            )
+            self._snapshot = snapshot
+            self._cond.notify_all()
+            subscribers = list(self._subscribers) if changed else []
+
+        for callback in subscribers:
+            try:
+                callback(dict(snapshot))
+            except Exception as e:
+                log.exception("Treasury subscriber failed: %s", e)
+
+
+treasury_watcher = TreasuryWatcher(chain_watcher)
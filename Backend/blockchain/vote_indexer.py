@@ -0,0 +1,120 @@
+# backend/blockchain/vote_indexer.py
+"""
+Fills the local vote store: a one-off chunked eth_getLogs backfill from the
+last checkpoint, then live `Voted` events from the shared chain watcher.
+"""
+import threading
+from typing import Optional
+from blockchain.celo_interact import w3, dao_contract, decode_logs, event_topic, iter_logs
+from blockchain.chain_watcher import chain_watcher, DEEP_REORG
+from storage.vote_store import VoteStore
+from utils.config_loader import get_settings
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+settings = get_settings()
+VOTE_STORE_PATH = settings.data_path(settings.vote_store_path)
+VOTES_START_BLOCK = settings.votes_start_block
+VOTES_LOG_CHUNK = settings.votes_log_chunk
+
+
+class VoteIndexer:
+    """
+    The store checkpoint always means "every vote up to this block is indexed".
+    Live ranges that arrive while the backfill is still running are stored
+    immediately and the checkpoint jumps over them once the backfill meets them.
+    The store is opened with `open()` at app startup, before the watcher starts.
+    """
+
+    def __init__(self, watcher, start_block: int = VOTES_START_BLOCK, chunk_size: int = VOTES_LOG_CHUNK):
+        self.store = None
+        self.start_block = start_block
+        self.chunk_size = chunk_size
+        self.live_from = None
+        self.live_head = None
+        self.backfilling = False
+        self._resets = 0  # bumped when a deep reorg clears the store under a running backfill
+        self._lock = threading.Lock()
+        self._thread = None
+        watcher.add_listener(self.on_blocks)
+        watcher.add_reorg_listener(self.on_reorg)
+
+    def open(self, path: str = VOTE_STORE_PATH):
+        if self.store is None:
+            self.store = VoteStore(path)
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._backfill_safe, name="vote-backfill", daemon=True)
+        self._thread.start()
+
+    def on_blocks(self, from_block: int, to_block: int, events: list):
+        votes = [e for e in events if e["event"] == "Voted" and e["address"] == dao_contract.address]
+        with self._lock:
+            if self.live_from is None:
+                self.live_from = from_block
+            self.live_head = to_block
+            checkpoint = self.store.checkpoint
+            indexed_to = self.start_block - 1 if checkpoint is None else checkpoint
+            contiguous = not self.backfilling and indexed_to >= from_block - 1
+            backfilling = self.backfilling
+        self.store.add_votes(votes, checkpoint=to_block if contiguous else None)
+        if not contiguous and not backfilling:
+            # Live indexing started past the checkpoint: fill the gap in the background
+            self.start()
+
+    def on_reorg(self, fork_block: Optional[int]):
+        with self._lock:
+            if fork_block is DEEP_REORG:
+                # No known fork point: index everything again from the start block
+                self.store.clear()
+                self.live_from = self.live_head = None
+                self._resets += 1
+                log.warning("Vote index cleared after a deep reorg; re-indexing from block %d", self.start_block)
+                return
+            removed = self.store.rollback(fork_block)
+            if self.live_head is not None and self.live_head >= fork_block:
+                self.live_head = fork_block - 1
+        if removed:
+            log.info("Removed %d votes from replaced blocks >= %d", removed, fork_block)
+
+    def backfill(self):
+        """Index historical votes from the checkpoint up to where live indexing took over (or the head)."""
+        topics = [event_topic(dao_contract, "Voted")]
+        with self._lock:
+            self.backfilling = True
+        try:
+            while True:
+                resets = self._resets
+                checkpoint = self.store.checkpoint
+                start = self.start_block if checkpoint is None else checkpoint + 1
+                target = self.live_from - 1 if self.live_from is not None else w3.eth.block_number
+                if start > target:
+                    break
+                log.info("Backfilling votes %d-%d", start, target)
+                for _, chunk_end, logs in iter_logs(start, target, dao_contract.address, topics, self.chunk_size):
+                    votes = decode_logs(logs, ("Voted",))
+                    with self._lock:
+                        if self._resets != resets:
+                            break  # cleared by a deep reorg: start over
+                        self.store.add_votes(votes, checkpoint=chunk_end)
+                if self.live_from is None and self._resets == resets:
+                    break
+        finally:
+            with self._lock:
+                self.backfilling = False
+                checkpoint = self.store.checkpoint
+                if self.live_head is not None and checkpoint is not None and checkpoint >= self.live_from - 1:
+                    self.store.add_votes([], checkpoint=self.live_head)
+
+    def _backfill_safe(self):
+        try:
+            self.backfill()
+            log.info("Vote index caught up to block %s", self.store.checkpoint)
+        except Exception as e:
+            log.exception("Vote backfill failed: %s", e)
+
+
+vote_indexer = VoteIndexer(chain_watcher)
@@ -0,0 +1,40 @@
+# backend/routes/admin_routes.py
+import hmac
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from typing import Literal, Optional
+from utils.config_loader import get_settings
+from utils.profiling import profiler
+
+router = APIRouter()
+
+settings = get_settings()
+
+
+def require_admin(x_profile_token: Optional[str] = Header(None)):
+    """Admin routes need the profiling token; without one configured they do not exist."""
+    if not settings.profiling_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not hmac.compare_digest((x_profile_token or "").encode(), settings.profiling_token.encode()):
+        raise HTTPException(status_code=403, detail="Invalid profiling token")
+
+
+@router.get("/profiles", dependencies=[Depends(require_admin)])
+def list_profiles():
+    """Summaries of the buffered request profiles, newest first."""
+    return {"profiles": profiler.profiles()}
+
+
+@router.get("/profiles/{profile_id}", dependencies=[Depends(require_admin)])
+def get_profile(profile_id: int, format: Literal["json", "collapsed"] = "json", top: int = Query(50, ge=1, le=1000)):
+    """
+    One profile: its span tree (RPC, IPFS, model and pipeline stages) and the
+    `top` most frequent sampled stacks. `format=collapsed` returns every sample
+    in the collapsed-stack format for flamegraph tools.
+    """
+    profile = profiler.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found (it may have been evicted)")
+    if format == "collapsed":
+        return PlainTextResponse(profile.collapsed())
+    return profile.to_api(top)
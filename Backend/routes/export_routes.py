@@ -0,0 +1,60 @@
+# backend/routes/export_routes.py
+"""
+Bulk exports of proposals, votes and treasury events as NDJSON or CSV.
+
+Responses stream one chunk at a time (see blockchain/export.py). Event exports
+report the last block of their range in `X-To-Block`; to resume an interrupted
+download, repeat the request with the same `to_block` and `after` set to the
+"block:log_index" of the last row received.
+"""
+from fastapi import APIRouter, HTTPException, Query
+from typing import Literal, Optional
+from blockchain import export
+from utils.export_formats import streaming_response
+from utils.profiling import run_in_threadpool
+
+router = APIRouter()
+
+
+def _parse_cursor(after: Optional[str]):
+    if after is None:
+        return None
+    try:
+        block, log_index = after.split(":")
+        return int(block), int(log_index)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid 'after' cursor")
+
+
+@router.get("/proposals")
+async def export_proposals(format: Literal["ndjson", "csv"] = "ndjson", chunk_size: int = Query(500, ge=1, le=5000),
+                           after: Optional[int] = Query(None, ge=-1)):
+    """Every proposal in id order, starting after proposal id `after`."""
+    return streaming_response(export.iter_proposals(chunk_size, after), format, export.PROPOSAL_FIELDS)
+
+
+@router.get("/votes")
+async def export_votes(from_block: Optional[int] = Query(None, ge=0), to_block: Optional[int] = Query(None, ge=0),
+                       after: Optional[str] = None, source: Literal["auto", "local", "logs"] = "auto",
+                       format: Literal["ndjson", "csv"] = "ndjson", chunk_size: int = Query(1000, ge=1, le=10000)):
+    """
+    Voted events in [from_block, to_block] in chain order. `source=auto` reads the
+    local vote index when it covers the range and eth_getLogs otherwise.
+    """
+    if source == "auto":
+        source = export.vote_source(from_block, to_block)
+    elif source == "local" and export.vote_source(from_block, to_block) != "local":
+        raise HTTPException(status_code=409, detail="The local vote index does not cover this range yet")
+    from_block, to_block = await run_in_threadpool(export.resolve_range, from_block, to_block, source)
+    chunks = export.iter_votes(from_block, to_block, chunk_size, _parse_cursor(after), source)
+    return streaming_response(chunks, format, export.VOTE_FIELDS,
+                              headers={"X-To-Block": str(to_block), "X-Export-Source": source})
+
+
+@router.get("/treasury")
+async def export_treasury(from_block: Optional[int] = Query(None, ge=0), to_block: Optional[int] = Query(None, ge=0),
+                          after: Optional[str] = None, format: Literal["ndjson", "csv"] = "ndjson"):
+    """Treasury Received / FundsReleased events in [from_block, to_block] in chain order."""
+    from_block, to_block = await run_in_threadpool(export.resolve_range, from_block, to_block, "logs")
+    chunks = export.iter_treasury_events(from_block, to_block, _parse_cursor(after))
+    return streaming_response(chunks, format, export.TREASURY_FIELDS, headers={"X-To-Block": str(to_block)})
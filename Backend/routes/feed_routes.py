@@ -0,0 +1,74 @@
+# backend/routes/feed_routes.py
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from blockchain.chain_watcher import chain_watcher
+from blockchain.celo_interact import dao_contract
+from blockchain.treasury_watcher import treasury_watcher
+from utils.broadcaster import EventBroadcaster
+from utils.config_loader import get_settings
+
+router = APIRouter()
+
+settings = get_settings()
+feed = EventBroadcaster(
+    buffer_size=settings.feed_client_buffer,
+    max_subscribers=settings.feed_max_clients,
+)
+
+FEED_EVENTS = {"ProposalCreated", "Voted", "ProposalExecuted", "TreasuryUpdated"}
+
+
+def _on_chain_events(from_block: int, to_block: int, events: list):
+    """Chain watcher listener: forward decoded DAO events to every connected client."""
+    for ev in events:
+        if ev["address"] != dao_contract.address or ev["event"] not in FEED_EVENTS:
+            continue
+        feed.publish_threadsafe(ev["event"], {
+            **ev["args"],
+            "block": ev["blockNumber"],
+            "tx_hash": ev["transactionHash"],
+            "log_index": ev["logIndex"],
+        })
+
+
+def _on_treasury_update(snapshot: dict):
+    feed.publish_threadsafe("TreasuryUpdated", snapshot)
+
+
+chain_watcher.add_listener(_on_chain_events)
+treasury_watcher.subscribe(_on_treasury_update)
+
+
+@router.get("/events")
+async def event_stream(events: Optional[str] = Query(None, description="Comma-separated event names to receive")):
+    """
+    Server-Sent Events stream of ProposalCreated, Voted, ProposalExecuted and
+    TreasuryUpdated messages, fed from the single chain watcher.
+    """
+    wanted = None
+    if events:
+        wanted = {e.strip() for e in events.split(",") if e.strip()}
+        unknown = wanted - FEED_EVENTS
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown events: {', '.join(sorted(unknown))}")
+
+    sub = feed.subscribe(wanted)
+    if sub is None:
+        raise HTTPException(status_code=503, detail="Too many feed subscribers", headers={"Retry-After": "30"})
+
+    return StreamingResponse(
+        feed.stream(sub),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/stats")
+async def feed_stats():
+    """Subscriber count and number of messages published since startup."""
+    return {
+        "subscribers": feed.subscriber_count,
+        "published": feed.published,
+        "watcher_head": chain_watcher.head,
+    }
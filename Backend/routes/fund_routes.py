@@ -1,15 +1,24 @@
 # backend/routes/fund_routes.py
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 from blockchain.celo_interact import get_treasury_balance, get_proposal_status, get_treasury_info
+from blockchain.chain_watcher import chain_watcher, BLOCK_TIME
+from blockchain.treasury_watcher import treasury_watcher
+from utils.logger import get_logger
+from utils.profiling import bind
+from utils.response_cache import ResponseCache
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
 router = APIRouter()
+log = get_logger(__name__)
 
 # Thread pool for running blocking blockchain calls
 executor = ThreadPoolExecutor(max_workers=5)
 
+# Serialized responses reused until the chain watcher indexes a new block
+response_cache = ResponseCache(chain_watcher.indexed_block, block_time=BLOCK_TIME)
+
 class BalanceResponse(BaseModel):
     balance_wei: int
     balance_eth: float
@@ -18,12 +27,16 @@ class BalanceResponse(BaseModel):
 async def treasury_balance():
     """
     Returns current treasury balance (on Celo / local node).
-    Optimized with async execution.
+    Served from the treasury watcher snapshot; falls back to a node read.
     """
     try:
+        snapshot = treasury_watcher.snapshot() if treasury_watcher.running else None
+        if snapshot:
+            return {"balance_wei": snapshot["balance_wei"], "balance_eth": snapshot["balance_eth"]}
+
         # Run blocking call in thread pool
         loop = asyncio.get_event_loop()
-        bal = await loop.run_in_executor(executor, get_treasury_balance)
+        bal = await loop.run_in_executor(executor, bind(get_treasury_balance))
         
         if bal is None:
             raise HTTPException(status_code=500, detail="Failed to fetch treasury balance")
@@ -32,7 +45,7 @@ async def treasury_balance():
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error fetching treasury balance: {e}")
+        log.warning("Error fetching treasury balance: %s", e, extra={"sample_key": "treasury_balance"})
         raise HTTPException(status_code=500, detail=f"Failed to fetch treasury balance: {e}")
 
 class ProposalStatusResponse(BaseModel):
@@ -44,24 +57,27 @@ class ProposalStatusResponse(BaseModel):
     block_end: int
 
 @router.get("/proposal_status/{proposal_id}", response_model=ProposalStatusResponse)
-async def proposal_status(proposal_id: int):
+async def proposal_status(proposal_id: int, request: Request):
     """
     Returns basic on-chain status for a proposal (redacted values only).
-    Optimized with async execution.
+    Cached per indexed block, with ETag / If-None-Match support.
     """
-    try:
+    async def build():
         # Run blocking call in thread pool
         loop = asyncio.get_event_loop()
-        status = await loop.run_in_executor(executor, get_proposal_status, proposal_id)
-        
+        status = await loop.run_in_executor(executor, bind(get_proposal_status), proposal_id)
+
         if not status:
             raise HTTPException(status_code=404, detail=f"Proposal {proposal_id} not found")
-            
+
         return status
+
+    try:
+        return await response_cache.respond(request, ("proposal_status", proposal_id), build, ProposalStatusResponse)
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error fetching proposal status: {e}")
+        log.warning("Error fetching proposal status: %s", e, extra={"sample_key": "proposal_status"})
         raise HTTPException(status_code=500, detail=f"Failed to fetch proposal status: {e}")
 
 
@@ -73,22 +89,30 @@ class TreasuryInfoResponse(BaseModel):
 
 
 @router.get("/treasury_info", response_model=TreasuryInfoResponse)
-async def treasury_info():
+async def treasury_info(request: Request):
     """
     Get detailed treasury information.
-    Optimized with async execution.
+    Served from the treasury watcher snapshot; falls back to node reads.
+    Cached per indexed block, with ETag / If-None-Match support.
     """
-    try:
+    async def build():
+        snapshot = treasury_watcher.snapshot() if treasury_watcher.running else None
+        if snapshot:
+            return snapshot
+
         # Run blocking call in thread pool
         loop = asyncio.get_event_loop()
-        info = await loop.run_in_executor(executor, get_treasury_info)
-        
+        info = await loop.run_in_executor(executor, bind(get_treasury_info))
+
         if not info:
             raise HTTPException(status_code=500, detail="Could not fetch treasury info")
-            
+
         return info
+
+    try:
+        return await response_cache.respond(request, "treasury_info", build, TreasuryInfoResponse)
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error fetching treasury info: {e}")
+        log.warning("Error fetching treasury info: %s", e, extra={"sample_key": "treasury_info"})
         raise HTTPException(status_code=500, detail=f"Failed to fetch treasury info: {e}")
\ No newline at end of file
@@ -1,12 +1,53 @@
 # backend/routes/proposal_routes.py
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Optional, List
-from blockchain.celo_interact import create_proposal, vote_proposal, get_proposal, execute_proposal
+from blockchain.celo_interact import (
+    create_proposal, vote_proposal, vote_batch, get_proposal, get_proposals_batch, execute_proposal, dao_contract,
+    decode_receipt, execution_events, on_broadcast, proposal_created, sent_calls,
+)
+from blockchain.proposal_record import ProposalRecord, ProposalTable
+from ai.similarity import MinHashIndex, signature
+from blockchain.chain_watcher import chain_watcher, BLOCK_TIME
+from blockchain.chain_state import chain_state
+from blockchain.vote_indexer import vote_indexer
+from storage import idempotency_store
+from storage.idempotency_store import IdempotencyStore
+from utils.config_loader import get_settings
+from utils.logger import get_logger
+from utils.profiling import run_in_threadpool
+from utils.response_cache import ResponseCache
+from utils.serialization import FAST_JSON, FastJSONResponse, dumps
+from utils.validator import is_valid_eth_address
 from datetime import datetime, timedelta
 from collections import defaultdict
+import hashlib
 
 router = APIRouter()
+log = get_logger(__name__)
+
+# Serialized responses reused until the chain watcher indexes a new block
+response_cache = ResponseCache(chain_watcher.indexed_block, block_time=BLOCK_TIME)
+
+# Executed proposals can no longer change: kept as compact rows plus their serialized JSON
+executed_proposals = ProposalTable()
+executed_json = {}
+
+# Responses of completed write requests, replayed for retries with the same Idempotency-Key
+# (opened by the app lifespan)
+settings = get_settings()
+idempotency: Optional[IdempotencyStore] = None
+
+
+def open_store(path: str = settings.data_path(settings.idempotency_store_path)):
+    global idempotency
+    if idempotency is None:
+        idempotency = IdempotencyStore(path, settings.idempotency_max_entries, settings.idempotency_ttl)
+
+# MinHash index of proposal descriptions, filled up to `indexed_upto` on demand
+proposal_index = MinHashIndex(settings.similarity_index_capacity)
+proposal_index_state = {"indexed_upto": 0}
 
 # In-memory storage for proposal tracking (user_address -> list of timestamps)
 # In production, use a database like PostgreSQL or Redis
@@ -60,7 +101,111 @@ def record_proposal_creation(user_address: str):
     user_address = user_address.lower()
     user_proposal_tracking[user_address].append(datetime.now())
 
-# We'll initialize Web3 inside the function to avoid module-level connection issues
+def remember_executed(record: ProposalRecord):
+    if record.executed and record.proposal_id not in executed_json:
+        executed_proposals.put(record)
+        executed_json[record.proposal_id] = dumps(record.to_api())
+
+def serialized_proposal(record: ProposalRecord) -> bytes:
+    return executed_json.get(record.proposal_id) or dumps(record.to_api())
+
+def proposal_count() -> int:
+    """nextProposalId, from the indexed chain state when it is current."""
+    if chain_state.ready:
+        return chain_state.next_proposal_id
+    return dao_contract.functions.nextProposalId().call()
+
+def fetch_proposals(proposal_ids: list) -> dict:
+    """
+    proposal_id -> ProposalRecord. Served from the indexed chain state while it is
+    current; otherwise executed proposals come from memory and only the rest are
+    read from the node (in one parallel batch).
+    """
+    if chain_state.ready:
+        table = chain_state.proposals
+        return {pid: table.get(pid) for pid in proposal_ids if pid in table}
+    records = {pid: executed_proposals.get(pid) for pid in proposal_ids if pid in executed_proposals}
+    pending = [pid for pid in proposal_ids if pid not in records]
+    if pending:
+        for pid, record in get_proposals_batch(pending).items():
+            remember_executed(record)
+            records[pid] = record
+    return records
+
+async def idempotent(key: Optional[str], scope: str, body, model, handler, recover):
+    """
+    Run `handler()` at most once per Idempotency-Key. A retry with the same key and body
+    gets the stored response back (Idempotent-Replayed: true) without touching the chain;
+    a retry while the first attempt is still running gets 409. Every transaction hash is
+    recorded against the key as soon as the node accepts it: a retry of an attempt that
+    failed after broadcasting calls `recover(tx_hashes)` to rebuild the response from
+    the chain instead of sending again (it returns None if nothing relevant was sent,
+    and the handler runs). Attempts that failed before sending can be retried freely.
+    """
+    if not key:
+        return await handler()
+    fingerprint = hashlib.sha256(dumps(body)).digest()
+    outcome, stored = await run_in_threadpool(idempotency.begin, scope, key, fingerprint)
+    if outcome == idempotency_store.MISMATCH:
+        raise HTTPException(status_code=422, detail="Idempotency-Key was already used with a different request")
+    if outcome == idempotency_store.IN_PROGRESS:
+        raise HTTPException(status_code=409, detail="A request with this Idempotency-Key is still in progress",
+                            headers={"Retry-After": str(max(1, int(BLOCK_TIME)))})
+    if outcome == idempotency_store.DONE:
+        status, content = stored
+        return Response(content, status_code=status, media_type="application/json",
+                        headers={"Idempotent-Replayed": "true"})
+    token = on_broadcast.set(lambda tx_hash: idempotency.record_sent(scope, key, tx_hash))
+    try:
+        result = None
+        if outcome == idempotency_store.SENT:
+            log.info("Recovering %s request from %d sent transactions", scope, len(stored), extra={"key": key})
+            result = await recover(stored)
+        if result is None:
+            result = await handler()
+    except BaseException:
+        await run_in_threadpool(idempotency.release, scope, key)
+        raise
+    finally:
+        on_broadcast.reset(token)
+    await run_in_threadpool(idempotency.complete, scope, key, 200, dumps(model.model_validate(result).model_dump()))
+    return result
+
+def _still_pending(tx_hash: str) -> HTTPException:
+    return HTTPException(status_code=409, detail=f"Transaction {tx_hash} from an earlier attempt is not mined yet",
+                         headers={"Retry-After": str(max(1, int(BLOCK_TIME)))})
+
+async def recovered_call(tx_hashes: list, function_name: str):
+    """
+    (tx_hash, receipt) of the single `function_name` transaction an earlier attempt sent,
+    or None if it sent none. Raises 409 while it is pending and 500 if it reverted.
+    """
+    calls, unknown = await run_in_threadpool(sent_calls, tx_hashes, function_name)
+    if not calls:
+        if unknown:
+            raise _still_pending(tx_hashes[-1])
+        return None
+    call = calls[-1]
+    if call["receipt"] is None:
+        raise _still_pending(call["tx_hash"])
+    if call["receipt"].status == 0:
+        raise HTTPException(status_code=500, detail=f"Transaction {call['tx_hash']} reverted on-chain!")
+    return call["tx_hash"], call["receipt"]
+
+IDEMPOTENCY_KEY = Header(None, alias="Idempotency-Key", max_length=255)
+
+def similar_proposals(description: str) -> list:
+    """
+    [(proposal_id, similarity)] of existing proposals whose description is a near-copy
+    of `description`. Proposals created since the last call are indexed first.
+    """
+    total = proposal_count()
+    start = proposal_index_state["indexed_upto"]
+    if total > start:
+        for pid, record in fetch_proposals(list(range(start, total))).items():
+            proposal_index.add(pid, signature(record.description))
+        proposal_index_state["indexed_upto"] = total
+    return proposal_index.query(signature(description), settings.proposal_duplicate_threshold)
 
 # --- Request/Response Models ---
 class ProposalCreateRequest(BaseModel):
@@ -70,13 +215,17 @@ class ProposalCreateRequest(BaseModel):
     recipient: str = Field(..., description="Recipient address for funds (NGO / vetted org)")
     user_address: str = Field(..., description="Wallet address of the user creating the proposal")
     fee_paid: float = Field(default=0.0, description="Fee paid by user (0 for first proposal, 0.01+ for subsequent)")
+    allow_duplicate: bool = Field(default=False, description="Create even if a near-identical proposal exists")
 
 class ProposalCreateResponse(BaseModel):
     tx_hash: str
     proposal_id: Optional[int]
+    block_start: Optional[int] = None
+    block_end: Optional[int] = None
     message: str
     fee_charged: float
     is_free: bool
+    similar_proposals: List[int] = []
 
 class ProposalLimitCheckResponse(BaseModel):
     can_create: bool
@@ -94,6 +243,22 @@ class VoteResponse(BaseModel):
     tx_hash: str
     message: str
 
+class VoteBatchRequest(BaseModel):
+    votes: List[VoteRequest] = Field(..., min_length=1, max_length=100, description="At most one vote per proposal")
+
+class VoteBatchResult(BaseModel):
+    proposal_id: int
+    support: bool
+    tx_hash: Optional[str]
+    status: str  # mined | reverted | rejected | not_sent | pending
+    error: Optional[str]
+
+class VoteBatchResponse(BaseModel):
+    results: List[VoteBatchResult]
+    mined: int
+    pending: int  # no receipt yet when the request returned; may still be mined
+    failed: int  # reverted, rejected or not_sent
+
 class ExecuteResponse(BaseModel):
     tx_hash: str
     message: str
@@ -103,7 +268,7 @@ class ProposalDetailResponse(BaseModel):
     proposal_id: int
     target: str
     value: float
-    callData: str
+    callData: str  # 0x-prefixed hex
     description: str
     blockStart: int
     blockEnd: int
@@ -115,6 +280,33 @@ class ProposalListResponse(BaseModel):
     proposals: List[ProposalDetailResponse]
     total_count: int
 
+class VoteRecord(BaseModel):
+    voter: str
+    support: bool
+    block: int
+    tx_hash: str
+
+class ProposalVotesResponse(BaseModel):
+    proposal_id: int
+    yes_votes: int
+    no_votes: int
+    total_votes: int
+    votes: List[VoteRecord]
+    next_after: Optional[str]
+    indexed_block: Optional[int]
+
+class VoterVoteRecord(BaseModel):
+    proposal_id: int
+    support: bool
+    block: int
+    tx_hash: str
+
+class VoterVotesResponse(BaseModel):
+    voter: str
+    votes: List[VoterVoteRecord]
+    next_after: Optional[int]
+    indexed_block: Optional[int]
+
 # --- Routes ---
 
 @router.get("/check-limit/{user_address}", response_model=ProposalLimitCheckResponse)
@@ -129,7 +321,14 @@ async def check_proposal_limit(user_address: str):
     }
 
 @router.post("/create", response_model=ProposalCreateResponse)
-async def create_proposal_endpoint(payload: ProposalCreateRequest):
+async def create_proposal_endpoint(payload: ProposalCreateRequest, idempotency_key: Optional[str] = IDEMPOTENCY_KEY):
+    """
+    Create a proposal on-chain. Send an Idempotency-Key header to make retries safe.
+    """
+    return await idempotent(idempotency_key, "create", payload.model_dump(), ProposalCreateResponse,
+                            lambda: _create_proposal(payload), lambda sent: _recover_create(payload, sent))
+
+async def _create_proposal(payload: ProposalCreateRequest):
     try:
         # Check user's proposal limit
         limit_check = check_user_proposal_limit(payload.user_address)
@@ -148,47 +347,147 @@ async def create_proposal_endpoint(payload: ProposalCreateRequest):
                     detail=f"Payment required: {required_fee} CELO for proposal #{limit_check['total_proposals'] + 1}."
                 )
         
+        # Near-copies of existing proposals are refused unless explicitly allowed
+        similar = await run_in_threadpool(similar_proposals, payload.description)
+        if similar and not payload.allow_duplicate:
+            raise HTTPException(status_code=409, detail={
+                "message": "A near-identical proposal already exists; set allow_duplicate to create it anyway.",
+                "similar_proposals": [{"proposal_id": pid, "similarity": score} for pid, score in similar],
+            })
+
         # Create the proposal on blockchain
-        tx_hash, proposal_id = create_proposal(payload.description, payload.amount_eth, payload.recipient)
+        tx_hash, created = await run_in_threadpool(create_proposal, payload.description, payload.amount_eth, payload.recipient)
         if not tx_hash:
             raise HTTPException(status_code=500, detail="Transaction failed, no tx_hash returned.")
 
         # Record the proposal creation
         record_proposal_creation(payload.user_address)
 
-        return {
-            "tx_hash": tx_hash,
-            "proposal_id": proposal_id,
-            "message": f"Proposal submitted successfully. {'First proposal - FREE!' if limit_check['is_free'] else f'Fee: {required_fee} CELO'}",
-            "fee_charged": required_fee,
-            "is_free": limit_check["is_free"]
-        }
+        return _created_response(tx_hash, created, limit_check, [pid for pid, _ in similar])
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Blockchain error: {str(e)}")
 
+def _created_response(tx_hash: str, created: Optional[dict], limit_check: dict, similar: list) -> dict:
+    required_fee = 0.0 if limit_check["is_free"] else 0.01
+    return {
+        "tx_hash": tx_hash,
+        "proposal_id": created["proposal_id"] if created else None,
+        "block_start": created["block_start"] if created else None,
+        "block_end": created["block_end"] if created else None,
+        "message": f"Proposal submitted successfully. {'First proposal - FREE!' if limit_check['is_free'] else f'Fee: {required_fee} CELO'}",
+        "fee_charged": required_fee,
+        "is_free": limit_check["is_free"],
+        "similar_proposals": similar,
+    }
+
+async def _recover_create(payload: ProposalCreateRequest, tx_hashes: list):
+    sent = await recovered_call(tx_hashes, "createProposal")
+    if sent is None:
+        # At most the treasury top-up went out, and it is not repeated once the balance suffices
+        return None
+    tx_hash, receipt = sent
+    # The failed attempt never recorded the creation, so the limit check still sees it as pending
+    limit_check = check_user_proposal_limit(payload.user_address)
+    record_proposal_creation(payload.user_address)
+    return _created_response(tx_hash, proposal_created(tx_hash, receipt), limit_check, [])
+
 @router.post("/vote", response_model=VoteResponse)
-async def vote_endpoint(payload: VoteRequest):
+async def vote_endpoint(payload: VoteRequest, idempotency_key: Optional[str] = IDEMPOTENCY_KEY):
     """
-    Cast a vote on a given proposal.
+    Cast a vote on a given proposal. Send an Idempotency-Key header to make retries safe.
     """
+    return await idempotent(idempotency_key, "vote", payload.model_dump(), VoteResponse,
+                            lambda: _vote(payload), _recover_vote)
+
+async def _vote(payload: VoteRequest):
     try:
-        tx_hash = vote_proposal(payload.proposal_id, payload.support)
+        tx_hash = await run_in_threadpool(vote_proposal, payload.proposal_id, payload.support)
         if not tx_hash or not isinstance(tx_hash, str):
             raise HTTPException(status_code=500, detail="Vote transaction failed, no tx_hash returned.")
         return {"tx_hash": tx_hash, "message": "Vote submitted successfully."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Vote failed: {str(e)}")
 
+async def _recover_vote(tx_hashes: list):
+    sent = await recovered_call(tx_hashes, "vote")
+    if sent is None:
+        return None
+    tx_hash, receipt = sent
+    if not decode_receipt(receipt, "Voted"):
+        raise HTTPException(status_code=500, detail="Vote failed: Vote transaction mined without a Voted event")
+    return {"tx_hash": tx_hash, "message": "Vote submitted successfully."}
+
+
+@router.post("/vote_batch", response_model=VoteBatchResponse)
+async def vote_batch_endpoint(payload: VoteBatchRequest, idempotency_key: Optional[str] = IDEMPOTENCY_KEY):
+    """
+    Cast many votes at once. Votes are validated with batched reads and sent with
+    consecutive nonces, so the whole batch is usually mined in one block.
+    Each vote gets its own status; invalid votes are reported, not sent.
+    """
+    return await idempotent(idempotency_key, "vote_batch", payload.model_dump(), VoteBatchResponse,
+                            lambda: _vote_batch(payload), lambda sent: _recover_vote_batch(payload, sent))
+
+async def _vote_batch(payload: VoteBatchRequest):
+    try:
+        results = await run_in_threadpool(vote_batch, [(v.proposal_id, v.support) for v in payload.votes])
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Vote batch failed: {str(e)}")
+    return _batch_response(results)
+
+def _batch_response(results: list) -> dict:
+    # Pending votes may still be mined: they are not failures to re-submit
+    counts = {status: 0 for status in ("mined", "pending", "reverted", "rejected", "not_sent")}
+    for r in results:
+        counts[r["status"]] += 1
+    return {"results": results, "mined": counts["mined"], "pending": counts["pending"],
+            "failed": counts["reverted"] + counts["rejected"] + counts["not_sent"]}
+
+async def _recover_vote_batch(payload: VoteBatchRequest, tx_hashes: list):
+    calls, unknown = await run_in_threadpool(sent_calls, tx_hashes, "vote")
+    if not calls and not unknown:
+        return None
+    pending = [c for c in calls if c["receipt"] is None]
+    if pending or not calls:
+        raise _still_pending(pending[0]["tx_hash"] if pending else tx_hashes[-1])
+    by_proposal = {int(c["args"]["_proposalId"]): c for c in calls}
+    results, seen = [], set()
+    for v in payload.votes:
+        call = by_proposal.pop(v.proposal_id, None)
+        r = {"proposal_id": v.proposal_id, "support": v.support, "tx_hash": None, "status": "not_sent",
+             "error": "Not sent by the earlier attempt"}
+        if v.proposal_id in seen:
+            r["status"], r["error"] = "rejected", "Duplicate proposal in batch"
+        elif call is None and unknown:
+            # Dropped, or replaced by a version the node no longer reports
+            r["status"], r["error"] = "pending", "Transaction of the earlier attempt is unknown to the node"
+        elif call is not None:
+            r["tx_hash"] = call["tx_hash"]
+            if call["receipt"].status == 0:
+                r["status"], r["error"] = "reverted", "Vote transaction reverted on-chain!"
+            elif not decode_receipt(call["receipt"], "Voted"):
+                r["status"], r["error"] = "reverted", "Vote transaction mined without a Voted event"
+            else:
+                r["status"], r["error"] = "mined", None
+        seen.add(v.proposal_id)
+        results.append(r)
+    return _batch_response(results)
+
 
 @router.post("/execute/{proposal_id}", response_model=ExecuteResponse)
-async def execute_endpoint(proposal_id: int):
+async def execute_endpoint(proposal_id: int, idempotency_key: Optional[str] = IDEMPOTENCY_KEY):
     """
     Attempts to execute a passed proposal (triggers DAO execution function).
+    Send an Idempotency-Key header to make retries safe.
     """
+    return await idempotent(idempotency_key, "execute", {"proposal_id": proposal_id}, ExecuteResponse,
+                            lambda: _execute(proposal_id), _recover_execute)
+
+async def _execute(proposal_id: int):
     try:
-        result = execute_proposal(proposal_id)
+        result = await run_in_threadpool(execute_proposal, proposal_id)
         if not result:
             raise HTTPException(status_code=500, detail="Execute transaction failed, no result returned.")
 
@@ -210,95 +509,143 @@ async def execute_endpoint(proposal_id: int):
             raise HTTPException(status_code=400, detail=f"Execute failed: {msg}")
         raise HTTPException(status_code=500, detail=f"Execute failed: {msg}")
 
+async def _recover_execute(tx_hashes: list):
+    sent = await recovered_call(tx_hashes, "executeProposal")
+    if sent is None:
+        return None
+    tx_hash, receipt = sent
+    return {"tx_hash": tx_hash, "message": "Execute transaction submitted successfully.",
+            "events": execution_events(receipt)}
+
 
 @router.get("/list", response_model=ProposalListResponse)
-async def list_proposals():
+async def list_proposals(request: Request):
     """
     Get all proposals from the blockchain.
-    Optimized with batch fetching and caching.
+    Optimized with batch fetching; executed proposals are not re-read, and the
+    serialized list is cached per indexed block and served with an ETag.
     """
-    try:
-        # Lazy load Web3 and contract
-        from web3 import Web3
-        import json, os
-        from utils.config_loader import load_env
-        from blockchain.celo_interact import get_proposals_batch
-        
-        env = load_env()
-        CELO_RPC = env["CELO_RPC"]
-        DAO_CONTRACT = env["DAO_CONTRACT"]
-        
-        # Increase timeout for connection
-        w3 = Web3(Web3.HTTPProvider(CELO_RPC, request_kwargs={'timeout': 120}))
-        abi_path = os.path.join(os.path.dirname(__file__), "..", "blockchain", "abi", "EchoDAO.json")
-        
-        with open(abi_path, "r") as f:
-            dao_json = json.load(f)
-        dao_abi = dao_json["abi"]
-        dao_contract = w3.eth.contract(address=Web3.to_checksum_address(DAO_CONTRACT), abi=dao_abi)
-        
+    async def build():
         # Get the next proposal ID to know how many proposals exist
-        try:
-            next_id = dao_contract.functions.nextProposalId().call()
-        except Exception as e:
-            # If we can't get nextProposalId, there might be no proposals or connection issue
-            print(f"Warning: Could not get nextProposalId: {e}")
-            return {
-                "proposals": [],
-                "total_count": 0
-            }
-        
-        total_count = next_id
-        
+        total_count = await run_in_threadpool(proposal_count)
+
         if total_count == 0:
             return {
                 "proposals": [],
                 "total_count": 0
             }
-        
+
         # Fetch all proposals in batch (parallel)
-        proposal_ids = list(range(total_count))
-        proposals_dict = get_proposals_batch(proposal_ids)
-        
-        # Convert to list format
-        proposals = []
-        for pid in range(total_count):
-            if pid in proposals_dict:
-                proposals.append({
-                    "proposal_id": pid,
-                    **proposals_dict[pid]
-                })
-        
+        records = await run_in_threadpool(fetch_proposals, list(range(total_count)))
+        proposals = [records[pid] for pid in range(total_count) if pid in records]
+
+        if FAST_JSON:
+            # Splice pre-serialized items instead of validating each through pydantic
+            return b"".join([
+                b'{"proposals":[',
+                b",".join(serialized_proposal(p) for p in proposals),
+                b'],"total_count":', str(total_count).encode(), b"}",
+            ])
         return {
-            "proposals": proposals,
+            "proposals": [p.to_api() for p in proposals],
             "total_count": total_count
         }
+
+    try:
+        return await response_cache.respond(request, "list", build, ProposalListResponse)
     except Exception as e:
-        print(f"Error in list_proposals: {e}")
-        import traceback
-        traceback.print_exc()
-        # Return empty list instead of error to avoid frontend timeout
-        return {
+        log.warning("Error in list_proposals: %s", e, exc_info=True, extra={"sample_key": "list_proposals"})
+        # Return empty list instead of error to avoid frontend timeout (not cached)
+        return FastJSONResponse({
             "proposals": [],
             "total_count": 0
-        }
+        })
 
 
+@router.get("/stream")
+async def stream_proposals(chunk_size: int = Query(25, ge=1, le=500)):
+    """
+    All proposals as NDJSON (one ProposalDetailResponse object per line), in id order.
+    Lines are written as each chunk of `chunk_size` proposals is fetched, so clients
+    start receiving data before the whole history is read. The total number of
+    proposal slots is sent in the X-Total-Count header.
+    """
+    try:
+        total_count = await run_in_threadpool(proposal_count)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch proposal count: {str(e)}")
+
+    async def lines():
+        for start in range(0, total_count, chunk_size):
+            ids = list(range(start, min(start + chunk_size, total_count)))
+            records = await run_in_threadpool(fetch_proposals, ids)
+            yield b"".join(serialized_proposal(records[pid]) + b"\n" for pid in ids if pid in records)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson", headers={"X-Total-Count": str(total_count)})
+
+
+@router.get("/voters/{voter}/votes", response_model=VoterVotesResponse)
+def voter_votes(voter: str, limit: int = Query(100, ge=1, le=1000), after: Optional[int] = None):
+    """
+    Votes cast by an address, served from the local vote index.
+    Page with `after` = `next_after` from the previous response.
+    """
+    if not is_valid_eth_address(voter):
+        raise HTTPException(status_code=400, detail="Invalid voter address")
+    store = vote_indexer.store
+    votes = store.votes_by_voter(voter, limit=limit, after=after)
+    return {
+        "voter": voter.lower(),
+        "votes": votes,
+        "next_after": votes[-1]["proposal_id"] if len(votes) == limit else None,
+        "indexed_block": store.checkpoint,
+    }
+
+
+@router.get("/{proposal_id}/votes", response_model=ProposalVotesResponse)
+def proposal_votes(proposal_id: int, limit: int = Query(100, ge=1, le=1000), after: Optional[str] = None):
+    """
+    Tally and voters of a proposal, served from the local vote index.
+    Page with `after` = `next_after` from the previous response.
+    """
+    if after is not None and not is_valid_eth_address(after):
+        raise HTTPException(status_code=400, detail="Invalid 'after' address")
+    store = vote_indexer.store
+    tally = store.tally(proposal_id)
+    votes = store.votes_for_proposal(proposal_id, limit=limit, after=after)
+    return {
+        "proposal_id": proposal_id,
+        "yes_votes": tally["yes"],
+        "no_votes": tally["no"],
+        "total_votes": tally["total"],
+        "votes": votes,
+        "next_after": votes[-1]["voter"] if len(votes) == limit else None,
+        "indexed_block": store.checkpoint,
+    }
+
 
 @router.get("/{proposal_id}", response_model=ProposalDetailResponse)
-async def get_proposal_detail(proposal_id: int):
+async def get_proposal_detail(proposal_id: int, request: Request):
     """
     Get details of a specific proposal by ID.
+    Cached per indexed block, with ETag / If-None-Match support.
     """
-    try:
-        proposal_data = get_proposal(proposal_id)
-        if not proposal_data:
+    async def build():
+        cached = executed_json.get(proposal_id)
+        if cached:
+            return cached
+
+        record = chain_state.proposals.get(proposal_id) if chain_state.ready else None
+        if record is None:
+            record = await run_in_threadpool(get_proposal, proposal_id)
+        if not record:
             raise HTTPException(status_code=404, detail=f"Proposal {proposal_id} not found")
-        
-        return {
-            "proposal_id": proposal_id,
-            **proposal_data
-        }
+
+        remember_executed(record)
+        return serialized_proposal(record) if FAST_JSON else record.to_api()
+
+    try:
+        return await response_cache.respond(request, ("proposal", proposal_id), build, ProposalDetailResponse)
     except HTTPException:
         raise
     except Exception as e:
@@ -1,13 +1,63 @@
 # backend/routes/report_routes.py
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query
 from pydantic import BaseModel
-from typing import Union
+from typing import List, Literal, Optional, Union
+from array import array
+from ai.similarity import MinHashIndex, signature
 from ai.summarizer import summarize_report
+from ai.text_extractor import extract_text, ExtractionError
 from ai.truth_verifier import verify_trust_score
 from storage.ipfs_handler import upload_to_ipfs
+from storage.report_store import ReportStore
 from storage.verify_hash import calculate_file_hash
+from utils.admission import AdmissionController
+from utils.config_loader import get_settings
+from utils.logger import get_logger
+from utils.metrics import stage_timer
+from utils.profiling import run_in_threadpool
+from utils.export_formats import streaming_response
 
 router = APIRouter()
+log = get_logger(__name__)
+
+# Bounded queues in front of the summarizer; shorter inputs are admitted first
+settings = get_settings()
+submit_admission = AdmissionController(
+    "submit_report", settings.report_submit_concurrency, settings.report_submit_queue, settings.admission_queue_timeout)
+verify_admission = AdmissionController(
+    "verify_report_ai", settings.report_verify_concurrency, settings.report_verify_queue, settings.admission_queue_timeout)
+# The duplicate check decides the submit priority, so it runs before that slot behind its own
+similarity_admission = AdmissionController(
+    "report_similarity", settings.report_similarity_concurrency, settings.report_similarity_queue,
+    settings.admission_queue_timeout)
+
+# Audit log of every processed report, written off the request path (opened by the app lifespan)
+report_store: Optional[ReportStore] = None
+
+# MinHash index of recent report texts (keyed by file hash): near-duplicates reuse the stored summary
+report_index = MinHashIndex(settings.similarity_index_capacity)
+
+
+def open_store(path: str = settings.data_path(settings.report_store_path)):
+    """Open the audit store and seed the duplicate index with its most recent reports."""
+    global report_store
+    if report_store is not None:
+        return
+    report_store = ReportStore(path, settings.report_store_queue)
+    for file_hash, sig in report_store.recent_signatures(settings.similarity_index_capacity):
+        report_index.add(file_hash, array("Q", sig))
+
+
+def close_store():
+    global report_store
+    if report_store is not None:
+        report_store.close()
+        report_store = None
+
+
+def _timed(stage: str, fn, *args):
+    with stage_timer(stage):
+        return fn(*args)
 
 class ReportResponse(BaseModel):
     filename: str
@@ -16,6 +66,16 @@ class ReportResponse(BaseModel):
     summary: str
     trust_score: int
     credibility: str
+    duplicate_of: Optional[str] = None  # IPFS hash of the near-duplicate whose summary was reused
+    similarity: Optional[float] = None
+
+def find_duplicate(sig):
+    """(stored audit record, similarity) of the closest earlier near-duplicate report, or (None, None)."""
+    for file_hash, score in report_index.query(sig, settings.report_duplicate_threshold):
+        previous = report_store.by_file_hash(file_hash, limit=1)
+        if previous:
+            return previous[0], score
+    return None, None
 
 @router.post("/submit_report", response_model=ReportResponse)
 async def submit_report(file: UploadFile = File(...)):
@@ -27,25 +87,39 @@ async def submit_report(file: UploadFile = File(...)):
         # 1) Read as bytes
         content_bytes = await file.read()
 
-        # Optional: handle text files safely
-        if file.filename.endswith((".txt", ".csv")):
-            try:
-                content_text = content_bytes.decode("utf-8")
-            except UnicodeDecodeError:
-                content_text = ""  # fallback if decoding fails
-        else:
-            content_text = ""  # for PDFs/images/binary files, pass empty string to AI
+        # Text for the AI stages: decoded text files, PDF text layer or OCR (process pool)
+        try:
+            content_text = await extract_text(content_bytes, file.filename)
+        except ExtractionError as e:
+            raise HTTPException(status_code=415, detail=str(e))
+        if not content_text.strip():
+            raise HTTPException(status_code=422, detail="No text could be extracted from the file")
+
+        # Re-uploads with trivial edits skip the model and reuse the earlier result
+        async with similarity_admission.slot(priority=len(content_text)):
+            sig = await run_in_threadpool(_timed, "similarity", signature, content_text)
+        duplicate, score = await run_in_threadpool(find_duplicate, sig)
 
-        # 2) Calculate hash
-        fhash = calculate_file_hash(content_bytes)
+        async with submit_admission.slot(priority=0 if duplicate else len(content_text)):
+            # 2) Calculate hash
+            fhash = await run_in_threadpool(_timed, "file_hash", calculate_file_hash, content_bytes)
 
-        # 3) Upload to IPFS
-        ipfs_hash = upload_to_ipfs(content_bytes, file.filename)
+            # 3) Upload to IPFS
+            ipfs_hash = await run_in_threadpool(_timed, "ipfs_upload", upload_to_ipfs, content_bytes, file.filename)
 
-        # 4) AI summarize & trust score
-        summary = summarize_report(content_text or content_bytes)  # your function must accept bytes
-        trust = verify_trust_score(content_text or content_bytes)
+            # 4) AI summarize & trust score
+            if duplicate:
+                log.info("Reusing summary of near-duplicate report",
+                         extra={"duplicate_of": duplicate["ipfs_hash"], "similarity": score})
+                summary = duplicate["summary"]
+                trust = {"trust_score": duplicate["trust_score"], "credibility": duplicate["credibility"]}
+            else:
+                summary = await run_in_threadpool(_timed, "summarize", summarize_report, content_text)
+                trust = await run_in_threadpool(_timed, "trust_score", verify_trust_score, content_text)
 
+        report_index.add(fhash, sig)
+        report_store.record(fhash, ipfs_hash, file.filename, len(content_bytes), summary,
+                            trust["trust_score"], trust["credibility"], signature=sig.tobytes())
         return {
             "filename": file.filename,
             "ipfs_hash": ipfs_hash,
@@ -53,8 +127,12 @@ async def submit_report(file: UploadFile = File(...)):
             "summary": summary,
             "trust_score": trust["trust_score"],
             "credibility": trust["credibility"],
+            "duplicate_of": duplicate["ipfs_hash"] if duplicate else None,
+            "similarity": score,
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to process report: {str(e)}")
 
@@ -73,12 +151,83 @@ async def verify_report_ai(payload: VerifyRequest):
     Useful for quick testing or frontend demos.
     """
     try:
-        summary = summarize_report(payload.content)
-        trust = verify_trust_score(payload.content)
+        async with verify_admission.slot(priority=len(payload.content)):
+            summary = await run_in_threadpool(_timed, "summarize", summarize_report, payload.content)
+            trust = await run_in_threadpool(_timed, "trust_score", verify_trust_score, payload.content)
         return {
             "summary": summary,
             "trust_score": trust["trust_score"],
             "credibility": trust["credibility"]
         }
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+# --- Audit record lookups ---
+
+class AuditRecord(BaseModel):
+    id: int
+    created: float
+    filename: Optional[str]
+    ipfs_hash: str
+    file_hash: str
+    size: int
+    summary: str
+    trust_score: int
+    credibility: str
+
+class AuditRecordList(BaseModel):
+    reports: List[AuditRecord]
+    next_after: Optional[str] = None
+
+EXPORT_FIELDS = list(AuditRecord.model_fields)
+
+
+def _parse_cursor(after: Optional[str]):
+    if after is None:
+        return None
+    try:
+        created, rid = after.split(":")
+        return float(created), int(rid)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid 'after' cursor")
+
+
+@router.get("/by-hash/{file_hash}", response_model=AuditRecordList)
+def reports_by_hash(file_hash: str, limit: int = Query(100, ge=1, le=1000)):
+    """Processed reports with this SHA-256 file hash, newest first."""
+    if len(file_hash) != 64:
+        raise HTTPException(status_code=400, detail="Expected a hex SHA-256 file hash")
+    try:
+        return {"reports": report_store.by_file_hash(file_hash, limit)}
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Expected a hex SHA-256 file hash")
+
+
+@router.get("/by-cid/{cid}", response_model=AuditRecordList)
+def reports_by_cid(cid: str, limit: int = Query(100, ge=1, le=1000)):
+    """Processed reports stored under this IPFS CID, newest first."""
+    return {"reports": report_store.by_cid(cid, limit)}
+
+
+@router.get("/history", response_model=AuditRecordList)
+def report_history(since: Optional[float] = None, until: Optional[float] = None,
+                   limit: int = Query(100, ge=1, le=1000), after: Optional[str] = None):
+    """
+    Processed reports created in [since, until) (unix seconds), oldest first.
+    Page with `after` = `next_after` from the previous response.
+    """
+    reports = report_store.in_range(since, until, limit, _parse_cursor(after))
+    last = reports[-1] if len(reports) == limit else None
+    return {"reports": reports, "next_after": f"{last['created']!r}:{last['id']}" if last else None}
+
+
+@router.get("/export")
+async def export_reports(since: Optional[float] = None, until: Optional[float] = None,
+                         format: Literal["ndjson", "csv"] = "ndjson", chunk_size: int = Query(1000, ge=1, le=10000)):
+    """
+    Stream every processed report created in [since, until) as NDJSON or CSV.
+    Rows are read and written one chunk at a time, so memory stays flat on any range.
+    """
+    return streaming_response(report_store.iter_range(since, until, chunk_size), format, EXPORT_FIELDS)
@@ -0,0 +1,18 @@
+# backend/routes/stats_routes.py
+from fastapi import APIRouter, HTTPException, Query
+from blockchain.stats import stats
+
+router = APIRouter()
+
+
+@router.get("")
+def get_stats(recipients: int = Query(10, ge=0, le=1000), buckets: int = Query(30, ge=0, le=1000)):
+    """
+    Governance and treasury aggregates: pass rate, turnout, inflow / outflow,
+    funds released per recipient (top `recipients`) and the last `buckets`
+    per-block-bucket flows. Maintained from chain events; needs the chain watcher.
+    """
+    if not stats.ready:
+        raise HTTPException(status_code=503, detail="Statistics are not available until the chain watcher has caught up",
+                            headers={"Retry-After": "10"})
+    return stats.snapshot(recipients, buckets)
@@ -0,0 +1,132 @@
+# backend/storage/chain_snapshot.py
+"""
+Binary snapshot of the chain-derived state, for fast cold starts.
+
+Layout (little-endian), written to a temp file and renamed into place:
+
+    header   magic, version, checkpoint block, next proposal id, section counts
+    hashes   (block, 32-byte hash) of the recent blocks the watcher verified
+    rows     fixed-width proposal rows: the table, then undo pre-images
+    undo     (block, proposal id, row index or -1) per change in the reorg window
+    blob     callData and UTF-8 description of every row, in row order
+    treasury JSON treasury snapshot
+    crc32    of everything above
+
+Loading maps the file and unpacks each fixed-width section with one
+`iter_unpack`, so thousands of proposals load without per-field parsing.
+"""
+import json
+import mmap
+import os
+import struct
+import zlib
+from blockchain.proposal_record import ProposalRecord, intern_address
+
+MAGIC = b"EDAOSNAP"
+VERSION = 1
+
+HEADER = struct.Struct("<8sIqqIIII")  # magic, version, checkpoint, next id, hashes, rows, undo, treasury bytes
+HASH = struct.Struct("<q32s")
+ROW = struct.Struct("<QQQQQ?32s20sII")  # id, start, end, yes, no, executed, value, target, len(callData), len(description)
+UNDO = struct.Struct("<qQq")
+CRC = struct.Struct("<I")
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def _pack_rows(records):
+    rows, blob = [], []
+    for r in records:
+        description = r.description.encode()
+        rows.append(ROW.pack(r.proposal_id, r.block_start, r.block_end, r.yes_votes, r.no_votes, r.executed,
+                             r.value_wei.to_bytes(32, "big"), bytes.fromhex(r.target[2:]),
+                             len(r.call_data), len(description)))
+        blob.append(r.call_data)
+        blob.append(description)
+    return b"".join(rows), b"".join(blob)
+
+
+def write_snapshot(path: str, checkpoint: int, next_proposal_id: int, block_hashes, records, undo, treasury=None):
+    """
+    `block_hashes`: [(block, hash bytes)], `records`: ProposalRecords of the table,
+    `undo`: [(block, proposal_id, pre-image ProposalRecord or None)], `treasury`: dict or None.
+    """
+    pre_images = [r for _, _, r in undo if r is not None]
+    records = list(records)
+    rows, blob = _pack_rows(records + pre_images)
+    undo_rows, index = [], len(records)
+    for block, pid, record in undo:
+        undo_rows.append(UNDO.pack(block, pid, -1 if record is None else index))
+        index += record is not None
+    treasury_json = json.dumps(treasury).encode() if treasury else b""
+
+    body = b"".join([
+        HEADER.pack(MAGIC, VERSION, checkpoint, next_proposal_id, len(block_hashes), len(records) + len(pre_images),
+                    len(undo), len(treasury_json)),
+        b"".join(HASH.pack(block, bytes(h)) for block, h in block_hashes),
+        rows, b"".join(undo_rows), blob, treasury_json,
+    ])
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(body)
+        f.write(CRC.pack(zlib.crc32(body)))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def read_snapshot(path: str, checksum_address=None) -> dict:
+    """
+    Load a snapshot written by `write_snapshot`. Returns a dict with checkpoint,
+    next_proposal_id, block_hashes, records, undo and treasury. Raises SnapshotError
+    if the file is truncated, corrupt or from another format version.
+    `checksum_address(bytes) -> str` formats targets (default: lower-case 0x-hex).
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)
+        try:
+            if len(mm) < HEADER.size + CRC.size:
+                raise SnapshotError("snapshot truncated")
+            (stored_crc,) = CRC.unpack_from(mm, len(mm) - CRC.size)
+            if zlib.crc32(view[:-CRC.size]) != stored_crc:
+                raise SnapshotError("snapshot checksum mismatch")
+            magic, version, checkpoint, next_id, n_hashes, n_rows, n_undo, treasury_len = HEADER.unpack_from(mm, 0)
+            if magic != MAGIC or version != VERSION:
+                raise SnapshotError(f"unsupported snapshot format {magic!r} v{version}")
+
+            offset = HEADER.size
+            block_hashes = list(HASH.iter_unpack(view[offset:offset + n_hashes * HASH.size]))
+            offset += n_hashes * HASH.size
+            rows = list(ROW.iter_unpack(view[offset:offset + n_rows * ROW.size]))
+            offset += n_rows * ROW.size
+            undo_rows = list(UNDO.iter_unpack(view[offset:offset + n_undo * UNDO.size]))
+            offset += n_undo * UNDO.size
+
+            targets = {}
+            records = []
+            for pid, start, end, yes, no, executed, value, target, call_len, desc_len in rows:
+                address = targets.get(target)
+                if address is None:
+                    address = targets[target] = intern_address(
+                        checksum_address(target) if checksum_address else "0x" + target.hex())
+                call_data = bytes(view[offset:offset + call_len])
+                offset += call_len
+                description = str(view[offset:offset + desc_len], "utf-8")
+                offset += desc_len
+                records.append(ProposalRecord(pid, address, int.from_bytes(value, "big"), call_data, description,
+                                              start, end, yes, no, executed))
+            treasury = json.loads(bytes(view[offset:offset + treasury_len])) if treasury_len else None
+        finally:
+            view.release()
+
+    table_rows = n_rows - sum(1 for _, _, i in undo_rows if i >= 0)
+    return {
+        "checkpoint": checkpoint,
+        "next_proposal_id": next_id,
+        "block_hashes": block_hashes,
+        "records": records[:table_rows],
+        "undo": [(block, pid, records[i] if i >= 0 else None) for block, pid, i in undo_rows],
+        "treasury": treasury,
+    }
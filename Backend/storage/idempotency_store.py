@@ -0,0 +1,170 @@
+# backend/storage/idempotency_store.py
+"""
+Bounded SQLite store behind the `Idempotency-Key` header of the write endpoints.
+
+A key is claimed before the transaction is sent, the hash of every
+transaction is recorded against it as soon as the node accepts it, and the
+key is completed with the serialized response once it has been mined. A
+retried request gets the stored response back, learns the first attempt is
+still running, or - when the first attempt failed after broadcasting - gets
+the recorded hashes to recover the outcome from, so nothing is sent twice.
+Rows are scoped per endpoint, fingerprinted with the request body and expire
+after `ttl` seconds; completed rows are capped at `max_entries` (oldest
+dropped first).
+"""
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS idempotency (
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    fingerprint BLOB NOT NULL,
+    done INTEGER NOT NULL DEFAULT 0,  -- 0 running, 1 completed, 2 failed after broadcasting
+    tx_hashes BLOB,  -- concatenated 32-byte hashes of the transactions sent so far
+    status INTEGER,
+    body BLOB,
+    created REAL NOT NULL,
+    PRIMARY KEY (scope, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_idempotency_created ON idempotency (created);
+"""
+
+# begin() outcomes
+NEW, DONE, IN_PROGRESS, MISMATCH, SENT = "new", "done", "in_progress", "mismatch", "sent"
+
+
+def _split_hashes(blob) -> list:
+    blob = bytes(blob or b"")
+    return ["0x" + blob[i:i + 32].hex() for i in range(0, len(blob), 32)]
+
+
+class IdempotencyStore:
+    """
+    Thread- and process-safe: claims are single INSERTs, so two workers racing on
+    the same key cannot both win. A claim whose request died without completing
+    or releasing it is reclaimable after `claim_timeout` seconds if it sent
+    nothing, and recoverable (SENT) if it did.
+    """
+
+    PRUNE_EVERY = 256
+
+    def __init__(self, path: str, max_entries: int = 10000, ttl: float = 86400, claim_timeout: float = 600):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.claim_timeout = claim_timeout
+        self._lock = threading.Lock()
+        self._claims = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        if "tx_hashes" not in {row[1] for row in self._conn.execute("PRAGMA table_info(idempotency)")}:
+            # Store created before transaction hashes were recorded
+            self._conn.execute("ALTER TABLE idempotency ADD COLUMN tx_hashes BLOB")
+
+    def begin(self, scope: str, key: str, fingerprint: bytes):
+        """
+        Claim `key` for a new request. Returns (outcome, stored) where outcome is
+        NEW (caller must `complete` or `release`), DONE (stored = (status, body)),
+        SENT (an earlier attempt broadcast the transactions stored = [tx hash] and
+        ended without a response; the caller now holds the claim and must recover
+        their outcome, then `complete` or `release`), IN_PROGRESS or MISMATCH (key
+        reused with a different request body).
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "DELETE FROM idempotency WHERE scope = ? AND key = ? AND "
+                    "(done != 0 AND created < ? OR done = 0 AND tx_hashes IS NULL AND created < ?)",
+                    (scope, key, now - self.ttl, now - self.claim_timeout),
+                )
+                claimed = self._conn.execute(
+                    "INSERT OR IGNORE INTO idempotency (scope, key, fingerprint, created) VALUES (?, ?, ?, ?)",
+                    (scope, key, fingerprint, now),
+                ).rowcount
+                outcome, stored = NEW, None
+                if not claimed:
+                    outcome, stored = self._existing(scope, key, fingerprint, now)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            if claimed:
+                self._claims += 1
+                if self._claims % self.PRUNE_EVERY == 0:
+                    self._prune(now)
+            return outcome, stored
+
+    def _existing(self, scope: str, key: str, fingerprint: bytes, now: float):
+        stored_fingerprint, done, status, body, tx_hashes, created = self._conn.execute(
+            "SELECT fingerprint, done, status, body, tx_hashes, created FROM idempotency WHERE scope = ? AND key = ?",
+            (scope, key),
+        ).fetchone()
+        if bytes(stored_fingerprint) != fingerprint:
+            return MISMATCH, None
+        if done == 1:
+            return DONE, (status, bytes(body))
+        if done == 0 and created >= now - self.claim_timeout:
+            return IN_PROGRESS, None
+        # Failed (or its worker died) after broadcasting: hand the claim to this
+        # request so it recovers the outcome instead of sending again
+        self._conn.execute("UPDATE idempotency SET done = 0, created = ? WHERE scope = ? AND key = ?",
+                           (now, scope, key))
+        return SENT, _split_hashes(tx_hashes)
+
+    def record_sent(self, scope: str, key: str, tx_hash: str):
+        """Remember a transaction broadcast for the claimed `key` (call as soon as the node accepts it)."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT tx_hashes FROM idempotency WHERE scope = ? AND key = ?", (scope, key)).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE idempotency SET tx_hashes = ? WHERE scope = ? AND key = ?",
+                        (bytes(row[0] or b"") + bytes.fromhex(tx_hash[2:]), scope, key),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def complete(self, scope: str, key: str, status: int, body: bytes):
+        """Store the response of a claimed request; it is replayed until the key expires."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE idempotency SET done = 1, status = ?, body = ?, created = ? WHERE scope = ? AND key = ?",
+                (status, body, time.time(), scope, key),
+            )
+
+    def release(self, scope: str, key: str) -> bool:
+        """
+        Drop an unfinished claim so the request can be retried, unless it already
+        broadcast a transaction: such claims are kept, and a retry gets SENT with the
+        hashes instead of sending again. Returns whether the key was released.
+        """
+        with self._lock:
+            released = self._conn.execute(
+                "DELETE FROM idempotency WHERE scope = ? AND key = ? AND done != 1 AND tx_hashes IS NULL", (scope, key),
+            ).rowcount
+            self._conn.execute("UPDATE idempotency SET done = 2 WHERE scope = ? AND key = ? AND done = 0", (scope, key))
+        return bool(released)
+
+    def _prune(self, now: float):
+        # Claims in progress and claims that broadcast a transaction are never evicted early
+        self._conn.execute("DELETE FROM idempotency WHERE done != 0 AND created < ?", (now - self.ttl,))
+        self._conn.execute(
+            "DELETE FROM idempotency WHERE (scope, key) IN "
+            "(SELECT scope, key FROM idempotency WHERE done = 1 ORDER BY created LIMIT "
+            "max(0, (SELECT COUNT(*) FROM idempotency WHERE done = 1) - ?))",
+            (self.max_entries,),
+        )
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM idempotency").fetchone()[0]
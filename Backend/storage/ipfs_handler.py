@@ -1,23 +1,28 @@
 # backend/storage/ipfs_handler.py
 import requests
 import json
-from utils.config_loader import load_env
+from utils.config_loader import get_settings
+from utils.profiling import span
 
-env = load_env()
-PINATA_API_KEY = env["PINATA_API_KEY"]
-PINATA_SECRET = env["PINATA_SECRET"]
+settings = get_settings()
+PINATA_API_KEY = settings.pinata_api_key
+PINATA_SECRET = settings.pinata_secret
+PINATA_API_URL = settings.pinata_api_url
+IPFS_GATEWAY_URL = settings.ipfs_gateway_url
 
 def upload_to_ipfs(file_content: bytes, filename: str):
-    url = "https://api.pinata.cloud/pinning/pinFileToIPFS"
+    url = f"{PINATA_API_URL}/pinning/pinFileToIPFS"
     files = {'file': (filename, file_content)}
     headers = {
         "pinata_api_key": PINATA_API_KEY,
         "pinata_secret_api_key": PINATA_SECRET
     }
-    response = requests.post(url, files=files, headers=headers)
+    with span("ipfs", "pinFileToIPFS"):
+        response = requests.post(url, files=files, headers=headers)
     response.raise_for_status()
     return response.json()["IpfsHash"]
 
 def fetch_from_ipfs(ipfs_hash: str):
-    url = f"https://gateway.pinata.cloud/ipfs/{ipfs_hash}"
-    return requests.get(url).content
\ No newline at end of file
+    url = f"{IPFS_GATEWAY_URL}/ipfs/{ipfs_hash}"
+    with span("ipfs", "gateway"):
+        return requests.get(url).content
\ No newline at end of file
@@ -0,0 +1,180 @@
+# backend/storage/report_store.py
+"""
+Audit log of processed reports in SQLite (WAL).
+
+`record()` only enqueues: a background writer drains the queue and inserts in
+batches, so the request path never waits on disk. File hashes are stored as
+raw 32-byte blobs and every lookup (file hash, CID, time range) is served by
+its own index; time-range pages use keyset pagination on (created, id) so deep
+pages and exports stay as fast as the first one.
+"""
+import queue
+import sqlite3
+import threading
+import time
+from utils.logger import get_logger
+from utils.metrics import REGISTRY
+
+log = get_logger(__name__)
+
+REPORT_STORE_QUEUE = REGISTRY.gauge("echodao_report_store_queue_depth", "Report audit records waiting to be written")
+REPORT_STORE_DROPPED = REGISTRY.counter(
+    "echodao_report_store_dropped_total", "Report audit records dropped because the write queue was full")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    file_hash BLOB NOT NULL,
+    cid TEXT NOT NULL,
+    filename TEXT,
+    size INTEGER NOT NULL,
+    summary TEXT NOT NULL,
+    trust_score INTEGER NOT NULL,
+    credibility TEXT NOT NULL,
+    signature BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_reports_hash ON reports (file_hash);
+CREATE INDEX IF NOT EXISTS idx_reports_cid ON reports (cid);
+CREATE INDEX IF NOT EXISTS idx_reports_created ON reports (created);
+"""
+
+COLUMNS = "id, created, file_hash, cid, filename, size, summary, trust_score, credibility"
+
+
+def _row(row) -> dict:
+    rid, created, file_hash, cid, filename, size, summary, trust_score, credibility = row
+    return {
+        "id": rid, "created": created, "file_hash": file_hash.hex(), "ipfs_hash": cid, "filename": filename,
+        "size": size, "summary": summary, "trust_score": trust_score, "credibility": credibility,
+    }
+
+
+class ReportStore:
+    """One background writer thread; one reader connection per calling thread."""
+
+    def __init__(self, path: str, max_queue: int = 10000, batch_size: int = 500):
+        self.path = path
+        self.batch_size = batch_size
+        self._queue = queue.Queue(max_queue)
+        self._local = threading.local()
+        self._writer = self._connect()
+        self._writer.executescript(SCHEMA)
+        columns = {row[1] for row in self._writer.execute("PRAGMA table_info(reports)")}
+        if "signature" not in columns:  # stores created before similarity signatures were kept
+            self._writer.execute("ALTER TABLE reports ADD COLUMN signature BLOB")
+        self._thread = threading.Thread(target=self._write_loop, name="report-store", daemon=True)
+        self._thread.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reader(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    # --- Writes ---
+
+    def record(self, file_hash: str, cid: str, filename: str, size: int, summary: str, trust_score: int,
+               credibility: str, created: float = None, signature: bytes = None):
+        """Queue one processed report for writing. Never blocks; drops (and counts) when the queue is full."""
+        row = (created or time.time(), bytes.fromhex(file_hash), cid, filename, size, summary, trust_score, credibility,
+               signature)
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            REPORT_STORE_DROPPED.inc()
+            log.warning("Report store queue full; dropping audit record %s", cid, extra={"sample_key": "report_store_full"})
+            return
+        REPORT_STORE_QUEUE.set(self._queue.qsize())
+
+    def flush(self, timeout: float = 10):
+        """Wait until every queued record has been written."""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 10):
+        self.flush(timeout)
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            batch, markers, stop = [], [], False
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                if stop or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                try:
+                    with self._writer:
+                        self._writer.executemany(
+                            "INSERT INTO reports (created, file_hash, cid, filename, size, summary, trust_score, credibility, "
+                            "signature) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+                except sqlite3.Error as e:
+                    log.exception("Writing %d report audit records failed: %s", len(batch), e)
+            REPORT_STORE_QUEUE.set(self._queue.qsize())
+            for marker in markers:
+                marker.set()
+            if stop:
+                return
+
+    # --- Reads ---
+
+    def by_file_hash(self, file_hash: str, limit: int = 100) -> list:
+        rows = self._reader().execute(
+            f"SELECT {COLUMNS} FROM reports WHERE file_hash = ? ORDER BY id DESC LIMIT ?",
+            (bytes.fromhex(file_hash), limit),
+        ).fetchall()
+        return [_row(r) for r in rows]
+
+    def by_cid(self, cid: str, limit: int = 100) -> list:
+        rows = self._reader().execute(
+            f"SELECT {COLUMNS} FROM reports WHERE cid = ? ORDER BY id DESC LIMIT ?", (cid, limit),
+        ).fetchall()
+        return [_row(r) for r in rows]
+
+    def in_range(self, since: float = None, until: float = None, limit: int = 100, after: tuple = None) -> list:
+        """
+        Reports created in [since, until), oldest first. `after` is the (created, id)
+        of the last report of the previous page; pages are index range scans.
+        """
+        start = after or (since or 0, 0)
+        rows = self._reader().execute(
+            f"SELECT {COLUMNS} FROM reports WHERE (created, id) > (?, ?) AND created < ? ORDER BY created, id LIMIT ?",
+            (start[0], start[1], until or float("inf"), limit),
+        ).fetchall()
+        return [_row(r) for r in rows]
+
+    def recent_signatures(self, limit: int) -> list:
+        """[(file hash, signature bytes)] of the latest `limit` reports that have one, oldest first."""
+        rows = self._reader().execute(
+            "SELECT file_hash, signature FROM reports WHERE signature IS NOT NULL ORDER BY id DESC LIMIT ?", (limit,),
+        ).fetchall()
+        return [(file_hash.hex(), signature) for file_hash, signature in reversed(rows)]
+
+    def iter_range(self, since: float = None, until: float = None, chunk_size: int = 1000):
+        """Yield lists of at most `chunk_size` reports covering [since, until), oldest first."""
+        after = None
+        while True:
+            rows = self.in_range(since, until, chunk_size, after)
+            if not rows:
+                return
+            yield rows
+            after = (rows[-1]["created"], rows[-1]["id"])
@@ -0,0 +1,113 @@
+# backend/storage/treasury_ledger.py
+"""
+SQLite ledger of decoded treasury `Received` / `FundsReleased` events.
+
+Addresses and tx hashes are raw bytes; amounts are decimal text because wei
+values do not fit SQLite's 64-bit integers. Rows are clustered on
+(block_number, log_index) so a reorg rollback is a single range delete.
+"""
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transfers (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    inflow INTEGER NOT NULL,
+    address BLOB NOT NULL,
+    amount TEXT NOT NULL,
+    tx_hash BLOB NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+TRANSFER_EVENTS = ("Received", "FundsReleased")
+
+
+def _row(block, log_index, inflow, address, amount, tx_hash) -> dict:
+    return {"block": block, "log_index": log_index, "inflow": bool(inflow), "address": "0x" + address.hex(),
+            "amount_wei": int(amount), "tx_hash": "0x" + tx_hash.hex()}
+
+
+class TreasuryLedger:
+    """Thread-safe wrapper: one shared writer connection, one reader connection per thread."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        self._writer = self._connect()
+        self._writer.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reader(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    # --- Writes ---
+
+    def add_transfers(self, events, checkpoint: int = None) -> list:
+        """
+        Insert decoded Received / FundsReleased events in one transaction, optionally
+        advancing the checkpoint. Returns the rows that were new (replays are no-ops).
+        """
+        added = []
+        with self._write_lock, self._writer:
+            for ev in events:
+                if ev["event"] not in TRANSFER_EVENTS:
+                    continue
+                args = ev["args"]
+                inflow = 1 if ev["event"] == "Received" else 0
+                row = (ev["blockNumber"], ev["logIndex"], inflow,
+                       bytes.fromhex((args["sender"] if inflow else args["to"])[2:]),
+                       str(int(args["amount"])), bytes.fromhex(ev["transactionHash"][2:]))
+                cur = self._writer.execute("INSERT OR IGNORE INTO transfers VALUES (?, ?, ?, ?, ?, ?)", row)
+                if cur.rowcount:
+                    added.append(_row(*row))
+            if checkpoint is not None:
+                self._writer.execute(
+                    "INSERT INTO meta VALUES ('checkpoint', ?) ON CONFLICT(key) DO UPDATE SET value = MAX(value, excluded.value)",
+                    (checkpoint,),
+                )
+        return added
+
+    def rollback(self, from_block: int) -> list:
+        """
+        Forget transfers from `from_block` on (they were in blocks replaced by a reorg)
+        and move the checkpoint back before `from_block`. Returns the removed rows.
+        """
+        with self._write_lock, self._writer:
+            rows = self._writer.execute("SELECT * FROM transfers WHERE block_number >= ?", (from_block,)).fetchall()
+            self._writer.execute("DELETE FROM transfers WHERE block_number >= ?", (from_block,))
+            self._writer.execute("UPDATE meta SET value = MIN(value, ?) WHERE key = 'checkpoint'", (from_block - 1,))
+        return [_row(*r) for r in rows]
+
+    def clear(self):
+        """Forget every transfer and the checkpoint (the chain reorganised deeper than any known fork point)."""
+        with self._write_lock, self._writer:
+            self._writer.execute("DELETE FROM transfers")
+            self._writer.execute("DELETE FROM meta WHERE key = 'checkpoint'")
+
+    # --- Reads ---
+
+    @property
+    def checkpoint(self):
+        row = self._reader().execute("SELECT value FROM meta WHERE key = 'checkpoint'").fetchone()
+        return row[0] if row else None
+
+    def transfers(self):
+        """Every stored transfer in chain order."""
+        cursor = self._reader().execute("SELECT * FROM transfers ORDER BY block_number, log_index")
+        for row in cursor:
+            yield _row(*row)
@@ -0,0 +1,169 @@
+# backend/storage/vote_store.py
+"""
+Compact SQLite store of decoded `Voted` events.
+
+Voters and tx hashes are kept as raw bytes, rows live in WITHOUT ROWID tables
+clustered on their lookup keys, and per-proposal tallies are maintained on
+insert so "who voted on N" and "what did X vote on" are index range scans.
+"""
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS votes (
+    proposal_id INTEGER NOT NULL,
+    voter BLOB NOT NULL,
+    support INTEGER NOT NULL,
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    tx_hash BLOB NOT NULL,
+    PRIMARY KEY (proposal_id, voter)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_votes_voter ON votes (voter, proposal_id);
+CREATE INDEX IF NOT EXISTS idx_votes_block ON votes (block_number, log_index);
+CREATE TABLE IF NOT EXISTS tallies (
+    proposal_id INTEGER PRIMARY KEY,
+    yes INTEGER NOT NULL DEFAULT 0,
+    no INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def _addr_bytes(address: str) -> bytes:
+    return bytes.fromhex(address[2:] if address.startswith(("0x", "0X")) else address)
+
+
+def _hash_bytes(tx_hash: str) -> bytes:
+    return bytes.fromhex(tx_hash[2:] if tx_hash.startswith("0x") else tx_hash)
+
+
+class VoteStore:
+    """Thread-safe wrapper: one shared writer connection, one reader connection per thread."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        self._writer = self._connect()
+        self._writer.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reader(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    # --- Writes ---
+
+    def add_votes(self, votes, checkpoint: int = None):
+        """
+        Insert decoded Voted events (dicts from `decode_logs`) in one transaction,
+        optionally advancing the checkpoint. Re-inserting a known vote is a no-op.
+        """
+        with self._write_lock, self._writer:
+            for ev in votes:
+                args = ev["args"]
+                pid = int(args["id"])
+                support = 1 if args["support"] else 0
+                cur = self._writer.execute(
+                    "INSERT OR IGNORE INTO votes VALUES (?, ?, ?, ?, ?, ?)",
+                    (pid, _addr_bytes(args["voter"]), support, ev["blockNumber"], ev["logIndex"], _hash_bytes(ev["transactionHash"])),
+                )
+                if cur.rowcount:
+                    column = "yes" if support else "no"
+                    self._writer.execute(
+                        f"INSERT INTO tallies (proposal_id, {column}) VALUES (?, 1) "
+                        f"ON CONFLICT(proposal_id) DO UPDATE SET {column} = {column} + 1",
+                        (pid,),
+                    )
+            if checkpoint is not None:
+                self._writer.execute(
+                    "INSERT INTO meta VALUES ('checkpoint', ?) ON CONFLICT(key) DO UPDATE SET value = MAX(value, excluded.value)",
+                    (checkpoint,),
+                )
+
+    def rollback(self, from_block: int):
+        """
+        Forget votes from `from_block` on (they were in blocks replaced by a reorg),
+        adjusting tallies and moving the checkpoint back before `from_block`.
+        """
+        with self._write_lock, self._writer:
+            counts = self._writer.execute(
+                "SELECT proposal_id, SUM(support), SUM(1 - support) FROM votes WHERE block_number >= ? GROUP BY proposal_id",
+                (from_block,),
+            ).fetchall()
+            for pid, yes, no in counts:
+                self._writer.execute("UPDATE tallies SET yes = yes - ?, no = no - ? WHERE proposal_id = ?", (yes, no, pid))
+            self._writer.execute("DELETE FROM votes WHERE block_number >= ?", (from_block,))
+            self._writer.execute("UPDATE meta SET value = MIN(value, ?) WHERE key = 'checkpoint'", (from_block - 1,))
+        return sum(yes + no for _, yes, no in counts)
+
+    def clear(self):
+        """Forget every vote and the checkpoint (the chain reorganised deeper than any known fork point)."""
+        with self._write_lock, self._writer:
+            self._writer.execute("DELETE FROM votes")
+            self._writer.execute("DELETE FROM tallies")
+            self._writer.execute("DELETE FROM meta WHERE key = 'checkpoint'")
+
+    # --- Reads ---
+
+    @property
+    def checkpoint(self):
+        row = self._reader().execute("SELECT value FROM meta WHERE key = 'checkpoint'").fetchone()
+        return row[0] if row else None
+
+    def tally(self, proposal_id: int) -> dict:
+        row = self._reader().execute("SELECT yes, no FROM tallies WHERE proposal_id = ?", (proposal_id,)).fetchone()
+        yes, no = row if row else (0, 0)
+        return {"yes": yes, "no": no, "total": yes + no}
+
+    def votes_for_proposal(self, proposal_id: int, limit: int = 100, after: str = None) -> list:
+        """Votes on a proposal ordered by voter address; `after` is the last voter of the previous page."""
+        rows = self._reader().execute(
+            "SELECT voter, support, block_number, tx_hash FROM votes "
+            "WHERE proposal_id = ? AND voter > ? ORDER BY voter LIMIT ?",
+            (proposal_id, _addr_bytes(after) if after else b"", limit),
+        ).fetchall()
+        return [
+            {"voter": "0x" + voter.hex(), "support": bool(support), "block": block, "tx_hash": "0x" + tx.hex()}
+            for voter, support, block, tx in rows
+        ]
+
+    def votes_in_blocks(self, from_block: int, to_block: int, limit: int = 1000, after: tuple = None) -> list:
+        """
+        Votes in blocks [from_block, to_block] in chain order. `after` is the
+        (block, log_index) of the last vote of the previous page.
+        """
+        start = after or (from_block, -1)
+        rows = self._reader().execute(
+            "SELECT proposal_id, voter, support, block_number, log_index, tx_hash FROM votes "
+            "WHERE (block_number, log_index) > (?, ?) AND block_number <= ? ORDER BY block_number, log_index LIMIT ?",
+            (start[0], start[1], to_block, limit),
+        ).fetchall()
+        return [
+            {"proposal_id": pid, "voter": "0x" + voter.hex(), "support": bool(support), "block": block,
+             "log_index": log_index, "tx_hash": "0x" + tx.hex()}
+            for pid, voter, support, block, log_index, tx in rows
+        ]
+
+    def votes_by_voter(self, voter: str, limit: int = 100, after: int = None) -> list:
+        """Votes cast by an address ordered by proposal id; `after` is the last proposal id of the previous page."""
+        rows = self._reader().execute(
+            "SELECT proposal_id, support, block_number, tx_hash FROM votes "
+            "WHERE voter = ? AND proposal_id > ? ORDER BY proposal_id LIMIT ?",
+            (_addr_bytes(voter), -1 if after is None else after, limit),
+        ).fetchall()
+        return [
+            {"proposal_id": pid, "support": bool(support), "block": block, "tx_hash": "0x" + tx.hex()}
+            for pid, support, block, tx in rows
+        ]
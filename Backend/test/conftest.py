@@ -0,0 +1,21 @@
+# backend/tests/conftest.py
+"""
+Placeholder configuration so the suite runs without a `.env`. Settings are read
+once, on first import, so this has to happen before any app module is
+imported. Nothing in the unit tests talks to the node or IPFS.
+"""
+import os
+import tempfile
+
+if not os.path.exists(".env"):
+    for key, value in {
+        "CELO_RPC": "http://127.0.0.1:8545",
+        "PRIVATE_KEY": "0x" + "11" * 32,
+        "DAO_CONTRACT": "0x" + "d0" * 20,
+        "TREASURY_CONTRACT_ADDRESS": "0x" + "7e" * 20,
+        "PINATA_API_KEY": "test",
+        "PINATA_SECRET": "test",
+        "WATCHER_ENABLED": "false",
+        "DATA_DIR": tempfile.mkdtemp(prefix="echodao-test-"),
+    }.items():
+        os.environ.setdefault(key, value)
@@ -0,0 +1,114 @@
+# backend/tests/test_admission.py
+import asyncio
+import pytest
+from fastapi import HTTPException
+from utils.admission import AdmissionController
+
+
+def test_waiters_served_lowest_priority_first():
+    async def scenario():
+        ctrl = AdmissionController("test", concurrency=1, max_queue=10, queue_timeout=5)
+        order = []
+        gate = asyncio.Event()
+
+        async def holder():
+            async with ctrl.slot():
+                await gate.wait()
+
+        async def waiter(priority):
+            async with ctrl.slot(priority=priority):
+                order.append(priority)
+
+        first = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(waiter(p)) for p in (30, 10, 20)]
+        await asyncio.sleep(0)
+        assert ctrl.queued == 3
+        gate.set()
+        await asyncio.gather(first, *waiters)
+        return order, ctrl
+
+    order, ctrl = asyncio.run(scenario())
+    assert order == [10, 20, 30]
+    assert ctrl._active == 0 and ctrl.queued == 0
+
+
+def test_full_queue_rejected_with_retry_after():
+    async def scenario():
+        ctrl = AdmissionController("test", concurrency=1, max_queue=1, queue_timeout=5)
+        gate = asyncio.Event()
+
+        async def hold():
+            async with ctrl.slot():
+                await gate.wait()
+
+        tasks = [asyncio.create_task(hold()), asyncio.create_task(hold())]
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as exc:
+            async with ctrl.slot():
+                pass
+        gate.set()
+        await asyncio.gather(*tasks)
+        return exc.value, ctrl
+
+    exc, ctrl = asyncio.run(scenario())
+    assert exc.status_code == 503 and int(exc.headers["Retry-After"]) >= 1
+    assert ctrl._active == 0
+
+
+def test_timeout_and_cancel_leave_no_waiters():
+    async def scenario():
+        ctrl = AdmissionController("test", concurrency=1, max_queue=10, queue_timeout=0.05)
+        gate = asyncio.Event()
+
+        async def hold():
+            async with ctrl.slot():
+                await gate.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException):
+            async with ctrl.slot():
+                pass
+        assert ctrl.queued == 0
+
+        cancelled = asyncio.create_task(ctrl.slot().__aenter__())
+        await asyncio.sleep(0)
+        assert ctrl.queued == 1
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert ctrl.queued == 0
+
+        gate.set()
+        await holder
+        async with ctrl.slot():
+            pass
+        return ctrl
+
+    ctrl = asyncio.run(scenario())
+    assert ctrl._active == 0 and ctrl.queued == 0
+
+
+def test_release_skips_timed_out_waiters():
+    # Releases racing waiters whose deadline has fired but whose task has not yet
+    # resumed used to raise InvalidStateError and leak a slot for good
+    async def scenario():
+        ctrl = AdmissionController("test", concurrency=2, max_queue=10_000, queue_timeout=0.01)
+        errors = []
+
+        async def request(i):
+            try:
+                async with ctrl.slot(priority=i % 7):
+                    await asyncio.sleep(0.001 * (i % 3))
+            except HTTPException:
+                pass
+            except Exception as e:
+                errors.append(e)
+
+        await asyncio.gather(*(request(i) for i in range(4000)))
+        return ctrl, errors
+
+    ctrl, errors = asyncio.run(scenario())
+    assert errors == []
+    assert ctrl._active == 0 and ctrl.queued == 0
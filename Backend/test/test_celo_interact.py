@@ -0,0 +1,60 @@
+# backend/tests/test_celo_interact.py
+import pytest
+from web3.exceptions import Web3RPCError
+from blockchain import celo_interact
+from blockchain.celo_interact import LOG_GROW_AFTER, iter_logs
+
+
+class FakeEth:
+    """eth_getLogs that rejects ranges wider than `max_range` and fails `flaky` times on request."""
+
+    def __init__(self, max_range: int, flaky: int = 0):
+        self.max_range = max_range
+        self.flaky = flaky
+        self.calls = []
+
+    def get_logs(self, params):
+        span = params["toBlock"] - params["fromBlock"] + 1
+        self.calls.append(span)
+        if self.flaky:
+            self.flaky -= 1
+            raise ConnectionError("connection reset by peer")
+        if span > self.max_range:
+            raise Web3RPCError("{'code': -32005, 'message': 'query returned more than 10000 results'}")
+        return [params["fromBlock"]]
+
+
+class FakeWeb3:
+    def __init__(self, eth):
+        self.eth = eth
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(celo_interact.time, "sleep", lambda s: None)
+
+
+def test_chunk_halves_on_range_errors_and_grows_back(monkeypatch, no_sleep):
+    eth = FakeEth(max_range=250)
+    monkeypatch.setattr(celo_interact, "w3", FakeWeb3(eth))
+    chunks = list(iter_logs(0, 9999, "0xdao", chunk_size=1000))
+    # Contiguous coverage of the whole range
+    assert chunks[0][0] == 0 and chunks[-1][1] == 9999
+    assert all(a[1] + 1 == b[0] for a, b in zip(chunks, chunks[1:]))
+    assert eth.calls[:2] == [1000, 500]
+    # After LOG_GROW_AFTER good calls the chunk is tried at 500 again, then halved back
+    assert eth.calls[2:2 + LOG_GROW_AFTER + 2] == [250] * LOG_GROW_AFTER + [500, 250]
+
+
+def test_other_errors_are_retried_then_raised(monkeypatch, no_sleep):
+    eth = FakeEth(max_range=1000, flaky=1)
+    monkeypatch.setattr(celo_interact, "w3", FakeWeb3(eth))
+    assert [c[:2] for c in iter_logs(0, 1999, "0xdao", chunk_size=1000)] == [(0, 999), (1000, 1999)]
+    # A node that is down is not mistaken for a range that is too large
+    assert eth.calls == [1000, 1000, 1000]
+
+    eth = FakeEth(max_range=1000, flaky=10)
+    monkeypatch.setattr(celo_interact, "w3", FakeWeb3(eth))
+    with pytest.raises(ConnectionError):
+        list(iter_logs(0, 1999, "0xdao", chunk_size=1000))
+    assert eth.calls == [1000] * celo_interact.LOG_RETRIES
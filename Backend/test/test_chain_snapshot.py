@@ -0,0 +1,54 @@
+# backend/tests/test_chain_snapshot.py
+import pytest
+from blockchain.proposal_record import ProposalRecord
+from storage.chain_snapshot import CRC, SnapshotError, read_snapshot, write_snapshot
+
+TARGET = "0x" + "7e" * 20
+
+
+def record(pid: int, yes: int = 0, executed: bool = False) -> ProposalRecord:
+    return ProposalRecord(pid, TARGET, (pid + 1) * 10 ** 30, bytes([pid]) * pid, f"Proposal {pid} · fund ✓",
+                          100 + pid, 200 + pid, yes, 1, executed)
+
+
+def write_sample(path):
+    records = [record(i, yes=i) for i in range(5)]
+    undo = [(150, 3, record(3, yes=2)), (151, 5, None), (152, 4, record(4, yes=3, executed=True))]
+    hashes = [(150, b"\x01" * 32), (151, b"\x02" * 32)]
+    write_snapshot(path, 152, 5, hashes, records, undo, treasury={"balance_wei": str(10 ** 25), "block": 152})
+    return records, undo, hashes
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "chain_state.snap")
+    records, undo, hashes = write_sample(path)
+    snap = read_snapshot(path)
+    assert snap["checkpoint"] == 152 and snap["next_proposal_id"] == 5
+    assert snap["block_hashes"] == hashes
+    assert snap["records"] == records
+    assert snap["undo"] == undo
+    assert snap["treasury"] == {"balance_wei": str(10 ** 25), "block": 152}
+    assert not (tmp_path / "chain_state.snap.tmp").exists()
+
+
+def test_empty_state_round_trip(tmp_path):
+    path = str(tmp_path / "chain_state.snap")
+    write_snapshot(path, 7, 0, [], [], [])
+    snap = read_snapshot(path)
+    assert (snap["checkpoint"], snap["records"], snap["undo"], snap["treasury"]) == (7, [], [], None)
+
+
+@pytest.mark.parametrize("damage", ["flip", "truncate", "short"])
+def test_corrupt_snapshot_rejected(tmp_path, damage):
+    path = tmp_path / "chain_state.snap"
+    write_sample(str(path))
+    data = bytearray(path.read_bytes())
+    if damage == "flip":
+        data[len(data) // 2] ^= 0xFF
+    elif damage == "truncate":
+        data = data[:-CRC.size - 10] + data[-CRC.size:]
+    else:
+        data = data[:8]
+    path.write_bytes(bytes(data))
+    with pytest.raises(SnapshotError):
+        read_snapshot(str(path))
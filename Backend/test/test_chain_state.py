@@ -0,0 +1,119 @@
+# backend/tests/test_chain_state.py
+from blockchain import chain_state as chain_state_module
+from blockchain.celo_interact import dao_contract
+from blockchain.chain_state import ChainState
+from blockchain.proposal_record import ProposalRecord
+
+TARGET = "0x" + "7e" * 20
+
+
+class FakeWatcher:
+    running, behind, head = True, 0, None
+
+    def add_listener(self, fn):
+        pass
+
+    def add_reorg_listener(self, fn):
+        pass
+
+    def block_hashes(self):
+        return [(105, b"\x05" * 32)]
+
+
+class FakeTreasury:
+    def snapshot(self):
+        return None
+
+    def restore(self, snapshot):
+        pass
+
+
+class FakeBatch:
+    def __init__(self):
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add(self, call):
+        self.calls.append(call)
+
+    def execute(self):
+        # proposals(id) for a new proposal: (target, value, callData, description, ...)
+        return [(TARGET, 10 ** 18, b"", "new", 0, 0, 0, 0, False) for _ in self.calls]
+
+
+class FakeWeb3:
+    def batch_requests(self):
+        return FakeBatch()
+
+
+def event(name: str, block: int, **args) -> dict:
+    return {"event": name, "address": dao_contract.address, "blockNumber": block, "args": args}
+
+
+def make_state(tmp_path, monkeypatch, reorg_depth: int = 12) -> ChainState:
+    monkeypatch.setattr(chain_state_module, "w3", FakeWeb3())
+    state = ChainState(FakeWatcher(), FakeTreasury(), path=str(tmp_path / "chain_state.snap"),
+                       snapshot_interval=3600, reorg_depth=reorg_depth)
+    for pid in (0, 1):
+        state.proposals.put(ProposalRecord(pid, TARGET, 10 ** 18, b"", f"p{pid}", 10, 500, 0, 0, False))
+    state.next_proposal_id = 2
+    state.checkpoint = 100
+    return state
+
+
+def rows(state: ChainState):
+    return [(r.proposal_id, r.yes_votes, r.no_votes, r.executed) for r in state.proposals.records()]
+
+
+def apply_sample(state: ChainState):
+    state.on_blocks(101, 105, [
+        event("Voted", 102, id=0, support=True),
+        event("ProposalCreated", 103, id=2, blockStart=103, blockEnd=600),
+        event("Voted", 104, id=2, support=False),
+        event("Voted", 104, id=0, support=False),
+        event("ProposalExecuted", 105, id=1),
+    ])
+
+
+def test_reorg_undoes_changes_from_the_fork_block(tmp_path, monkeypatch):
+    state = make_state(tmp_path, monkeypatch)
+    apply_sample(state)
+    assert rows(state) == [(0, 1, 1, False), (1, 0, 0, True), (2, 0, 1, False)]
+    assert state.next_proposal_id == 3 and state.checkpoint == 105
+
+    state.on_reorg(103)
+    assert rows(state) == [(0, 1, 0, False), (1, 0, 0, False)]
+    assert state.next_proposal_id == 2 and state.checkpoint == 102
+
+    # The replacement blocks are applied on top of the rolled-back table
+    state.on_blocks(103, 104, [event("Voted", 103, id=1, support=True)])
+    assert rows(state) == [(0, 1, 0, False), (1, 1, 0, False)]
+    assert state.checkpoint == 104
+
+
+def test_undo_survives_a_snapshot_round_trip(tmp_path, monkeypatch):
+    state = make_state(tmp_path, monkeypatch)
+    apply_sample(state)
+    state.save()
+
+    restored = ChainState(FakeWatcher(), FakeTreasury(), path=state.path, snapshot_interval=3600)
+    assert restored.load() == (106, [(105, b"\x05" * 32)])
+    assert rows(restored) == rows(state)
+    restored.on_reorg(104)
+    state.on_reorg(104)
+    assert rows(restored) == rows(state) == [(0, 1, 0, False), (1, 0, 0, False), (2, 0, 0, False)]
+
+
+def test_reorg_deeper_than_the_undo_window_drops_the_table(tmp_path, monkeypatch):
+    state = make_state(tmp_path, monkeypatch, reorg_depth=3)
+    apply_sample(state)
+    # Only changes from the last `reorg_depth` blocks are kept
+    assert {block for block, _, _ in state._undo} == {103, 104, 105}
+
+    state.on_reorg(102)
+    assert state.checkpoint is None and len(state.proposals) == 0
@@ -0,0 +1,124 @@
+# backend/tests/test_chain_watcher.py
+import pytest
+from blockchain import chain_watcher as chain_watcher_module
+from blockchain.chain_state import ChainState
+from blockchain.chain_watcher import DEEP_REORG, ChainWatcher
+from blockchain.proposal_record import ProposalRecord
+from blockchain.stats import StatsAggregator
+from blockchain.vote_indexer import VoteIndexer
+
+
+class FakeBatch:
+    def __init__(self):
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add(self, result):
+        self.calls.append(result)
+
+    def execute(self):
+        return self.calls
+
+
+class FakeEth:
+    def __init__(self, node):
+        self.node = node
+
+    @property
+    def block_number(self):
+        return self.node.latest
+
+    def get_block_number(self):
+        return self.node.latest
+
+    def get_block(self, number):
+        return {"number": number, "hash": self.node.hash(number)}
+
+    def get_logs(self, flt):
+        return []
+
+
+class FakeNode:
+    """Canonical chain whose blocks from `forked_from` on have been replaced."""
+
+    def __init__(self, latest: int):
+        self.latest = latest
+        self.forked_from = None
+        self.eth = FakeEth(self)
+
+    def hash(self, number: int) -> bytes:
+        fork = 1 if self.forked_from is not None and number >= self.forked_from else 0
+        return number.to_bytes(31, "big") + bytes([fork])
+
+    def batch_requests(self):
+        return FakeBatch()
+
+
+class FakeTreasury:
+    def snapshot(self):
+        return None
+
+    def restore(self, snapshot):
+        pass
+
+
+@pytest.fixture
+def node(monkeypatch):
+    node = FakeNode(latest=100)
+    monkeypatch.setattr(chain_watcher_module, "w3", node)
+    return node
+
+
+def follow(watcher: ChainWatcher, node: FakeNode, to_block: int, step: int):
+    while watcher.head < to_block:
+        node.latest = min(to_block, watcher.head + step)
+        watcher.poll_once()
+
+
+def test_rewind_to_the_newest_surviving_block(node):
+    watcher = ChainWatcher(max_block_range=5, reorg_depth=12)
+    forks = []
+    watcher.add_reorg_listener(forks.append)
+    watcher.head = 100
+    follow(watcher, node, 120, step=5)
+    assert [b for b, _ in watcher.block_hashes()] == [110, 115, 120]
+
+    node.forked_from = 118
+    watcher.poll_once()
+    assert forks == [116] and watcher.head == 115
+    assert [b for b, _ in watcher.block_hashes()] == [110, 115]
+
+
+def test_reorg_deeper_than_the_window_asks_listeners_to_rebuild(node, tmp_path):
+    watcher = ChainWatcher(max_block_range=5, reorg_depth=12)
+    state = ChainState(watcher, FakeTreasury(), path=str(tmp_path / "chain_state.snap"), snapshot_interval=3600,
+                       reorg_depth=12)
+    state.proposals.put(ProposalRecord(0, "0x" + "7e" * 20, 1, b"", "p0", 10, 500, 3, 1, False))
+    state.next_proposal_id, state.checkpoint = 1, 100
+    votes = VoteIndexer(watcher, start_block=50)
+    votes.open(str(tmp_path / "votes.db"))
+    votes.store.add_votes([], checkpoint=100)
+    stats = StatsAggregator(watcher, state, start_block=50)
+    stats.open(str(tmp_path / "stats.db"))
+    stats.ledger.add_transfers([], checkpoint=100)
+    forks = []
+    watcher.add_reorg_listener(forks.append)
+
+    watcher.head = 100
+    follow(watcher, node, 120, step=5)
+    assert state.checkpoint == votes.store.checkpoint == stats.ledger.checkpoint == 120
+
+    # Every recorded block (110..120) was replaced: the real fork point is unknown
+    node.forked_from = 104
+    watcher.poll_once()
+    assert forks == [DEEP_REORG]
+    assert watcher.head == 109 and watcher.block_hashes() == []
+    # Nothing is rolled back to a guessed block: derived state is rebuilt from scratch
+    assert state.checkpoint is None and len(state.proposals) == 0
+    assert votes.store.checkpoint is None and votes.live_from is None
+    assert stats.ledger.checkpoint is None and stats.treasury_block is None
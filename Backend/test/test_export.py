@@ -0,0 +1,16 @@
+# backend/tests/test_export.py
+from blockchain import export
+from blockchain.vote_indexer import vote_indexer
+from storage.vote_store import VoteStore
+
+
+def test_vote_source_needs_the_whole_range_indexed(tmp_path, monkeypatch):
+    store = VoteStore(str(tmp_path / "votes.db"))
+    store.add_votes([], checkpoint=500)
+    monkeypatch.setattr(vote_indexer, "store", store)
+    monkeypatch.setattr(export, "VOTES_START_BLOCK", 100)
+    assert export.vote_source() == "local"
+    assert export.vote_source(100, 500) == "local"
+    assert export.vote_source(100, 501) == "logs"
+    # Blocks before the index starts were never indexed
+    assert export.vote_source(99, 200) == "logs"
@@ -0,0 +1,68 @@
+# backend/tests/test_fees.py
+import pytest
+from web3.exceptions import Web3RPCError
+from blockchain.fees import BUMP_FACTOR, FeeStrategy
+
+
+class FakeEth:
+    def __init__(self, fee_history_error=None):
+        self.fee_history_error = fee_history_error
+        self.fee_history_calls = 0
+        self.gas_price = 5 * 10 ** 9
+        self.max_priority_fee = 10 ** 9
+        self.chain_id = 44787
+
+    def fee_history(self, blocks, newest, percentiles):
+        self.fee_history_calls += 1
+        if self.fee_history_error is not None:
+            raise self.fee_history_error
+        return {"oldestBlock": 100, "baseFeePerGas": [10 ** 9] * (blocks + 1),
+                "reward": [[10 ** 8 * (i + 1) for i in range(len(percentiles))]] * blocks}
+
+
+class FakeWeb3:
+    def __init__(self, **kwargs):
+        self.eth = FakeEth(**kwargs)
+
+
+def test_fees_from_cached_fee_history():
+    w3 = FakeWeb3()
+    strategy = FeeStrategy(w3, cache_ttl=60, history_blocks=4)
+    slow, fast = strategy.fees("slow"), strategy.fees("fast")
+    assert slow["maxPriorityFeePerGas"] < fast["maxPriorityFeePerGas"]
+    assert fast["maxFeePerGas"] >= fast["maxPriorityFeePerGas"] + 10 ** 9
+    assert w3.eth.fee_history_calls == 1
+
+
+@pytest.mark.parametrize("txn", [
+    {"maxFeePerGas": 30 * 10 ** 9, "maxPriorityFeePerGas": 5 * 10 ** 9},
+    {"maxFeePerGas": 10 ** 9, "maxPriorityFeePerGas": 10 ** 8},
+])
+def test_bump_raises_both_fees_by_at_least_the_factor(txn):
+    bumped = FeeStrategy(FakeWeb3(), cache_ttl=60, history_blocks=4).bump(txn)
+    assert bumped["maxFeePerGas"] >= txn["maxFeePerGas"] * BUMP_FACTOR
+    assert bumped["maxPriorityFeePerGas"] >= txn["maxPriorityFeePerGas"] * BUMP_FACTOR
+    assert bumped["maxFeePerGas"] >= bumped["maxPriorityFeePerGas"]
+
+
+def test_bump_legacy_gas_price():
+    bumped = FeeStrategy(FakeWeb3(), cache_ttl=60, history_blocks=4).bump({"gasPrice": 10 ** 10})
+    assert bumped["gasPrice"] >= 10 ** 10 * BUMP_FACTOR
+
+
+def test_transient_fee_history_error_does_not_disable_eip1559():
+    w3 = FakeWeb3(fee_history_error=Web3RPCError("upstream timeout", {"error": {"code": -32000, "message": "timeout"}}))
+    strategy = FeeStrategy(w3, cache_ttl=0, history_blocks=4)
+    assert strategy.fees() == {"gasPrice": w3.eth.gas_price}
+    w3.eth.fee_history_error = None
+    assert "maxFeePerGas" in strategy.fees()
+    assert strategy.eip1559
+
+
+def test_method_not_found_switches_to_legacy():
+    w3 = FakeWeb3(fee_history_error=Web3RPCError("no such method", {"error": {"code": -32601, "message": "not found"}}))
+    strategy = FeeStrategy(w3, cache_ttl=0, history_blocks=4)
+    strategy.fees()
+    strategy.fees()
+    assert not strategy.eip1559
+    assert w3.eth.fee_history_calls == 1
@@ -0,0 +1,73 @@
+# backend/tests/test_idempotency_store.py
+import time
+from storage import idempotency_store
+from storage.idempotency_store import IdempotencyStore
+
+TX_A = "0x" + "aa" * 32
+TX_B = "0x" + "bb" * 32
+
+
+def make_store(tmp_path, **kwargs):
+    return IdempotencyStore(str(tmp_path / "idempotency.db"), **kwargs)
+
+
+def test_begin_complete_replay(tmp_path):
+    store = make_store(tmp_path)
+    assert store.begin("vote", "k", b"body") == (idempotency_store.NEW, None)
+    assert store.begin("vote", "k", b"body") == (idempotency_store.IN_PROGRESS, None)
+    store.complete("vote", "k", 200, b'{"ok":true}')
+    assert store.begin("vote", "k", b"body") == (idempotency_store.DONE, (200, b'{"ok":true}'))
+    # Keys are scoped per endpoint
+    assert store.begin("execute", "k", b"body") == (idempotency_store.NEW, None)
+
+
+def test_reused_key_with_other_body_is_mismatch(tmp_path):
+    store = make_store(tmp_path)
+    store.begin("vote", "k", b"body")
+    assert store.begin("vote", "k", b"other") == (idempotency_store.MISMATCH, None)
+
+
+def test_release_before_sending_allows_retry(tmp_path):
+    store = make_store(tmp_path)
+    store.begin("vote", "k", b"body")
+    assert store.release("vote", "k")
+    assert store.begin("vote", "k", b"body") == (idempotency_store.NEW, None)
+
+
+def test_release_after_sending_keeps_hashes(tmp_path):
+    store = make_store(tmp_path)
+    store.begin("vote", "k", b"body")
+    store.record_sent("vote", "k", TX_A)
+    store.record_sent("vote", "k", TX_B)
+    assert not store.release("vote", "k")
+    assert store.begin("vote", "k", b"body") == (idempotency_store.SENT, [TX_A, TX_B])
+    # The recovering request now holds the claim
+    assert store.begin("vote", "k", b"body") == (idempotency_store.IN_PROGRESS, None)
+
+
+def test_dead_claim_reclaimed_only_if_nothing_was_sent(tmp_path):
+    store = make_store(tmp_path, claim_timeout=0.05)
+    store.begin("vote", "idle", b"body")
+    store.begin("vote", "sent", b"body")
+    store.record_sent("vote", "sent", TX_A)
+    time.sleep(0.1)
+    assert store.begin("vote", "idle", b"body") == (idempotency_store.NEW, None)
+    assert store.begin("vote", "sent", b"body") == (idempotency_store.SENT, [TX_A])
+
+
+def test_prune_never_drops_unfinished_claims(tmp_path):
+    store = make_store(tmp_path, max_entries=2)
+    store.PRUNE_EVERY = 1
+    store.begin("vote", "running", b"body")
+    store.begin("vote", "sent", b"body")
+    store.record_sent("vote", "sent", TX_A)
+    store.release("vote", "sent")
+    for i in range(5):
+        store.begin("vote", f"done-{i}", b"body")
+        store.complete("vote", f"done-{i}", 200, b"{}")
+    store.begin("vote", "last", b"body")
+    assert store.begin("vote", "running", b"body") == (idempotency_store.IN_PROGRESS, None)
+    assert store.begin("vote", "sent", b"body") == (idempotency_store.SENT, [TX_A])
+    # Only completed rows are capped: the two newest survive
+    assert store.begin("vote", "done-0", b"body")[0] == idempotency_store.NEW
+    assert store.begin("vote", "done-4", b"body")[0] == idempotency_store.DONE
@@ -0,0 +1,38 @@
+# backend/tests/test_profiling.py
+import asyncio
+import sys
+import threading
+from utils import profiling
+from utils.profiling import Profile, run_in_threadpool
+
+
+def test_samples_follow_the_request_into_the_threadpool_only():
+    sampled = {}
+
+    def work():
+        # What the sampler thread would see while the request's threadpool call runs
+        profile = sampled["profile"]
+        sampled["threads"] = set(profile._threads)
+        sampled["worker"] = threading.get_ident()
+        profile.sample(sys._current_frames())
+
+    async def handler():
+        # Created on the event loop, as ProfilingMiddleware does
+        profile = sampled["profile"] = Profile("GET", "/test", "header")
+        profile.enter(profile.root)
+        token = profiling._current.set(profile.root)
+        try:
+            # Other requests' coroutines run on this thread while the handler awaits
+            sampled["idle"] = set(profile._threads)
+            await run_in_threadpool(work)
+            sampled["loop"] = threading.get_ident()
+        finally:
+            profiling._current.reset(token)
+            profile.exit(profile.root)
+
+    asyncio.run(handler())
+    profile = sampled["profile"]
+    assert sampled["idle"] == set()
+    assert sampled["threads"] == {sampled["worker"]} and sampled["worker"] != sampled["loop"]
+    assert any(":work:" in stack for stack in profile.samples)
+    assert not profile._threads
@@ -0,0 +1,85 @@
+# backend/tests/test_response_cache.py
+import asyncio
+import json
+import time
+from starlette.requests import Request
+from utils.response_cache import ResponseCache, etag_matches
+
+
+def make_request(if_none_match: str = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class Chain:
+    def __init__(self, block=100):
+        self.block = block
+
+    def __call__(self):
+        return (self.block, time.time()) if self.block is not None else (None, None)
+
+
+def counting_builder(payload):
+    calls = []
+
+    async def build():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return payload()
+
+    return build, calls
+
+
+def test_reused_until_the_block_changes():
+    chain = Chain()
+    cache = ResponseCache(chain, block_time=5)
+    value = {"n": 1}
+    build, calls = counting_builder(lambda: dict(value))
+
+    first = asyncio.run(cache.respond(make_request(), "k", build))
+    second = asyncio.run(cache.respond(make_request(), "k", build))
+    assert json.loads(first.body) == {"n": 1} and second.body == first.body
+    assert len(calls) == 1 and cache.hits == 1
+    assert first.headers["X-Indexed-Block"] == "100"
+    assert first.headers["Cache-Control"].startswith("public, max-age=")
+
+    chain.block, value["n"] = 101, 2
+    third = asyncio.run(cache.respond(make_request(), "k", build))
+    assert len(calls) == 2 and json.loads(third.body) == {"n": 2}
+    assert third.headers["ETag"] != first.headers["ETag"]
+
+
+def test_if_none_match_answers_304():
+    cache = ResponseCache(Chain())
+    build, _ = counting_builder(lambda: {"n": 1})
+    etag = asyncio.run(cache.respond(make_request(), "k", build)).headers["ETag"]
+    assert etag.startswith('"') and etag.endswith('"')
+
+    for header in (etag, f'"other", {etag}', "*"):
+        resp = asyncio.run(cache.respond(make_request(header), "k", build))
+        assert resp.status_code == 304 and resp.body == b""
+        assert resp.headers["ETag"] == etag
+    assert asyncio.run(cache.respond(make_request('"stale"'), "k", build)).status_code == 200
+    assert not etag_matches("", etag)
+
+
+def test_nothing_stored_without_an_indexed_block():
+    cache = ResponseCache(Chain(block=None))
+    build, calls = counting_builder(lambda: {"n": 1})
+    first = asyncio.run(cache.respond(make_request(), "k", build))
+    assert first.headers["Cache-Control"] == "no-cache" and "X-Indexed-Block" not in first.headers
+    # Still revalidates against the freshly built body
+    assert asyncio.run(cache.respond(make_request(first.headers["ETag"]), "k", build)).status_code == 304
+    assert len(calls) == 2 and len(cache._entries) == 0
+
+
+def test_concurrent_misses_share_one_build():
+    cache = ResponseCache(Chain())
+    build, calls = counting_builder(lambda: {"n": 1})
+
+    async def scenario():
+        return await asyncio.gather(*(cache.respond(make_request(), "k", build) for _ in range(10)))
+
+    responses = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert len({r.headers["ETag"] for r in responses}) == 1
@@ -0,0 +1,49 @@
+# backend/tests/test_similarity.py
+import random
+import statistics
+from ai.similarity import MAX_SHINGLES, NUM_PERM, MinHashIndex, _shingle_hashes, signature, similarity
+
+
+def test_identical_and_disjoint_texts():
+    text = "fund the community water well repair in the northern district"
+    assert similarity(signature(text), signature(text)) == 1.0
+    assert similarity(signature(text), signature("completely unrelated words about other topics")) < 0.2
+    assert signature("") == signature("!!")
+
+
+def test_estimate_error_close_to_binomial_on_short_texts():
+    # Slots must behave like independent permutations: error ~ sqrt(J(1-J)/NUM_PERM)
+    rng = random.Random(1)
+    vocab = [f"w{i}" for i in range(5000)]
+    errors, variances = [], []
+    for _ in range(1000):
+        a = [rng.choice(vocab) for _ in range(15)]
+        b = list(a)
+        for i in rng.sample(range(15), 2):
+            b[i] = rng.choice(vocab)
+        sa, sb = _shingle_hashes(" ".join(a)), _shingle_hashes(" ".join(b))
+        jaccard = len(sa & sb) / len(sa | sb)
+        variances.append(jaccard * (1 - jaccard) / NUM_PERM)
+        errors.append(similarity(signature(" ".join(a)), signature(" ".join(b))) - jaccard)
+    assert statistics.pstdev(errors) < 1.15 * statistics.mean(variances) ** 0.5
+
+
+def test_index_finds_near_copies_only():
+    index = MinHashIndex(capacity=2)
+    base = "please release ten celo to the school library fund for new books this term"
+    index.add(1, signature(base))
+    index.add(2, signature("a proposal about something else entirely with different wording"))
+    assert [key for key, _ in index.query(signature(base + " thanks"), threshold=0.7)] == [1]
+    index.add(3, signature("third entry evicts the oldest one"))
+    assert 1 not in index and len(index) == 2
+
+
+def test_long_texts_are_sampled_consistently():
+    rng = random.Random(2)
+    words = [f"w{rng.randrange(50_000)}" for _ in range(100_000)]
+    edited = list(words)
+    for i in rng.sample(range(len(words)), 200):
+        edited[i] = "changed"
+    assert len(_shingle_hashes(" ".join(words))) == MAX_SHINGLES
+    assert similarity(signature(" ".join(words)), signature(" ".join(edited))) > 0.9
+    assert similarity(signature(" ".join(words)), signature(" ".join(words[:50_000]))) < 0.7
@@ -0,0 +1,101 @@
+# backend/tests/test_singleflight.py
+import asyncio
+import threading
+import time
+import pytest
+from utils.singleflight import SINGLEFLIGHT_COALESCED, AsyncSingleFlight, SingleFlight
+
+
+def wait_for_followers(group: str, count: int):
+    deadline = time.monotonic() + 5
+    while SINGLEFLIGHT_COALESCED.value(group=group) < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight("test_share")
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fetch(x):
+        calls.append(x)
+        started.set()
+        release.wait(5)
+        return x * 2
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", fetch, 21)))
+    leader.start()
+    assert started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flight.do("k", fetch, 21))) for _ in range(8)]
+    for t in followers:
+        t.start()
+    wait_for_followers("test_share", 8)
+    release.set()
+    for t in [leader, *followers]:
+        t.join(5)
+    assert calls == [21]
+    assert results == [42] * 9
+    # The key is free again: the next call goes upstream
+    assert flight.do("k", fetch, 1) == 2 and calls == [21, 1]
+
+
+def test_error_is_shared_and_not_cached():
+    flight = SingleFlight("test_error")
+    started, release = threading.Event(), threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise ValueError("node down")
+
+    errors = []
+
+    def caller():
+        try:
+            flight.do("k", failing)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=caller)]
+    threads[0].start()
+    assert started.wait(5)
+    threads += [threading.Thread(target=caller) for _ in range(3)]
+    for t in threads[1:]:
+        t.start()
+    wait_for_followers("test_error", 3)
+    release.set()
+    for t in threads:
+        t.join(5)
+    assert len(errors) == 4
+    assert flight.do("k", lambda: "ok") == "ok"
+
+
+def test_async_callers_share_one_call_and_survive_cancellation():
+    async def scenario():
+        flight = AsyncSingleFlight("test")
+        gate = asyncio.Event()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await gate.wait()
+            return "result"
+
+        tasks = [asyncio.create_task(flight.do("k", fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        # A caller that goes away must not cancel the call the others wait on
+        tasks[0].cancel()
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*tasks[1:])
+        with pytest.raises(asyncio.CancelledError):
+            await tasks[0]
+        await asyncio.sleep(0)
+        return calls, results, flight._tasks
+
+    calls, results, pending = asyncio.run(scenario())
+    assert calls == 1
+    assert results == ["result"] * 4
+    assert pending == {}
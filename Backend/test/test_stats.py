@@ -0,0 +1,94 @@
+# backend/tests/test_stats.py
+import threading
+from blockchain import stats as stats_module
+from blockchain.celo_interact import treasury_contract
+from blockchain.chain_watcher import DEEP_REORG
+from blockchain.stats import StatsAggregator
+
+
+class FakeWatcher:
+    def add_listener(self, fn):
+        pass
+
+    def add_reorg_listener(self, fn):
+        pass
+
+
+class FakeState:
+    proposals = None
+    checkpoint = None
+    ready = False
+
+
+def received(block: int, amount: int) -> dict:
+    return {"event": "Received", "address": treasury_contract.address, "blockNumber": block, "logIndex": 0,
+            "transactionHash": "0x" + f"{block:064x}", "args": {"sender": "0x" + "ab" * 20, "amount": amount}}
+
+
+def test_backfill_runs_off_the_watcher_thread(tmp_path, monkeypatch):
+    history = [received(120, 1), received(150, 2)]
+    release, reading = threading.Event(), threading.Event()
+    requested = []
+
+    def slow_iter_logs(start, end, address, topics, chunk_size):
+        requested.append((start, end))
+        reading.set()
+        release.wait(5)
+        yield start, end, [ev for ev in history if start <= ev["blockNumber"] <= end]
+
+    monkeypatch.setattr(stats_module, "iter_logs", slow_iter_logs)
+    monkeypatch.setattr(stats_module, "decode_logs", lambda logs, names: logs)
+    agg = StatsAggregator(FakeWatcher(), FakeState(), start_block=100, chunk_size=1000)
+    agg.open(str(tmp_path / "stats.db"))
+
+    # Ranges past the (missing) checkpoint are counted at once while the backfill is stuck on the node
+    agg.on_blocks(200, 210, [received(205, 10)])
+    assert reading.wait(5)
+    agg.on_blocks(211, 215, [received(213, 20)])
+    assert agg.backfilling and requested == [(100, 199)]
+    assert agg.treasury.inflow_wei == 30
+    assert agg.treasury_block is None and agg.ledger.checkpoint is None
+
+    release.set()
+    agg._thread.join(5)
+    assert not agg.backfilling
+    assert agg.treasury.inflow_wei == 33 and agg.treasury.inflows == 4
+    assert agg.treasury_block == agg.ledger.checkpoint == 215
+
+    # Back in step with the watcher: later ranges advance the checkpoint directly
+    agg.on_blocks(216, 220, [])
+    assert agg.ledger.checkpoint == 220 and agg._thread is not None and not agg._thread.is_alive()
+
+
+def test_totals_survive_restart_and_reorg(tmp_path, monkeypatch):
+    monkeypatch.setattr(stats_module, "iter_logs", lambda *args: iter(()))
+    path = str(tmp_path / "stats.db")
+    agg = StatsAggregator(FakeWatcher(), FakeState(), start_block=100)
+    agg.open(path)
+    agg.on_blocks(100, 110, [received(105, 5), received(110, 7)])
+    assert agg.ledger.checkpoint == 110
+
+    agg.on_reorg(108)
+    assert agg.treasury.inflow_wei == 5 and agg.treasury_block == 107
+
+    restarted = StatsAggregator(FakeWatcher(), FakeState(), start_block=100)
+    restarted.open(path)
+    assert restarted.treasury.inflow_wei == 5 and restarted.treasury_block == 107
+
+
+def test_deep_reorg_rebuilds_the_ledger_from_the_start_block(tmp_path, monkeypatch):
+    history = [received(105, 5)]
+    monkeypatch.setattr(stats_module, "iter_logs", lambda start, end, address, topics, chunk_size: iter(
+        [(start, end, [ev for ev in history if start <= ev["blockNumber"] <= end])]))
+    monkeypatch.setattr(stats_module, "decode_logs", lambda logs, names: logs)
+    agg = StatsAggregator(FakeWatcher(), FakeState(), start_block=100)
+    agg.open(str(tmp_path / "stats.db"))
+    agg.on_blocks(100, 110, [received(105, 5), received(109, 7)])
+    assert agg.treasury.inflow_wei == 12
+
+    # The transfer at 109 did not survive the fork; nothing recorded says where the fork was
+    agg.on_reorg(DEEP_REORG)
+    assert agg.ledger.checkpoint is None and agg.treasury.inflow_wei == 0
+    agg.on_blocks(111, 112, [])
+    agg._thread.join(5)
+    assert agg.treasury.inflow_wei == 5 and agg.treasury_block == agg.ledger.checkpoint == 112
@@ -0,0 +1,57 @@
+# backend/tests/test_text_extractor.py
+import asyncio
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+import pytest
+from ai import text_extractor
+
+
+class FakePool:
+    """Executor whose tasks finish only when the test resolves them."""
+
+    def __init__(self):
+        self.futures = []
+        self.closed = False
+
+    def submit(self, fn, *args):
+        fut = Future()
+        self.futures.append(fut)
+        return fut
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.closed = True
+
+
+def test_broken_pool_only_discards_itself(monkeypatch):
+    pools = []
+
+    def new_pool(*args, **kwargs):
+        pools.append(FakePool())
+        return pools[-1]
+
+    monkeypatch.setattr(text_extractor, "ProcessPoolExecutor", new_pool)
+    monkeypatch.setattr(text_extractor, "_pool", None)
+    monkeypatch.setattr(text_extractor, "_slots", None)
+
+    async def scenario():
+        first = asyncio.create_task(text_extractor._run(len, "a"))
+        second = asyncio.create_task(text_extractor._run(len, "b"))
+        while not pools or len(pools[0].futures) < 2:
+            await asyncio.sleep(0)
+        # The first failure drops the pool and a new task starts a fresh one ...
+        pools[0].futures[0].set_exception(BrokenProcessPool("worker died"))
+        with pytest.raises(BrokenProcessPool):
+            await first
+        third = asyncio.create_task(text_extractor._run(len, "c"))
+        while len(pools) < 2 or not pools[1].futures:
+            await asyncio.sleep(0)
+        # ... which a late failure from the old pool must not throw away
+        pools[0].futures[1].set_exception(BrokenProcessPool("worker died"))
+        with pytest.raises(BrokenProcessPool):
+            await second
+        pools[1].futures[0].set_result(1)
+        return await third
+
+    assert asyncio.run(scenario()) == 1
+    assert len(pools) == 2 and pools[0].closed and not pools[1].closed
+    assert text_extractor._pool is pools[1]
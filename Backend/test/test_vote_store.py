@@ -0,0 +1,53 @@
+# backend/tests/test_vote_store.py
+from storage.vote_store import VoteStore
+
+ALICE, BOB, CAROL = ("0x" + c * 40 for c in "abc")
+
+
+def voted(pid: int, voter: str, support: bool, block: int, log_index: int = 0) -> dict:
+    return {"args": {"id": pid, "voter": voter, "support": support}, "blockNumber": block, "logIndex": log_index,
+            "transactionHash": "0x" + f"{block:060x}{log_index:04x}"}
+
+
+def make_store(tmp_path):
+    return VoteStore(str(tmp_path / "votes.db"))
+
+
+def test_tallies_follow_inserts_and_ignore_replays(tmp_path):
+    store = make_store(tmp_path)
+    votes = [voted(1, ALICE, True, 10), voted(1, BOB, False, 11), voted(2, ALICE, True, 11, 1)]
+    store.add_votes(votes, checkpoint=11)
+    store.add_votes(votes[:2], checkpoint=9)  # replayed range
+    assert store.tally(1) == {"yes": 1, "no": 1, "total": 2}
+    assert store.tally(2) == {"yes": 1, "no": 0, "total": 1}
+    assert store.tally(3) == {"yes": 0, "no": 0, "total": 0}
+    assert store.checkpoint == 11  # never moves backwards on insert
+
+
+def test_rollback_removes_votes_and_their_tallies(tmp_path):
+    store = make_store(tmp_path)
+    store.add_votes([voted(1, ALICE, True, 10), voted(1, BOB, False, 12), voted(1, CAROL, True, 13),
+                     voted(2, BOB, True, 13, 1)], checkpoint=15)
+
+    assert store.rollback(12) == 3
+    assert store.checkpoint == 11
+    assert store.tally(1) == {"yes": 1, "no": 0, "total": 1}
+    assert store.tally(2)["total"] == 0
+    assert [v["voter"] for v in store.votes_for_proposal(1)] == [ALICE]
+    assert store.votes_by_voter(BOB) == []
+
+    # The replacement blocks are indexed again without double counting
+    store.add_votes([voted(1, BOB, True, 12)], checkpoint=14)
+    assert store.tally(1) == {"yes": 2, "no": 0, "total": 2}
+    assert store.checkpoint == 14
+
+
+def test_pages_in_key_order(tmp_path):
+    store = make_store(tmp_path)
+    store.add_votes([voted(pid, ALICE, pid % 2 == 0, 20 + pid) for pid in range(5)]
+                    + [voted(0, voter, True, 30 + i) for i, voter in enumerate((CAROL, BOB))])
+    assert [v["voter"] for v in store.votes_for_proposal(0, limit=2)] == [ALICE, BOB]
+    assert [v["voter"] for v in store.votes_for_proposal(0, after=BOB)] == [CAROL]
+    assert [v["proposal_id"] for v in store.votes_by_voter(ALICE, limit=2, after=1)] == [2, 3]
+    rows = store.votes_in_blocks(21, 31, limit=3, after=(22, 0))
+    assert [(r["block"], r["proposal_id"]) for r in rows] == [(23, 3), (24, 4), (30, 0)]
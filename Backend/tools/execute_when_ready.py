@@ -6,10 +6,9 @@ Run from the `Backend` folder with the same Python environment used by the app.
 import time
 import requests
 from web3 import Web3
-from utils.config_loader import load_env
+from utils.config_loader import get_settings
 
-env = load_env()
-RPC = env.get('CELO_RPC')
+RPC = get_settings().celo_rpc
 BACKEND = 'http://127.0.0.1:8000'  # adjust if your backend is different
 PROPOSAL_ID = 3
 
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Export proposals, votes or treasury events as NDJSON, CSV or Parquet.
+Run from the `Backend` folder with the same Python environment used by the app.
+
+    python -m tools.export votes --format csv --out votes.csv
+    python -m tools.export votes --format csv --out votes.csv --resume   # continue after an interruption
+
+Rows are written one chunk at a time. With --resume, the position of the last
+written row is kept in `<out>.cursor` and a rerun appends from there, over the
+same block range as the first run. Parquet needs the optional `pyarrow` package
+and cannot be resumed (a Parquet file cannot be appended to).
+"""
+import argparse
+import json
+import os
+import sys
+from blockchain import export
+from blockchain.chain_state import chain_state
+from blockchain.vote_indexer import vote_indexer, VOTE_STORE_PATH
+from utils.export_formats import FORMATS, ParquetFileWriter, encoder
+
+FIELDS = {"proposals": export.PROPOSAL_FIELDS, "votes": export.VOTE_FIELDS, "treasury": export.TREASURY_FIELDS}
+
+
+def _load_cursor(path: str) -> dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _save_cursor(path: str, cursor: dict):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(cursor, f)
+    os.replace(tmp, path)
+
+
+def _chunks(args, cursor: dict):
+    """Chunk iterator for the requested kind, resuming from `cursor`; fills in the resolved range."""
+    if args.kind == "proposals":
+        # Serve from the chain snapshot when one exists, else read from the node
+        table = next_id = None
+        if chain_state.load()[0] is not None:
+            table, next_id = chain_state.proposals, chain_state.next_proposal_id
+        return export.iter_proposals(args.chunk_size, cursor.get("after"), table, next_id)
+
+    source = "logs"
+    if args.kind == "votes":
+        if os.path.exists(VOTE_STORE_PATH):
+            vote_indexer.open()
+        elif args.source == "local":
+            sys.exit(f"No local vote index at {VOTE_STORE_PATH}")
+        covered = export.vote_source(cursor.get("from_block", args.from_block),
+                                     cursor.get("to_block", args.to_block))
+        if args.source == "local" and covered != "local":
+            sys.exit("The local vote index does not cover this range yet")
+        source = args.source if args.source != "auto" else covered
+    from_block, to_block = export.resolve_range(cursor.get("from_block", args.from_block),
+                                                cursor.get("to_block", args.to_block), source)
+    cursor.update(from_block=from_block, to_block=to_block)
+    if args.kind == "votes":
+        return export.iter_votes(from_block, to_block, args.chunk_size, cursor.get("after"), source)
+    return export.iter_treasury_events(from_block, to_block, cursor.get("after"))
+
+
+def _position(kind: str, rows: list):
+    last = rows[-1]
+    return last["proposal_id"] if kind == "proposals" else [last["block"], last["log_index"]]
+
+
+def run(args) -> int:
+    if args.resume and not args.out:
+        sys.exit("--resume needs --out")
+    if args.format == "parquet" and (args.resume or not args.out):
+        sys.exit("Parquet export needs --out and cannot be resumed")
+
+    cursor_path = f"{args.out}.cursor" if args.out else None
+    cursor = _load_cursor(cursor_path) if args.resume else {}
+    chunks = _chunks(args, cursor)
+    fields = FIELDS[args.kind]
+    resuming = cursor.get("after") is not None
+
+    if args.format == "parquet":
+        writer = ParquetFileWriter(args.out, fields)
+        write, close = writer.write, writer.close
+    else:
+        enc = encoder(args.format, fields)
+        out = open(args.out, "ab" if resuming else "wb") if args.out else sys.stdout.buffer
+        if not resuming:
+            out.write(enc.header())
+
+        def write(rows):
+            out.write(enc.chunk(rows))
+            out.flush()
+
+        def close():
+            if out is not sys.stdout.buffer:
+                out.close()
+
+    total = 0
+    try:
+        for rows in chunks:
+            if not rows:
+                continue
+            write(rows)
+            total += len(rows)
+            if args.resume:
+                cursor["after"] = _position(args.kind, rows)
+                _save_cursor(cursor_path, cursor)
+    finally:
+        close()
+    print(f"Exported {total} {args.kind} rows", file=sys.stderr)
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("kind", choices=sorted(FIELDS))
+    parser.add_argument("--format", choices=FORMATS, default="ndjson")
+    parser.add_argument("--out", help="output file (default: stdout)")
+    parser.add_argument("--from-block", type=int, default=None)
+    parser.add_argument("--to-block", type=int, default=None)
+    parser.add_argument("--source", choices=("auto", "local", "logs"), default="auto",
+                        help="votes: local vote index or eth_getLogs (auto picks local when it covers the range)")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--resume", action="store_true", help="continue from <out>.cursor and append")
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# backend/utils/admission.py
+"""
+Admission control for expensive endpoints.
+
+Each `AdmissionController` runs at most `concurrency` requests at once and keeps
+a bounded queue of waiters, served shortest-input first. Requests that find the
+queue full, or wait longer than `queue_timeout`, are rejected straight away with
+503 and a Retry-After estimate instead of piling up behind the model.
+"""
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from contextlib import asynccontextmanager
+from fastapi import HTTPException
+from utils.metrics import REGISTRY
+
+ADMISSION_IN_FLIGHT = REGISTRY.gauge(
+    "echodao_admission_in_flight", "Requests holding an admission slot", labels=("endpoint",))
+ADMISSION_QUEUE_DEPTH = REGISTRY.gauge(
+    "echodao_admission_queue_depth", "Requests waiting for an admission slot", labels=("endpoint",))
+ADMISSION_REJECTED = REGISTRY.counter(
+    "echodao_admission_rejected_total", "Requests shed by admission control", labels=("endpoint", "reason"))
+ADMISSION_QUEUE_WAIT = REGISTRY.histogram(
+    "echodao_admission_queue_wait_seconds", "Time spent waiting for an admission slot", labels=("endpoint",))
+
+
+class AdmissionController:
+    """Bounded priority queue in front of `concurrency` slots; lower priority values go first."""
+
+    def __init__(self, name: str, concurrency: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._active = 0
+        self._waiters = []  # heap of (priority, seq, future)
+        self._seq = itertools.count()
+        self._service_time = 1.0  # EWMA of seconds a slot is held, for Retry-After
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """Seconds until the current backlog should have drained."""
+        backlog = self.queued + self._active
+        return max(1, math.ceil(backlog * self._service_time / self.concurrency))
+
+    def _reject(self, reason: str, detail: str):
+        ADMISSION_REJECTED.inc(endpoint=self.name, reason=reason)
+        raise HTTPException(status_code=503, detail=detail, headers={"Retry-After": str(self.retry_after())})
+
+    def _release(self):
+        self._active -= 1
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            # A waiter that timed out or was cancelled stays queued until its task resumes
+            if future.done():
+                continue
+            self._active += 1
+            future.set_result(None)
+            break
+        self._update_gauges()
+
+    def _forget(self, future):
+        self._waiters = [w for w in self._waiters if w[2] is not future]
+        heapq.heapify(self._waiters)
+        self._update_gauges()
+
+    def _update_gauges(self):
+        ADMISSION_IN_FLIGHT.set(self._active, endpoint=self.name)
+        ADMISSION_QUEUE_DEPTH.set(self.queued, endpoint=self.name)
+
+    async def _acquire(self, priority: float):
+        if self._active < self.concurrency and not self.queued:
+            self._active += 1
+            self._update_gauges()
+            return
+        if self.queued >= self.max_queue:
+            self._reject("queue_full", f"{self.name} is at capacity, retry later")
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        self._update_gauges()
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(future, timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            # The slot may have been granted just as the deadline fired; hand it on
+            if future.done() and not future.cancelled():
+                self._release()
+            else:
+                self._forget(future)
+            self._reject("deadline", f"{self.name} queue wait exceeded {self.queue_timeout:g}s, retry later")
+        except asyncio.CancelledError:
+            # Client went away; hand the slot on if it had already been granted
+            if future.done() and not future.cancelled():
+                self._release()
+            else:
+                self._forget(future)
+            raise
+        finally:
+            ADMISSION_QUEUE_WAIT.observe(time.perf_counter() - start, endpoint=self.name)
+
+    @asynccontextmanager
+    async def slot(self, priority: float = 0):
+        """Hold one slot for the duration of the block; raises HTTPException(503) when shedding."""
+        await self._acquire(priority)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._service_time = 0.8 * self._service_time + 0.2 * (time.perf_counter() - start)
+            self._release()
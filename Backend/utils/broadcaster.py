@@ -0,0 +1,104 @@
+# backend/utils/broadcaster.py
+"""
+Fan-out of server-push events to many clients from a single producer.
+Each message is serialized once and shared by every subscriber queue.
+"""
+import asyncio
+import json
+import threading
+
+
+class Subscriber:
+    """A connected client: a bounded queue plus drop accounting."""
+
+    __slots__ = ("queue", "events", "dropped", "consecutive_drops", "closed")
+
+    def __init__(self, buffer_size: int, events=None):
+        self.queue = asyncio.Queue(maxsize=buffer_size)
+        self.events = set(events) if events else None
+        self.dropped = 0
+        self.consecutive_drops = 0
+        self.closed = False
+
+
+class EventBroadcaster:
+    """
+    Publishes messages to every subscriber's bounded queue.
+
+    When a client's buffer is full the oldest message is dropped so fast clients
+    are never held back by slow ones; a client that keeps overflowing for
+    `max_consecutive_drops` messages is disconnected and must resubscribe.
+    """
+
+    def __init__(self, buffer_size: int = 256, max_subscribers: int = 1000, max_consecutive_drops: int = 256):
+        self.buffer_size = buffer_size
+        self.max_subscribers = max_subscribers
+        self.max_consecutive_drops = max_consecutive_drops
+        self.published = 0
+        self._subscribers = set()
+        self._loop = None
+        self._seq = 0
+        self._seq_lock = threading.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def bind(self, loop):
+        """Attach the event loop that owns the subscriber queues."""
+        self._loop = loop
+
+    def subscribe(self, events=None):
+        """Register a client. Returns None when the subscriber limit is reached."""
+        if len(self._subscribers) >= self.max_subscribers:
+            return None
+        sub = Subscriber(self.buffer_size, events)
+        self._subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        sub.closed = True
+        self._subscribers.discard(sub)
+
+    def publish_threadsafe(self, event: str, data: dict):
+        """Publish from any thread (e.g. the chain watcher). Dropped if no loop is bound."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        with self._seq_lock:
+            self._seq += 1
+            seq = self._seq
+        message = (event, f"id: {seq}\nevent: {event}\ndata: {json.dumps(data, default=str)}\n\n")
+        loop.call_soon_threadsafe(self._dispatch, message)
+
+    def _dispatch(self, message):
+        event = message[0]
+        self.published += 1
+        for sub in list(self._subscribers):
+            if sub.events is not None and event not in sub.events:
+                continue
+            if sub.queue.full():
+                # Drop the oldest buffered message for this client only
+                sub.queue.get_nowait()
+                sub.dropped += 1
+                sub.consecutive_drops += 1
+                if sub.consecutive_drops >= self.max_consecutive_drops:
+                    self.unsubscribe(sub)
+                    continue
+            else:
+                sub.consecutive_drops = 0
+            sub.queue.put_nowait(message)
+
+    async def stream(self, sub, heartbeat: float = 15.0):
+        """Yield SSE frames for `sub` until it is closed, with periodic keep-alive comments."""
+        try:
+            while not sub.closed:
+                try:
+                    _, frame = await asyncio.wait_for(sub.queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield frame
+            yield "event: overflow\ndata: {\"reason\": \"client too slow, resubscribe\"}\n\n"
+        finally:
+            self.unsubscribe(sub)
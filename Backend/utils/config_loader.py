@@ -1,5 +1,200 @@
 # backend/utils/config_loader.py
+"""
+Application settings, read and validated once per process.
+
+Values come from `.env` in the working directory, overridden by variables of
+the same (upper-case) name in the process environment. `get_settings()` parses
+them into a frozen, typed `Settings` object on first use and returns the same
+object afterwards, so reading configuration costs no I/O per request. Missing
+or malformed keys raise `ConfigError` listing every problem at once.
+"""
+import os
+import threading
+from typing import Literal, Optional
 from dotenv import dotenv_values
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, ValidationInfo, field_validator
+from utils.validator import is_valid_eth_address
+
+
+class ConfigError(RuntimeError):
+    pass
+
+
+MIN_AUTHKEY_LENGTH = 16
+
+
+class Settings(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    # Chain
+    celo_rpc: str
+    private_key: str
+    dao_contract: str
+    treasury_contract_address: str
+    block_time_seconds: float = 5.0
+
+    # IPFS
+    pinata_api_key: str
+    pinata_secret: str
+    pinata_api_url: str = "https://api.pinata.cloud"
+    ipfs_gateway_url: str = "https://gateway.pinata.cloud"
+
+    # Local state (stores and snapshots below); relative file names are resolved under DATA_DIR
+    data_dir: str = "data"
+
+    # Chain watcher and vote index. Indexing starts at VOTES_START_BLOCK (the DAO
+    # contract's deployment block), which is required while the watcher is enabled
+    watcher_enabled: bool = True
+    watcher_poll_interval: float = 2.0
+    watcher_max_block_range: int = 1000
+    vote_store_path: str = "votes.db"
+    votes_start_block: Optional[int] = Field(None, validate_default=True)
+    votes_log_chunk: int = 5000
+    # Chain state snapshot (blockchain/chain_state.py)
+    chain_snapshot_path: str = "chain_state.snap"
+    chain_snapshot_interval: float = 60.0
+    chain_reorg_depth: int = 12
+    # Governance / treasury aggregates (blockchain/stats.py)
+    stats_store_path: str = "stats.db"
+    stats_bucket_blocks: int = 17280  # ~1 day of 5 s blocks
+
+    # Transaction fees (blockchain/fees.py)
+    fee_speed: Literal["slow", "standard", "fast"] = "standard"
+    fee_history_blocks: int = 20
+    fee_bump_after: float = 30.0  # seconds pending before a transaction is replaced with higher fees
+    fee_max_bumps: int = 3
+
+    # Idempotency-Key store for the write endpoints
+    idempotency_store_path: str = "idempotency.db"
+    idempotency_max_entries: int = 10000
+    idempotency_ttl: float = 86400.0
+
+    # Opt-in request profiling (utils/profiling.py); off unless a token or sample rate is set
+    profiling_token: str = ""
+    profiling_sample_rate: float = 0.0
+    profiling_buffer: int = 50
+    profiling_interval: float = 0.005
+
+    # Live feed
+    feed_client_buffer: int = 256
+    feed_max_clients: int = 1000
+
+    # Admission control for the AI report endpoints
+    report_submit_concurrency: int = 2
+    report_submit_queue: int = 16
+    report_verify_concurrency: int = 2
+    report_verify_queue: int = 32
+    # MinHash signatures of uploaded reports, computed before the submit slot is taken
+    report_similarity_concurrency: int = 2
+    report_similarity_queue: int = 64
+    admission_queue_timeout: float = 30.0
+
+    # Audit store of processed reports
+    report_store_path: str = "reports.db"
+    report_store_queue: int = 10000
+
+    # Near-duplicate detection (ai/similarity.py)
+    similarity_index_capacity: int = 100_000
+    proposal_duplicate_threshold: float = 0.8
+    report_duplicate_threshold: float = 0.9
+
+    # Report text extraction
+    extract_workers: int = 2
+    extract_max_pending: int = 16
+    extract_pages_per_task: int = 8
+    extract_max_chars: int = 100_000
+    ocr_lang: str = "eng"
+
+    # Summarizer inference backend (see ai/summarizer.py)
+    summarizer_backend: Literal["pipeline", "quantized", "onnx", "distilled"] = "pipeline"
+    summarizer_model: str = ""
+    summarizer_threads: int = 0
+    summarizer_onnx_dir: str = "models/onnx"
+    # Model server (ai/model_server.py); SUMMARIZER_SERVER empty = summarize in-process.
+    # The connection unpickles every message, so the server needs a real shared secret
+    model_server_authkey: str = ""
+    summarizer_server: str = ""
+    model_server_workers: int = 0
+    model_server_threads: int = 1
+    model_server_pin: bool = True
+    model_server_timeout: float = 300.0
+
+    # Logging and serialization
+    log_level: str = "INFO"
+    log_format: str = "text"
+    log_queue_size: int = 10000
+    fast_json: bool = False
+
+    @field_validator("dao_contract", "treasury_contract_address")
+    @classmethod
+    def _check_address(cls, value: str) -> str:
+        if not is_valid_eth_address(value):
+            raise ValueError("expected a 0x-prefixed 20-byte address")
+        return value
+
+    @field_validator("votes_start_block")
+    @classmethod
+    def _check_start_block(cls, value: Optional[int], info: ValidationInfo) -> Optional[int]:
+        if value is None and info.data.get("watcher_enabled", True):
+            raise ValueError("required while the chain watcher is enabled: the DAO contract's deployment block")
+        if value is not None and value < 0:
+            raise ValueError("must be a block number")
+        return value
+
+    @field_validator("summarizer_server")
+    @classmethod
+    def _check_model_server(cls, value: str, info: ValidationInfo) -> str:
+        if value and len(info.data.get("model_server_authkey", "")) < MIN_AUTHKEY_LENGTH:
+            raise ValueError(f"needs a secret MODEL_SERVER_AUTHKEY of at least {MIN_AUTHKEY_LENGTH} characters")
+        return value
+
+    @field_validator("profiling_sample_rate")
+    @classmethod
+    def _check_sampling(cls, value: float, info: ValidationInfo) -> float:
+        # Sampled profiles are only readable through the token-protected admin routes
+        if value and not info.data.get("profiling_token"):
+            raise ValueError("sampling needs PROFILING_TOKEN to be set")
+        return value
+
+    def data_path(self, name: str) -> str:
+        """Path of a local state file: `name` under DATA_DIR, unless it is absolute."""
+        return os.path.join(self.data_dir, name)
+
+
+_settings = None
+_raw = None
+_lock = threading.Lock()
+
+
+def load_env() -> dict:
+    """
+    Raw key -> value mapping (`.env` overridden by the environment), read once.
+    Empty values are treated as unset. Prefer `get_settings()` in application code.
+    """
+    global _raw
+    if _raw is None:
+        with _lock:
+            if _raw is None:
+                values = {k: v for k, v in dotenv_values(".env").items() if v}
+                for name in Settings.model_fields:
+                    if os.environ.get(name.upper()):
+                        values[name.upper()] = os.environ[name.upper()]
+                _raw = values
+    return _raw
+
 
-def load_env():
-    return dotenv_values(".env")
\ No newline at end of file
+def get_settings() -> Settings:
+    """The process-wide Settings; raises ConfigError on the first call if configuration is invalid."""
+    global _settings
+    if _settings is None:
+        raw = load_env()
+        with _lock:
+            if _settings is None:
+                values = {name: raw[name.upper()] for name in Settings.model_fields if name.upper() in raw}
+                try:
+                    _settings = Settings(**values)
+                except ValidationError as e:
+                    problems = "; ".join(
+                        f"{'.'.join(str(part) for part in err['loc']).upper()}: {err['msg']}" for err in e.errors())
+                    raise ConfigError(f"Invalid configuration: {problems}") from None
+    return _settings
@@ -0,0 +1,102 @@
+# backend/utils/export_formats.py
+"""
+Chunk encoders for bulk exports: each call turns one chunk of row dicts into
+bytes, so exports stream with memory bounded by the chunk size.
+
+NDJSON and CSV are always available; Parquet needs the optional `pyarrow`
+package and is written to a file, one row group per chunk.
+"""
+import csv
+import io
+from fastapi.responses import StreamingResponse
+from utils.profiling import run_in_threadpool
+from utils.serialization import dumps
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # optional dependency
+    pyarrow = None
+
+FORMATS = ("ndjson", "csv", "parquet")
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+class NDJSONEncoder:
+    def header(self) -> bytes:
+        return b""
+
+    def chunk(self, rows) -> bytes:
+        return b"".join(dumps(r) + b"\n" for r in rows)
+
+
+class CSVEncoder:
+    def __init__(self, fields):
+        self._buf = io.StringIO()
+        self._writer = csv.DictWriter(self._buf, fieldnames=list(fields), extrasaction="ignore")
+
+    def _take(self) -> bytes:
+        data = self._buf.getvalue().encode()
+        self._buf.seek(0)
+        self._buf.truncate()
+        return data
+
+    def header(self) -> bytes:
+        self._writer.writeheader()
+        return self._take()
+
+    def chunk(self, rows) -> bytes:
+        self._writer.writerows(rows)
+        return self._take()
+
+
+def encoder(fmt: str, fields):
+    """NDJSON or CSV chunk encoder for streaming responses."""
+    if fmt == "csv":
+        return CSVEncoder(fields)
+    if fmt == "ndjson":
+        return NDJSONEncoder()
+    raise ValueError(f"Unsupported streaming format '{fmt}'")
+
+
+def streaming_response(chunks, fmt: str, fields, headers=None) -> StreamingResponse:
+    """
+    Stream an iterator of row chunks as NDJSON or CSV. Each chunk is pulled on the
+    threadpool (iterators may do blocking I/O) and written before the next is read.
+    """
+    enc = encoder(fmt, fields)
+
+    async def body():
+        header = enc.header()
+        if header:
+            yield header
+        while True:
+            rows = await run_in_threadpool(next, chunks, None)
+            if rows is None:
+                return
+            yield enc.chunk(rows)
+
+    return StreamingResponse(body(), media_type=MEDIA_TYPES[fmt], headers=headers)
+
+
+class ParquetFileWriter:
+    """Append chunks of rows to a Parquet file as row groups."""
+
+    def __init__(self, path: str, fields):
+        if pyarrow is None:
+            raise RuntimeError("Parquet export needs the optional 'pyarrow' package")
+        self.path = path
+        self.fields = list(fields)
+        self._writer = None
+
+    def write(self, rows):
+        if not rows:
+            return
+        table = pyarrow.Table.from_pylist([{f: r.get(f) for f in self.fields} for r in rows])
+        if self._writer is None:
+            self._writer = pyarrow.parquet.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
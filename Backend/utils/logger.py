@@ -0,0 +1,154 @@
+# backend/utils/logger.py
+"""
+Structured, non-blocking logging for the backend.
+
+Application code calls `get_logger(__name__)` and logs with %-style arguments,
+so a disabled level costs one `isEnabledFor` check and no string formatting.
+Records are handed to a bounded queue; a single listener thread formats them
+(JSON or text) and writes them to stderr, so request threads never block on
+the console. Records carrying a `sample_key` extra are rate-limited per key.
+
+Settings: LOG_LEVEL (default INFO), LOG_FORMAT (json|text, default text),
+LOG_QUEUE_SIZE (default 10000).
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from utils.config_loader import get_settings
+
+ROOT_LOGGER = "echodao"
+
+# LogRecord attributes that are not user-supplied structured fields
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "sample_key"}
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, msg, structured extras and exc."""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s: %(message)s")
+
+    def format(self, record):
+        line = super().format(record)
+        extras = {k: v for k, v in record.__dict__.items() if k not in _RESERVED and not k.startswith("_")}
+        if extras:
+            line += " " + " ".join(f"{k}={v}" for k, v in extras.items())
+        return line
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Lets through at most `burst` records per `sample_key` every `interval` seconds.
+    The next record that passes reports how many were suppressed in between.
+    """
+
+    def __init__(self, burst: int = 5, interval: float = 60.0):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self._windows = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        key = getattr(record, "sample_key", None)
+        if key is None:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            start, count, suppressed = self._windows.get(key, (now, 0, 0))
+            if now - start >= self.interval:
+                start, count = now, 0
+            if count >= self.burst:
+                self._windows[key] = (start, count, suppressed + 1)
+                return False
+            self._windows[key] = (start, count + 1, 0)
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that never blocks the caller: when the queue is full the record
+    is dropped and counted. Message formatting is deferred to the listener thread;
+    only exception tracebacks are rendered eagerly (they reference live frames).
+    """
+
+    def __init__(self, q):
+        super().__init__(q)
+        self.dropped = 0
+
+    def prepare(self, record):
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener = None
+_setup_lock = threading.Lock()
+
+
+def setup_logging(level: str = None, fmt: str = None, queue_size: int = None):
+    """Install the queue handler on the `echodao` logger (idempotent)."""
+    global _listener
+    with _setup_lock:
+        if _listener is None:
+            _listener = _install(level, fmt, queue_size)
+
+
+def _install(level, fmt, queue_size):
+    settings = get_settings()
+    level = (level or settings.log_level).upper()
+    fmt = (fmt or settings.log_format).lower()
+    queue_size = queue_size or settings.log_queue_size
+
+    stream = logging.StreamHandler(sys.stderr)
+    stream.setFormatter(JSONFormatter() if fmt == "json" else TextFormatter())
+
+    log_queue = queue.Queue(maxsize=queue_size)
+    handler = NonBlockingQueueHandler(log_queue)
+    handler.addFilter(SamplingFilter())
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(level)
+    root.addHandler(handler)
+    root.propagate = False
+
+    listener = logging.handlers.QueueListener(log_queue, stream, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger under the `echodao` namespace, e.g. `echodao.blockchain.celo_interact`."""
+    setup_logging()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
@@ -0,0 +1,213 @@
+# backend/utils/metrics.py
+"""
+Minimal in-process metrics (counters, gauges, histograms) rendered in the
+Prometheus text exposition format. Recording is a dict lookup plus a bisect
+under a lock, so it is cheap enough for every request and every RPC call.
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from utils.profiling import span
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _format_labels(names, values, extra=None) -> str:
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labels=()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict):
+        return tuple(labels.get(n, "") for n in self.label_names)
+
+    def render(self) -> list:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"] + self._samples()
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name, help_text, labels=()):
+        super().__init__(name, help_text, labels)
+        self._values = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, k)} {v}" for k, v in items]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labels=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}  # key -> [bucket counts..., sum, count]
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * (len(self.buckets) + 2)
+            if idx < len(self.buckets):
+                state[idx] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _samples(self):
+        with self._lock:
+            items = [(k, list(v)) for k, v in self._values.items()]
+        lines = []
+        for key, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, key, ('le', repr(float(bound))))} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.label_names, key, ('le', '+Inf'))} {state[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, key)} {state[-2]}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, key)} {state[-1]}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name, help_text, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, **kwargs)
+            return metric
+
+    def counter(self, name, help_text, labels=()):
+        return self._register(Counter, name, help_text, labels=labels)
+
+    def gauge(self, name, help_text, labels=()):
+        return self._register(Gauge, name, help_text, labels=labels)
+
+    def histogram(self, name, help_text, labels=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram, name, help_text, labels=labels, buckets=buckets)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "echodao_http_request_duration_seconds", "HTTP request latency by route", labels=("method", "route", "status"))
+RPC_CALLS = REGISTRY.counter(
+    "echodao_rpc_calls_total", "JSON-RPC calls made to the Celo node", labels=("method",))
+RPC_ERRORS = REGISTRY.counter(
+    "echodao_rpc_errors_total", "JSON-RPC calls that raised or returned an error", labels=("method",))
+RPC_DURATION = REGISTRY.histogram(
+    "echodao_rpc_duration_seconds", "JSON-RPC call latency", labels=("method",))
+STAGE_DURATION = REGISTRY.histogram(
+    "echodao_stage_duration_seconds", "Time spent in pipeline stages (summarizer, IPFS, ...)", labels=("stage",))
+EXTRACT_PAGES = REGISTRY.counter(
+    "echodao_extract_pages_total", "Document pages processed by text extraction", labels=("method",))
+EXTRACT_BYTES = REGISTRY.counter(
+    "echodao_extract_bytes_total", "Input bytes handed to text extraction", labels=("kind",))
+EXTRACT_INFLIGHT = REGISTRY.gauge(
+    "echodao_extract_tasks_in_flight", "Extraction tasks queued or running in the process pool")
+
+
+def route_template(scope) -> str:
+    """
+    Route template for a handled request, e.g. `/proposals/{proposal_id}`, rebuilt from the
+    path and its matched path params so it includes router prefixes on any FastAPI version.
+    """
+    if scope.get("route") is None and scope.get("endpoint") is None:
+        return "unmatched"
+    params = {str(v): k for k, v in (scope.get("path_params") or {}).items()}
+    if not params:
+        return scope["path"]
+    return "/".join("{" + params[seg] + "}" if seg in params else seg for seg in scope["path"].split("/"))
+
+
+@contextmanager
+def stage_timer(stage: str):
+    """Context manager recording the duration of a pipeline stage (and a span when profiling)."""
+    with STAGE_DURATION.time(stage=stage), span("stage", stage):
+        yield
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording latency per route template (e.g. `/proposals/{proposal_id}`),
+    so label cardinality stays bounded regardless of the ids requested.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start, method=scope["method"], route=route_template(scope), status=status["code"])
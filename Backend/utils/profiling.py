@@ -0,0 +1,323 @@
+# backend/utils/profiling.py
+"""
+Opt-in per-request profiling.
+
+A request is profiled when it carries `X-Profile-Token: <PROFILING_TOKEN>` or is
+picked by PROFILING_SAMPLE_RATE. While it runs, `span(kind, name)` blocks (RPC
+calls, IPFS calls, model inference, pipeline stages) build a tree of timed
+spans, and a sampler thread records the stacks of the threads working on it
+every PROFILING_INTERVAL seconds: worker threads while they run the request's
+`bind()`-wrapped calls (`run_in_threadpool` here) or hold one of its spans. The
+event loop thread is never sampled, since it interleaves every request's
+coroutines. Finished profiles go to a bounded ring buffer served by the admin
+routes.
+
+Outside a profiled request `span()` is a context-variable lookup, so the
+hooks stay in place in production at no measurable cost.
+"""
+import asyncio
+import contextvars
+import functools
+import hmac
+import itertools
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from starlette import concurrency
+from utils.config_loader import get_settings
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+settings = get_settings()
+PROFILE_HEADER = b"x-profile-token"
+MAX_STACK_DEPTH = 64
+MAX_SPANS = 10000  # per profile; further spans are timed but only counted
+
+_current = contextvars.ContextVar("profile_span", default=None)
+_ids = itertools.count(1)
+
+
+class Span:
+    __slots__ = ("profile", "kind", "name", "start", "end", "thread", "children")
+
+    def __init__(self, profile, kind: str, name: str):
+        self.profile = profile
+        self.kind = kind
+        self.name = name
+        self.start = time.perf_counter()
+        self.end = None
+        # None on the event loop: its stacks belong to whichever request runs at the moment
+        self.thread = None if asyncio._get_running_loop() is not None else threading.get_ident()
+        self.children = []
+
+    def to_api(self, origin: float) -> dict:
+        end = self.end if self.end is not None else time.perf_counter()
+        return {
+            "kind": self.kind,
+            "name": self.name,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "duration_ms": round((end - self.start) * 1000, 3),
+            "children": [c.to_api(origin) for c in self.children],
+        }
+
+
+class Profile:
+    """Span tree and stack samples of one request; spans may be opened from worker threads."""
+
+    def __init__(self, method: str, path: str, trigger: str):
+        self.id = next(_ids)
+        self.method = method
+        self.path = path
+        self.trigger = trigger
+        self.started_at = time.time()
+        self.root = Span(self, "request", f"{method} {path}")
+        self.status = None
+        self.samples = Counter()
+        self.spans = 0
+        self.dropped_spans = 0
+        self._threads = Counter()  # thread id -> open spans and bound calls on it
+        self._lock = threading.Lock()
+
+    def enter(self, span: Span, parent: Span = None):
+        with self._lock:
+            if parent is not None:
+                if self.spans < MAX_SPANS:
+                    parent.children.append(span)
+                    self.spans += 1
+                else:
+                    self.dropped_spans += 1
+        if span.thread is not None:
+            self.attach(span.thread)
+
+    def exit(self, span: Span):
+        span.end = time.perf_counter()
+        if span.thread is not None:
+            self.detach(span.thread)
+
+    def attach(self, ident: int):
+        """Sample thread `ident` until the matching `detach`."""
+        with self._lock:
+            self._threads[ident] += 1
+
+    def detach(self, ident: int):
+        with self._lock:
+            self._threads[ident] -= 1
+            if not self._threads[ident]:
+                del self._threads[ident]
+
+    def sample(self, frames: dict):
+        with self._lock:
+            threads = list(self._threads)
+        for ident in threads:
+            frame = frames.get(ident)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                code = frame.f_code
+                stack.append(f"{code.co_filename}:{code.co_name}:{frame.f_lineno}")
+                frame = frame.f_back
+            key = ";".join(reversed(stack))
+            with self._lock:
+                self.samples[key] += 1
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "route": self.path,
+            "status": self.status,
+            "trigger": self.trigger,
+            "started_at": self.started_at,
+            "duration_ms": round(((self.root.end or time.perf_counter()) - self.root.start) * 1000, 3),
+            "samples": sum(self.samples.values()),
+            "spans": self.spans,
+            "dropped_spans": self.dropped_spans,
+        }
+
+    def to_api(self, top: int = 50) -> dict:
+        with self._lock:
+            stacks = self.samples.most_common(top)
+        return {
+            **self.summary(),
+            "span_tree": self.root.to_api(self.root.start),
+            "stacks": [{"stack": stack.split(";"), "samples": count} for stack, count in stacks],
+        }
+
+    def collapsed(self) -> str:
+        """Samples in the collapsed-stack format read by flamegraph tools."""
+        with self._lock:
+            return "".join(f"{stack} {count}\n" for stack, count in self.samples.items())
+
+
+class _NoSpan:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _SpanContext:
+    __slots__ = ("parent", "span", "token")
+
+    def __init__(self, parent: Span, kind: str, name: str):
+        self.parent = parent
+        self.span = Span(parent.profile, kind, name)
+
+    def __enter__(self):
+        self.parent.profile.enter(self.span, self.parent)
+        self.token = _current.set(self.span)
+        return self.span
+
+    def __exit__(self, *exc):
+        _current.reset(self.token)
+        self.span.profile.exit(self.span)
+        return False
+
+
+def span(kind: str, name: str):
+    """Time a block as a child of the current span when the request is being profiled."""
+    parent = _current.get()
+    if parent is None:
+        return _NO_SPAN
+    return _SpanContext(parent, kind, name)
+
+
+def bind(fn):
+    """
+    `fn` set up to run in a copy of the current context, so spans it opens on an
+    executor thread attach to the profiled request and the thread is sampled
+    while it runs. Call once per submission.
+    """
+    parent = _current.get()
+    if parent is None:
+        return fn
+    profile = parent.profile
+
+    def sampled(*args, **kwargs):
+        ident = threading.get_ident()
+        profile.attach(ident)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profile.detach(ident)
+
+    return functools.partial(contextvars.copy_context().run, sampled)
+
+
+async def run_in_threadpool(fn, *args, **kwargs):
+    """Starlette's `run_in_threadpool` with the worker thread sampled for a profiled request."""
+    return await concurrency.run_in_threadpool(bind(fn), *args, **kwargs)
+
+
+class Profiler:
+    """Ring buffer of the last `capacity` profiles plus the sampler thread for active ones."""
+
+    def __init__(self, capacity: int, interval: float):
+        self.interval = interval
+        self._profiles = deque(maxlen=capacity)
+        self._active = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self, profile: Profile):
+        with self._lock:
+            self._active.add(profile)
+            self._wake.set()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._sample_loop, name="profiler", daemon=True)
+                self._thread.start()
+
+    def finish(self, profile: Profile):
+        with self._lock:
+            self._active.discard(profile)
+            self._profiles.append(profile)
+
+    def _sample_loop(self):
+        while True:
+            self._wake.wait()
+            with self._lock:
+                active = list(self._active)
+                if not active:
+                    self._wake.clear()
+                    continue
+            frames = sys._current_frames()
+            for profile in active:
+                profile.sample(frames)
+            del frames
+            time.sleep(self.interval)
+
+    def profiles(self) -> list:
+        """Summaries of the buffered profiles, newest first."""
+        with self._lock:
+            profiles = list(self._profiles)
+        return [p.summary() for p in reversed(profiles)]
+
+    def get(self, profile_id: int):
+        with self._lock:
+            return next((p for p in self._profiles if p.id == profile_id), None)
+
+
+profiler = Profiler(settings.profiling_buffer, settings.profiling_interval)
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware starting a profile for requests that ask for one with
+    the profiling token, or are sampled. Does nothing unless PROFILING_TOKEN is
+    set: sampled profiles are only readable with it. The profile id is returned
+    in `X-Profile-Id`.
+    """
+
+    def __init__(self, app, token: str = settings.profiling_token, sample_rate: float = settings.profiling_sample_rate):
+        self.app = app
+        self.token = token.encode() if token else None
+        self.sample_rate = sample_rate if token else 0.0
+
+    def _trigger(self, scope):
+        if self.token is not None:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER and hmac.compare_digest(value, self.token):
+                    return "header"
+        if self.sample_rate and random.random() < self.sample_rate:
+            return "sampled"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.token is None:
+            await self.app(scope, receive, send)
+            return
+        trigger = self._trigger(scope)
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile = Profile(scope["method"], scope["path"], trigger)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", str(profile.id).encode())]
+            await send(message)
+
+        profile.enter(profile.root)
+        token = _current.set(profile.root)
+        profiler.start(profile)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            profile.exit(profile.root)
+            from utils.metrics import route_template  # metrics imports span() from here
+            profile.path = route_template(scope)
+            profiler.finish(profile)
+            log.info("Profiled %s %s in %.1f ms", profile.method, profile.path,
+                     (profile.root.end - profile.root.start) * 1000, extra={"profile_id": profile.id})
@@ -0,0 +1,103 @@
+# backend/utils/response_cache.py
+"""
+Serialized-response cache for read endpoints.
+
+Entries are keyed on the request key plus the latest block the chain watcher
+has indexed, so they are reused until the chain moves. Every response carries
+a strong ETag, and `If-None-Match` hits are answered with 304 Not Modified.
+Concurrent misses for the same key and block share a single build.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from utils.serialization import dumps
+from utils.singleflight import AsyncSingleFlight
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+class ResponseCache:
+    """
+    LRU of (block, body, etag) per key. `block_source()` returns the latest indexed
+    block and the time it was seen (or (None, None) when nothing is indexed).
+    Without an indexed block nothing is stored, but ETags and 304s still apply.
+    """
+
+    def __init__(self, block_source, block_time: float = 5.0, max_entries: int = 2048):
+        self.block_source = block_source
+        self.block_time = block_time
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._builds = AsyncSingleFlight("response_cache")
+
+    def _lookup(self, key, block):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == block:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            return None
+
+    def _store(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def cache_control(self, block, seen_at) -> str:
+        """Fresh until the next block is expected; revalidate (ETag) otherwise."""
+        if block is None:
+            return "no-cache"
+        remaining = self.block_time - (time.time() - seen_at)
+        return f"public, max-age={max(1, int(remaining))}"
+
+    async def _build(self, key, block, build, model):
+        data = await build()
+        if isinstance(data, bytes):
+            body = data
+        elif model is not None:
+            body = model.model_validate(data).model_dump_json().encode()
+        else:
+            body = dumps(jsonable_encoder(data))
+        entry = (block, body, make_etag(body))
+        if block is not None:
+            self._store(key, entry)
+        return entry
+
+    async def respond(self, request: Request, key, build, model=None) -> Response:
+        """
+        Return the cached JSON response for `key`, calling `await build()` on a miss.
+        `model` (a pydantic model) validates and serializes the built payload; a
+        builder may also return already-serialized JSON bytes, which are used as is.
+        """
+        block, seen_at = self.block_source()
+        entry = self._lookup(key, block) if block is not None else None
+        if entry is None:
+            entry = await self._builds.do((key, block), lambda: self._build(key, block, build, model))
+
+        _, body, etag = entry
+        headers = {"ETag": etag, "Cache-Control": self.cache_control(block, seen_at)}
+        if block is not None:
+            headers["X-Indexed-Block"] = str(block)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
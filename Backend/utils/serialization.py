@@ -0,0 +1,42 @@
+# backend/utils/serialization.py
+"""
+JSON encoding for hot response paths.
+
+`dumps` uses orjson when it is installed and falls back to a compact stdlib
+encoder otherwise, so callers always get UTF-8 bytes. Routes that opt in with
+FAST_JSON=true serialize pre-normalized payloads with it directly instead
+of validating every item through their pydantic response model.
+"""
+import json
+from decimal import Decimal
+from fastapi.responses import JSONResponse
+from utils.config_loader import get_settings
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+FAST_JSON = get_settings().fast_json
+
+
+def _default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.decode("utf-8", errors="replace")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj) -> bytes:
+    """Serialize `obj` to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default)
+    return json.dumps(obj, default=_default, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with `dumps` (orjson when available)."""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
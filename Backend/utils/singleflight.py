@@ -0,0 +1,87 @@
+# backend/utils/singleflight.py
+"""
+In-flight request coalescing ("singleflight").
+
+While a call for a key is running, further callers with the same key do not
+start their own; they wait for the running call and share its result or
+exception. `SingleFlight` is for blocking code running on threads,
+`AsyncSingleFlight` for coroutines on one event loop.
+"""
+import asyncio
+import threading
+from utils.metrics import REGISTRY
+
+SINGLEFLIGHT_CALLS = REGISTRY.counter(
+    "echodao_singleflight_calls_total", "Upstream calls started by a singleflight group", labels=("group",))
+SINGLEFLIGHT_COALESCED = REGISTRY.counter(
+    "echodao_singleflight_coalesced_total", "Callers that shared an in-flight call instead of starting one",
+    labels=("group",))
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+
+    def __init__(self, group: str):
+        self.group = group
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, *args):
+        """Return `fn(*args)`, sharing the call with concurrent callers using the same `key`."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            SINGLEFLIGHT_COALESCED.inc(group=self.group)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        SINGLEFLIGHT_CALLS.inc(group=self.group)
+        try:
+            call.result = fn(*args)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+
+    def __init__(self, group: str):
+        self.group = group
+        self._tasks = {}
+
+    async def do(self, key, fn):
+        """Return `await fn()`, sharing the call with concurrent callers using the same `key`."""
+        task = self._tasks.get(key)
+        if task is None:
+            SINGLEFLIGHT_CALLS.inc(group=self.group)
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda t: self._finished(key, t))
+        else:
+            SINGLEFLIGHT_COALESCED.inc(group=self.group)
+        # A cancelled caller must not cancel the call the others are waiting on
+        return await asyncio.shield(task)
+
+    def _finished(self, key, task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every caller went away